@@ -18,11 +18,18 @@ __all__ = [
     "ExaConnectionDsnError",
     "ExaConnectionFailedError",
     "ExaStatement",
+    "ExaRecord",
     "ExaFormatter",
     "ExaLogger",
     "ExaExtension",
     "ExaMetaData",
     "ExaHTTPTransportWrapper",
+    "ExaHttpTransportStats",
+    "ExaResultSpool",
+    "ExaResultCache",
+    "ExaCachedStatement",
+    "ExaScriptOutputIndexedFile",
+    "ExaScriptOutputLog",
     "ExaLocalConfig",
     "ExaTimeDelta",
     "PROTOCOL_V1",
@@ -33,6 +40,9 @@ __all__ = [
 from ._metadata import __version__
 from .connection import ExaConnection
 from .constant import (
+    DEFAULT_HTTP_COMPRESSION_LEVEL,
+    DEFAULT_HTTP_COMPRESSION_THREADS,
+    DEFAULT_HTTP_PROGRESS_INTERVAL,
     PROTOCOL_V1,
     PROTOCOL_V2,
     PROTOCOL_V3,
@@ -53,7 +63,10 @@ from .exceptions import (
 )
 from .ext import ExaExtension
 from .formatter import ExaFormatter
-from .http_transport import ExaHTTPTransportWrapper
+from .http_transport import (
+    ExaHttpTransportStats,
+    ExaHTTPTransportWrapper,
+)
 from .local_config import ExaLocalConfig
 from .logger import ExaLogger
 from .mapper import (
@@ -61,6 +74,16 @@ from .mapper import (
     exasol_mapper,
 )
 from .meta import ExaMetaData
+from .result_cache import (
+    ExaCachedStatement,
+    ExaResultCache,
+)
+from .row import ExaRecord
+from .script_output import (
+    ExaScriptOutputIndexedFile,
+    ExaScriptOutputLog,
+)
+from .spool import ExaResultSpool
 from .statement import ExaStatement
 
 
@@ -100,7 +123,15 @@ def connect_local_config(config_section, config_path=None, **kwargs) -> ExaConne
 
 
 def http_transport(
-    ipaddr, port, compression=False, encryption=True
+    ipaddr,
+    port,
+    compression=False,
+    encryption=True,
+    compression_level=DEFAULT_HTTP_COMPRESSION_LEVEL,
+    compression_threads=DEFAULT_HTTP_COMPRESSION_THREADS,
+    progress=None,
+    progress_interval=DEFAULT_HTTP_PROGRESS_INTERVAL,
+    max_bytes_per_sec=None,
 ) -> ExaHTTPTransportWrapper:
     """
     Constructor for HTTP Transport wrapper for parallel HTTP Transport (EXPORT or IMPORT)
@@ -114,6 +145,16 @@ def http_transport(
             Use zlib compression for HTTP transport, must be the same as `compression` of main connection
         encryption:
             Use SSL/TLS encryption for HTTP transport, must be the same as `encryption` of main connection
+        compression_level:
+            zlib compression level for IMPORT data
+        compression_threads:
+            Number of threads compressing IMPORT data into independent gzip members in parallel
+        progress:
+            Function called with number of uncompressed bytes, approximate number of rows and elapsed seconds
+        progress_interval:
+            Call ``progress`` every time this number of bytes was transferred and once after transfer is finished
+        max_bytes_per_sec:
+            Limit network throughput of HTTP transport
 
     Info:
         Compression and encryption arguments should match :func:`pyexasol.connect`
@@ -139,4 +180,14 @@ def http_transport(
         PyExasol does not provide a complete solution to manage child processes, only examples.
         The final solution depends on your hardware, network configuration, cloud provider and container orchestration software.
     """
-    return ExaHTTPTransportWrapper(ipaddr, port, compression, encryption)
+    return ExaHTTPTransportWrapper(
+        ipaddr,
+        port,
+        compression,
+        encryption,
+        compression_level=compression_level,
+        compression_threads=compression_threads,
+        progress=progress,
+        progress_interval=progress_interval,
+        max_bytes_per_sec=max_bytes_per_sec,
+    )
@@ -0,0 +1,152 @@
+"""
+Batched CSV serializer for :func:`pyexasol.callback.import_from_iterable`.
+
+The output is identical to :class:`csv.writer` with ``lineterminator="\\n"`` and
+``quoting=csv.QUOTE_NONNUMERIC``, but rows are processed in blocks. Every block is
+formatted column by column, so columns holding values of a single type are converted
+by one C-level ``map()`` call instead of one Python call per value. Each block is
+encoded once and written to the pipe as one large buffer.
+"""
+
+import datetime
+import decimal
+import itertools
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    Sequence,
+)
+
+DEFAULT_BLOCK_SIZE = 10000
+
+# Separator used to quote a whole column of strings in one pass
+_COLUMN_SEPARATOR = "\x00"
+
+
+def _is_numeric(value) -> bool:
+    """
+    Python equivalent of ``PyNumber_Check``, which is used by :class:`csv.writer`
+    to decide if a value is left unquoted with ``csv.QUOTE_NONNUMERIC``.
+    """
+    value_type = type(value)
+    return (
+        hasattr(value_type, "__index__")
+        or hasattr(value_type, "__int__")
+        or hasattr(value_type, "__float__")
+        or isinstance(value, complex)
+    )
+
+
+def _quote(value: str) -> str:
+    return '"' + value.replace('"', '""') + '"'
+
+
+def format_value(value) -> str:
+    if value is None:
+        return '""'
+    if isinstance(value, str):
+        return _quote(value)
+    if isinstance(value, float):
+        return float.__repr__(value)
+    if _is_numeric(value):
+        return str(value)
+    return _quote(str(value))
+
+
+def _format_str_column(values: Sequence[str]) -> list[str]:
+    joined = _COLUMN_SEPARATOR.join(values)
+
+    # Separator is part of some value, fall back to quoting values one by one
+    if joined.count(_COLUMN_SEPARATOR) != len(values) - 1:
+        return [_quote(v) for v in values]
+
+    if '"' in joined:
+        joined = joined.replace('"', '""')
+
+    quoted_separator = f'"{_COLUMN_SEPARATOR}"'
+    return f'"{joined.replace(_COLUMN_SEPARATOR, quoted_separator)}"'.split(
+        _COLUMN_SEPARATOR
+    )
+
+
+def _format_date_column(values: Sequence[datetime.date]) -> list[str]:
+    return ['"' + v + '"' for v in map(datetime.date.isoformat, values)]
+
+
+def _format_datetime_column(values: Sequence[datetime.datetime]) -> list[str]:
+    # Same as str(), but without the extra method lookup for every value
+    isoformat = map(datetime.datetime.isoformat, values, itertools.repeat(" "))
+    return ['"' + v + '"' for v in isoformat]
+
+
+def _format_none_column(values: Sequence[None]) -> list[str]:
+    return ['""'] * len(values)
+
+
+# Fast paths for columns where all values have exactly the same type
+_COLUMN_FORMATTERS: dict[type, Callable[[Sequence], list[str]]] = {
+    int: lambda values: list(map(int.__repr__, values)),
+    bool: lambda values: list(map(str, values)),
+    float: lambda values: list(map(float.__repr__, values)),
+    decimal.Decimal: lambda values: list(map(str, values)),
+    str: _format_str_column,
+    datetime.date: _format_date_column,
+    datetime.datetime: _format_datetime_column,
+    type(None): _format_none_column,
+}
+
+
+def format_column(values: Sequence) -> list[str]:
+    value_types = set(map(type, values))
+
+    if len(value_types) == 1:
+        formatter = _COLUMN_FORMATTERS.get(value_types.pop())
+
+        if formatter is not None:
+            return formatter(values)
+
+    # Nullable column of a single type, format non-NULL values using a fast path
+    if len(value_types) == 2 and type(None) in value_types:
+        value_types.discard(type(None))
+        formatter = _COLUMN_FORMATTERS.get(value_types.pop())
+
+        if formatter is not None:
+            formatted = iter(formatter([v for v in values if v is not None]))
+            return ['""' if v is None else next(formatted) for v in values]
+
+    return list(map(format_value, values))
+
+
+def format_block(rows: list[Sequence]) -> str:
+    """
+    Format a block of rows into CSV text, including a final line terminator.
+    """
+    try:
+        is_rectangular = len(set(map(len, rows))) == 1
+    except TypeError:
+        # Some rows do not implement __len__, e.g. generators
+        is_rectangular = False
+
+    if is_rectangular and len(rows[0]) > 0:
+        columns = [format_column(column) for column in zip(*rows)]
+        lines: Iterable[str] = map(",".join, zip(*columns))
+    else:
+        lines = (",".join(map(format_value, row)) for row in rows)
+
+    return "\n".join(lines) + "\n"
+
+
+def serialize_rows(
+    rows: Iterable[Sequence], block_size: int = DEFAULT_BLOCK_SIZE
+) -> Iterator[bytes]:
+    """
+    Serialize rows into UTF-8 encoded CSV, yielding one buffer per block of rows.
+    """
+    if block_size < 1:
+        raise ValueError(f"Block size must be a positive integer, got {block_size}")
+
+    rows_iterator = iter(rows)
+
+    while block := list(itertools.islice(rows_iterator, block_size)):
+        yield format_block(block).encode("utf-8")
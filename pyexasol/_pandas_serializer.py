@@ -0,0 +1,69 @@
+"""
+Columnar serializer of :class:`pandas.DataFrame` for prepared statements.
+
+``executePreparedStatement`` expects data as a list of columns, which is exactly how
+:class:`pandas.DataFrame` stores it. Every column is converted into a list of JSON
+compatible values in one vectorized call, without building Python tuples for rows.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+# Types natively supported by every JSON library
+_JSON_TYPES = (str, int, float, bool)
+
+
+def _format_objects(values: list) -> list:
+    import numpy
+
+    def format_object(value):
+        # numpy.float64 is a subclass of float, but not every JSON library accepts it
+        if isinstance(value, numpy.generic):
+            return value.item()
+        if value is None or isinstance(value, _JSON_TYPES):
+            return value
+        return str(value)
+
+    return [format_object(value) for value in values]
+
+
+def _replace_missing(series: "pandas.Series") -> "pandas.Series":
+    # NaN, NaT and pandas.NA are replaced by None, which becomes JSON null
+    return series.astype(object).where(series.notna(), None)
+
+
+def _format_datetime64(series: "pandas.Series") -> list:
+    import numpy
+
+    # numpy formats whole array in C, which is much faster than Series.dt.strftime
+    values = numpy.datetime_as_string(series.to_numpy(), unit="us")
+    values = numpy.char.replace(values, "T", " ", count=1).astype(object)
+    values[series.isna().to_numpy()] = None
+    return values.tolist()
+
+
+def serialize_column(series: "pandas.Series") -> list:
+    import numpy
+
+    kind = series.dtype.kind
+
+    # Nullable pandas dtypes (e.g. Int64) may contain pandas.NA, numpy dtypes may only contain NaN
+    if isinstance(series.dtype, numpy.dtype) and kind in "biuf":
+        if kind == "f" and series.hasnans:
+            return _replace_missing(series).tolist()
+        return series.tolist()
+
+    if kind == "M":
+        if series.dt.tz is not None:
+            return _replace_missing(series.dt.strftime(TIMESTAMP_FORMAT)).tolist()
+        return _format_datetime64(series)
+
+    return _format_objects(_replace_missing(series).tolist())
+
+
+def serialize_dataframe(src: "pandas.DataFrame") -> list[list]:
+    return [serialize_column(series) for _, series in src.items()]
@@ -1,7 +1,17 @@
+import functools
+import re
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+)
 from enum import (
     Enum,
     auto,
 )
+from typing import TextIO
+
+from . import constant
 
 
 class ScanState(Enum):
@@ -36,227 +46,301 @@ SCRIPT_HEADER_WORDS = {
 }
 
 
-class _CommentStripper:
-    def __init__(self, sql: str) -> None:
-        self.sql = sql
-        self.output: list[str] = []
-        self.state = ScanState.NORMAL
-        self.position = 0
-
-    def run(self) -> str:
-        while self.position < len(self.sql):
-            self.consume_current_character()
-
-        return "".join(self.output)
-
-    def consume_current_character(self) -> None:
-        if self.state == ScanState.SINGLE_QUOTE:
-            self.consume_quote("'")
-        elif self.state == ScanState.DOUBLE_QUOTE:
-            self.consume_quote('"')
-        elif self.current_char == "'":
-            self.enter_quote(ScanState.SINGLE_QUOTE)
-        elif self.current_char == '"':
-            self.enter_quote(ScanState.DOUBLE_QUOTE)
-        elif self.current_char == "-" and self.next_char == "-":
-            self.consume_line_comment()
-        elif self.current_char == "/" and self.next_char == "*":
-            self.consume_block_comment()
-        else:
-            self.append_current_char()
-
-    @property
-    def current_char(self) -> str:
-        return self.sql[self.position]
+# Master pattern of text outside of script bodies. Plain text, complete quoted strings,
+# complete comments and irrelevant words are consumed as "text" in one match, up to the
+# next significant token. Token "opening" starts a quoted string or a comment, which is
+# not terminated in the buffer. The last item of text is captured to find a word, "-"
+# or "/", which may continue in the next chunk.
+_TOKEN_PATTERN = r"""
+    (?P<text>(?P<item>
+        [^\w'";\-/]+
+        |{skipped_word}
+        |'[^']*'
+        |"[^"]*"
+        |--[^\n]*\n
+        |/\*.*?\*/
+        |-(?!-)
+        |/(?!\*)
+    )*)
+    (?:
+        (?P<word>{word})
+        |(?P<semicolon>;)
+        |(?P<opening>['"]|--|/\*)
+        |\Z
+    )
+"""
+
+
+def _compile_token_regexp(word: str, skipped_word: str) -> re.Pattern:
+    return re.compile(
+        _TOKEN_PATTERN.format(word=word, skipped_word=skipped_word),
+        re.IGNORECASE | re.DOTALL | re.VERBOSE,
+    )
+
+
+# Words other than "CREATE" and "AS" are skipped, they cannot change the script header
+_WORD_TOKEN_REGEXP = _compile_token_regexp(r"\w+", r"(?!)")
+_CREATE_TOKEN_REGEXP = _compile_token_regexp(
+    r"(?<!\w)CREATE(?!\w)", r"(?!CREATE(?!\w))\w+"
+)
+_AS_TOKEN_REGEXP = _compile_token_regexp(r"(?<!\w)AS(?!\w)", r"(?!AS(?!\w))\w+")
 
-    @property
-    def next_char(self) -> str | None:
-        lookahead = self.position + 1
-        return self.sql[lookahead] if lookahead < len(self.sql) else None
+_OPENING_STATES = {
+    "'": ScanState.SINGLE_QUOTE,
+    '"': ScanState.DOUBLE_QUOTE,
+    "--": ScanState.LINE_COMMENT,
+    "/*": ScanState.BLOCK_COMMENT,
+}
 
-    def consume_quote(self, quote: str) -> None:
-        self.append_current_char()
-        if self.output[-1] == quote:
-            self.state = ScanState.NORMAL
+_CLOSING_TOKENS = {
+    ScanState.SINGLE_QUOTE: "'",
+    ScanState.DOUBLE_QUOTE: '"',
+    ScanState.LINE_COMMENT: "\n",
+    ScanState.BLOCK_COMMENT: "*/",
+}
 
-    def enter_quote(self, state: ScanState) -> None:
-        self.output.append(self.current_char)
-        self.state = state
-        self.position += 1
+# Standalone "/" line, followed by optional spaces and line break or end of script
+_SCRIPT_TERMINATOR_REGEXP = re.compile(r"\n[ \t]*(/)[ \t]*(?=\n|\r\n|\r?\Z)")
+_LINE_START_SCRIPT_TERMINATOR_REGEXP = re.compile(r"[ \t]*(/)[ \t]*(?=\n|\r\n|\r?\Z)")
+_SCRIPT_TERMINATOR_PREFIX_REGEXP = re.compile(r"[ \t]*(?:/[ \t]*\r?)?")
 
-    def append_current_char(self) -> None:
-        self.output.append(self.current_char)
-        self.position += 1
+# Quoted strings are kept, unterminated strings and block comments last until the end
+_COMMENT_REGEXP = re.compile(
+    r"""('[^']*'?|"[^"]*"?)|--[^\n]*|/\*(?:.*?\*/|.*)""", re.DOTALL
+)
 
-    def consume_line_comment(self) -> None:
-        self.output.append(" ")
-        self.position += 2
-        while self.position < len(self.sql) and self.current_char != "\n":
-            self.position += 1
 
-    def consume_block_comment(self) -> None:
-        self.output.append(" ")
-        self.position += 2
-        while self.position < len(self.sql):
-            if self.current_char == "*" and self.next_char == "/":
-                self.position += 2
-                return
-            self.position += 1
+def _replace_comment(match: re.Match) -> str:
+    return match.group(1) or " "
 
 
 def strip_comments(sql: str) -> str:
-    return _CommentStripper(sql).run()
+    """
+    Replace every line and block comment outside of quoted strings with one space.
+    """
+    if "--" not in sql and "/*" not in sql:
+        return sql
+
+    return _COMMENT_REGEXP.sub(_replace_comment, sql)
 
 
 class _SqlScriptSplitter:
-    def __init__(self, sql: str) -> None:
-        self.sql = sql
+    """
+    Streaming splitter of SQL script received as a sequence of text chunks.
+
+    Scanner matches text up to the next significant token with one master regular
+    expression, instead of processing the script character by character. Only the
+    unprocessed tail of the current chunk is kept in the buffer, text of the current
+    statement is collected as slices in ``current``.
+    """
+
+    def __init__(self, chunks: Iterator[str]) -> None:
+        self.chunks = chunks
+        self.buffer = ""
+        self.position = 0
+        self.is_eof = False
         self.statements: list[str] = []
         self.current: list[str] = []
-        self.word: list[str] = []
+        # Statement has text other than whitespace and comments
+        self.has_content = False
         self.state = ScanState.NORMAL
         self.script_header = ScriptHeaderState.NONE
         self.line_start = True
-        self.position = 0
 
-    def run(self) -> list[str]:
-        while self.position < len(self.sql):
-            self.consume_current_character()
+    def run(self) -> Iterator[str]:
+        while self.position < len(self.buffer) or not self.is_eof:
+            if self.position < len(self.buffer):
+                self.consume_token()
+            else:
+                self.read_chunk()
+
+            if self.statements:
+                yield from self.statements
+                self.statements.clear()
 
-        self.finish_word()
         self.flush_statement()
-        return self.statements
+        yield from self.statements
+
+    def read_chunk(self) -> None:
+        chunk = next(self.chunks, None)
 
-    def consume_current_character(self) -> None:
+        if chunk is None:
+            self.is_eof = True
+            return
+
+        if not isinstance(chunk, str):
+            raise TypeError(
+                f"SQL script must consist of str chunks, got {type(chunk).__name__}"
+            )
+
+        # One processed character is kept for the lookbehind of keyword patterns
+        keep = max(self.position - 1, 0)
+        self.buffer = self.buffer[keep:] + chunk
+        self.position -= keep
+
+    def consume_token(self) -> None:
         if self.state == ScanState.NORMAL:
             self.consume_normal()
         elif self.state == ScanState.SCRIPT_BODY:
             self.consume_script_body()
-        elif self.state == ScanState.SINGLE_QUOTE:
-            self.consume_quote("'")
-        elif self.state == ScanState.DOUBLE_QUOTE:
-            self.consume_quote('"')
-        elif self.state == ScanState.LINE_COMMENT:
-            self.consume_line_comment()
         else:
-            self.consume_block_comment()
+            self.consume_until(_CLOSING_TOKENS[self.state])
 
-    @property
-    def current_char(self) -> str:
-        return self.sql[self.position]
+    def consume_normal(self) -> None:
+        # Only words which may change the state of script header are relevant
+        if self.script_header == ScriptHeaderState.NONE:
+            regexp = _CREATE_TOKEN_REGEXP
+        elif self.script_header == ScriptHeaderState.SAW_SCRIPT:
+            regexp = _AS_TOKEN_REGEXP
+        else:
+            regexp = _WORD_TOKEN_REGEXP
 
-    @property
-    def next_char(self) -> str | None:
-        lookahead = self.position + 1
-        return self.sql[lookahead] if lookahead < len(self.sql) else None
+        match = regexp.match(self.buffer, self.position)
+        token_type = match.lastgroup
 
-    def consume_normal(self) -> None:
-        if self.current_char.isalnum() or self.current_char == "_":
-            self.word.append(self.current_char)
-            self.append_current_char()
-        elif self.finish_word():
-            self.enter_script_body()
-        elif self.current_char == "'":
-            self.enter_state(ScanState.SINGLE_QUOTE)
-        elif self.current_char == '"':
-            self.enter_state(ScanState.DOUBLE_QUOTE)
-        elif self.current_char == "-" and self.next_char == "-":
-            self.enter_two_character_state(ScanState.LINE_COMMENT)
-        elif self.current_char == "/" and self.next_char == "*":
-            self.enter_two_character_state(ScanState.BLOCK_COMMENT)
-        elif self.current_char == ";":
+        if token_type in ("text", "item"):
+            # End of buffer
+            self.append_tail(functools.partial(self.get_normal_tail_position, match))
+            return
+
+        # Word may continue in the next chunk
+        if token_type == "word" and match.end() == len(self.buffer) and not self.is_eof:
+            self.append_until(match.start(token_type))
+            self.read_chunk()
+            return
+
+        self.append_until(match.start(token_type))
+        self.position = match.end()
+
+        if token_type == "word":
+            self.current.append(match.group(token_type))
+            self.has_content = True
+            if self.update_script_header(match.group(token_type).upper()):
+                self.enter_script_body()
+        elif token_type == "semicolon":
             self.script_header = ScriptHeaderState.NONE
             self.flush_statement()
-            self.position += 1
         else:
-            self.append_current_char()
+            # Quoted string or comment is not terminated in the buffer
+            self.current.append(match.group(token_type))
+            self.state = _OPENING_STATES[match.group(token_type)]
+            if self.state in (ScanState.SINGLE_QUOTE, ScanState.DOUBLE_QUOTE):
+                self.has_content = True
 
-    def consume_script_body(self) -> None:
-        if self.slash_terminates_script_body():
-            self.finish_script_body()
-            return
+    @staticmethod
+    def get_normal_tail_position(match: re.Match) -> int:
+        # Trailing word, "-" or "/" may be a part of a token completed by the next chunk
+        item = match.group("item")
 
-        self.current.append(self.current_char)
-        if self.current_char == "\n":
-            self.line_start = True
-        elif self.current_char not in " \t":
-            self.line_start = False
-        self.position += 1
+        if item is not None and (
+            item in ("-", "/") or item[0].isalnum() or item[0] == "_"
+        ):
+            return match.start("item")
 
-    def consume_quote(self, quote: str) -> None:
-        self.append_current_char()
-        if self.current[-1] == quote:
-            self.state = ScanState.NORMAL
+        return match.end()
 
-    def consume_line_comment(self) -> None:
-        self.append_current_char()
-        if self.current[-1] == "\n":
-            self.state = ScanState.NORMAL
+    def consume_script_body(self) -> None:
+        match = None
 
-    def consume_block_comment(self) -> None:
-        next_char = self.next_char
-        self.current.append(self.current_char)
-        if self.current_char == "*" and next_char == "/":
-            self.current.append(next_char)
-            self.state = ScanState.NORMAL
-            self.position += 2
-        else:
-            self.position += 1
+        if self.line_start:
+            match = _LINE_START_SCRIPT_TERMINATOR_REGEXP.match(
+                self.buffer, self.position
+            )
 
-    def enter_state(self, state: ScanState) -> None:
-        self.current.append(self.current_char)
-        self.state = state
-        self.position += 1
+        if match is None:
+            match = _SCRIPT_TERMINATOR_REGEXP.search(self.buffer, self.position)
 
-    def enter_two_character_state(self, state: ScanState) -> None:
-        next_char = self.next_char
-        if next_char is None:
-            msg = "Expected two-character token while splitting SQL script."
-            raise ValueError(msg)
-        self.current.append(self.current_char)
-        self.current.append(next_char)
-        self.state = state
-        self.position += 2
+        if match is None:
+            self.append_tail(self.get_script_body_tail_position)
+            return
 
-    def enter_script_body(self) -> None:
-        self.script_header = ScriptHeaderState.NONE
-        self.state = ScanState.SCRIPT_BODY
-        self.current.append(self.current_char)
-        self.line_start = self.current_char in " \t\n"
-        self.position += 1
+        # Whitespace after terminator may continue in the next chunk
+        if not self.is_eof and (
+            match.end() == len(self.buffer)
+            or (match.end() + 1 == len(self.buffer) and self.buffer[-1] == "\r")
+        ):
+            self.line_start = self.line_start and match.start() == self.position
+            self.append_until(match.start())
+            self.read_chunk()
+            return
 
-    def finish_script_body(self) -> None:
-        if self.current and self.current[-1] == "\n":
-            self.current.pop()
+        self.append_until(match.start(1))
         self.flush_statement()
         self.script_header = ScriptHeaderState.NONE
         self.state = ScanState.NORMAL
-        self.position += 1
-        self.skip_script_terminator_trailing_whitespace()
+        self.position = match.end()
 
-    def skip_script_terminator_trailing_whitespace(self) -> None:
-        while self.position < len(self.sql) and self.current_char in " \t":
-            self.position += 1
-        if self.position < len(self.sql) and self.current_char == "\r":
+        if self.position < len(self.buffer) and self.buffer[self.position] == "\r":
             self.position += 1
 
-    def append_current_char(self) -> None:
-        self.current.append(self.current_char)
+    def get_script_body_tail_position(self) -> int:
+        # Last line is kept in the buffer, it may become a terminator with next chunk
+        newline_position = self.buffer.rfind("\n", self.position)
+
+        if newline_position >= 0:
+            tail_position = newline_position
+            tail = self.buffer[newline_position + 1 :]
+        elif self.line_start:
+            tail_position = self.position
+            tail = self.buffer[self.position :]
+        else:
+            return len(self.buffer)
+
+        if _SCRIPT_TERMINATOR_PREFIX_REGEXP.fullmatch(tail):
+            # Newline is scanned again by the terminator pattern
+            self.line_start = tail_position == self.position and self.line_start
+            return tail_position
+
+        self.line_start = False
+        return len(self.buffer)
+
+    def consume_until(self, terminator: str) -> None:
+        end = self.buffer.find(terminator, self.position)
+
+        if end >= 0:
+            self.append_until(end + len(terminator))
+            self.state = ScanState.NORMAL
+        elif self.is_eof or not self.buffer.endswith(terminator[0]):
+            self.append_until(len(self.buffer))
+        else:
+            # Beginning of two-character terminator may be completed by the next chunk
+            self.append_until(len(self.buffer) - 1)
+            self.read_chunk()
+
+    def append_tail(self, get_tail_position: Callable[[], int]) -> None:
+        if self.is_eof:
+            self.append_until(len(self.buffer))
+        else:
+            self.append_until(get_tail_position())
+            self.read_chunk()
+
+    def append_until(self, end: int) -> None:
+        if end > self.position:
+            text = self.buffer[self.position : end]
+            self.current.append(text)
+            self.position = end
+
+            if self.state == ScanState.NORMAL and not self.has_content:
+                self.has_content = not strip_comments(text).isspace()
+
+    def enter_script_body(self) -> None:
+        # Script body starts with the character following "AS", whatever it is
+        if self.position == len(self.buffer):
+            return
+
+        char = self.buffer[self.position]
+
+        self.script_header = ScriptHeaderState.NONE
+        self.state = ScanState.SCRIPT_BODY
+        self.current.append(char)
+        self.line_start = char in " \t\n"
         self.position += 1
 
     def flush_statement(self) -> None:
-        statement = "".join(self.current).strip()
-        if statement and strip_comments(statement).strip():
-            self.statements.append(statement)
+        if self.has_content:
+            self.statements.append("".join(self.current).strip())
         self.current.clear()
-
-    def finish_word(self) -> bool:
-        if not self.word:
-            return False
-
-        upper_word = "".join(self.word).upper()
-        self.word.clear()
-        return self.update_script_header(upper_word)
+        self.has_content = False
 
     def update_script_header(self, upper_word: str) -> bool:
         if self.script_header == ScriptHeaderState.NONE:
@@ -294,20 +378,27 @@ class _SqlScriptSplitter:
         elif upper_word not in SCRIPT_HEADER_WORDS:
             self.script_header = ScriptHeaderState.NONE
 
-    def slash_terminates_script_body(self) -> bool:
-        if not self.line_start or self.current_char != "/":
-            return False
 
-        lookahead = self.position + 1
-        while lookahead < len(self.sql) and self.sql[lookahead] in " \t":
-            lookahead += 1
+def _iter_chunks(source: str | TextIO | Iterable[str]) -> Iterator[str]:
+    if isinstance(source, str):
+        return iter((source,))
 
-        if lookahead == len(self.sql) or self.sql[lookahead] == "\n":
-            return True
+    if hasattr(source, "read"):
+        return iter(functools.partial(source.read, constant.SQL_SCRIPT_READ_SIZE), "")
 
-        return self.sql[lookahead] == "\r" and (
-            lookahead + 1 == len(self.sql) or self.sql[lookahead + 1] == "\n"
-        )
+    return iter(source)
+
+
+def iter_sql_script(source: str | TextIO | Iterable[str]) -> Iterator[str]:
+    """
+    Split an Exasol SQL script into executable statements lazily.
+
+    Source may be a string, a text file object or an iterable of text chunks.
+    Statements are yielded as soon as they are complete, chunks are read only
+    when needed, so memory usage does not depend on the size of the script.
+    Splitting rules are the same as for :func:`split_sql_script`.
+    """
+    return _SqlScriptSplitter(_iter_chunks(source)).run()
 
 
 def split_sql_script(sql: str) -> list[str]:
@@ -320,4 +411,4 @@ def split_sql_script(sql: str) -> list[str]:
     bodies are entered after ``CREATE ... SCRIPT ... AS`` and are terminated by
     a standalone ``/`` line.
     """
-    return _SqlScriptSplitter(sql).run()
+    return list(iter_sql_script(sql))
@@ -18,20 +18,34 @@ Import callback arguments:
 
 """
 
+import collections
 import csv
 import glob
 import io
 import shutil
-from collections.abc import Iterable
+import sys
+import threading
+from collections.abc import (
+    Iterable,
+    Iterator,
+)
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Union,
 )
 
+from ._csv_serializer import serialize_rows
+
 if TYPE_CHECKING:
     import pandas
     import polars
+    import pyarrow
+
+# Maximum number of rows in record batches produced from Arrow-compatible sources
+ARROW_MAX_CHUNKSIZE = 65536
+# Maximum size of CSV data decoded by threads ahead of the pipe
+READ_AHEAD_MAX_BYTES = 64 * 1024 * 1024
 
 
 def export_to_list(pipe, dst, **kwargs) -> list:
@@ -54,6 +68,23 @@ def export_to_pandas(pipe, dst, **kwargs) -> "pandas.DataFrame":
     return pandas.read_csv(pipe, skip_blank_lines=False, **kwargs)
 
 
+def export_to_pandas_chunks(
+    pipe, dst, chunksize: int, **kwargs
+) -> Iterator["pandas.DataFrame"]:
+    """
+    Basic example of how to export into a sequence of :class:`pandas.DataFrame` chunks
+    Every chunk has at most `chunksize` rows and is yielded as soon as it was parsed,
+    while the rest of the CSV stream is still being received
+    Custom params for :func:`pandas.DataFrame.read_csv` may be passed in `**kwargs`
+    """
+    import pandas
+
+    with pandas.read_csv(
+        pipe, skip_blank_lines=False, chunksize=chunksize, **kwargs
+    ) as reader:
+        yield from reader
+
+
 def check_export_to_parquet_directory_setting(
     dst: Path | str, callback_params: dict | None = None
 ) -> None:
@@ -171,10 +202,20 @@ def export_to_file(pipe, dst):
 def import_from_iterable(pipe, src: Iterable, **kwargs):
     """
     Basic example of how to import from iterable object (list, dict, tuple, iterator, generator, etc.)
+
+    Rows are serialized in blocks by :func:`pyexasol._csv_serializer.serialize_rows`,
+    which produces the same output as :class:`csv.writer` with ``csv.QUOTE_NONNUMERIC``.
+    Custom params for :class:`csv.writer` may be passed in `**kwargs`, in which case
+    rows are written one by one using :class:`csv.writer`.
     """
     if not hasattr(src, "__iter__"):
         raise ValueError("Data source is not iterable")
 
+    if not kwargs:
+        for data in serialize_rows(src):
+            pipe.write(data)
+        return
+
     wrapped_pipe = io.TextIOWrapper(pipe, newline="\n", encoding="utf-8")
     writer = csv.writer(
         wrapped_pipe, lineterminator="\n", quoting=csv.QUOTE_NONNUMERIC, **kwargs
@@ -232,8 +273,202 @@ def get_parquet_files(source: list[Path] | Path | str) -> list[Path]:
     )
 
 
+def split_parquet_files(
+    source: list[Path] | Path | str, parts: int
+) -> list[list[Path]]:
+    """
+    Split parquet file(s) into at most `parts` groups of similar total file size
+
+    It may be used to map files onto parallel HTTP transport processes, one group
+    per process, see :ref:`http_transport_parallel`. Every group keeps the original
+    order of files.
+    """
+    if parts < 1:
+        raise ValueError(f"Number of parts must be a positive integer, got {parts}")
+
+    parquet_files = get_parquet_files(source)
+    file_sizes = [filepath.stat().st_size for filepath in parquet_files]
+
+    groups: list[list[int]] = [[] for _ in range(min(parts, len(parquet_files)))]
+    group_sizes = [0] * len(groups)
+
+    # Largest files first, every file goes to the currently smallest group
+    for idx in sorted(
+        range(len(parquet_files)), key=file_sizes.__getitem__, reverse=True
+    ):
+        smallest = group_sizes.index(min(group_sizes))
+        groups[smallest].append(idx)
+        group_sizes[smallest] += file_sizes[idx]
+
+    return [[parquet_files[idx] for idx in sorted(group)] for group in groups]
+
+
+class _ReadAheadCancelled(Exception):
+    pass
+
+
+class _ReadAhead:
+    """
+    Run ``func(*task)`` for every task in a pool of ``max_workers`` threads. ``func``
+    returns an iterator of chunks of bytes, chunks are yielded in the original order of tasks.
+
+    Chunks computed ahead of the consumer are limited by ``max_bytes`` in total. Chunk of
+    the task being consumed is always accepted if nothing else of this task is waiting,
+    so the consumer never waits for a worker which waits for memory.
+    """
+
+    def __init__(self, func, tasks: Iterable[tuple], max_workers: int, max_bytes: int):
+        self.func = func
+        self.tasks = iter(tasks)
+        self.max_bytes = max_bytes
+
+        self.tasks_lock = threading.Lock()
+        self.num_started = 0
+        # Known after all tasks were started
+        self.num_tasks: int | None = None
+
+        self.cond = threading.Condition()
+        self.size = 0
+        self.head = 0
+        self.chunks: collections.defaultdict[int, collections.deque] = (
+            collections.defaultdict(collections.deque)
+        )
+        self.finished: set[int] = set()
+        self.exc: dict[int, BaseException] = {}
+        self.is_cancelled = False
+
+        self.threads = [
+            threading.Thread(target=self._work, name="pyexasol-read-ahead", daemon=True)
+            for _ in range(max_workers)
+        ]
+
+    def __iter__(self) -> Iterator:
+        for thread in self.threads:
+            thread.start()
+
+        try:
+            while (chunk := self._get()) is not None:
+                yield chunk
+        finally:
+            with self.cond:
+                self.is_cancelled = True
+                self.cond.notify_all()
+
+            for thread in self.threads:
+                thread.join()
+
+    def _get(self):
+        with self.cond:
+            while True:
+                if self.head in self.exc:
+                    raise self.exc[self.head]
+
+                if self.chunks[self.head]:
+                    chunk = self.chunks[self.head].popleft()
+                    self.size -= len(chunk)
+                    self.cond.notify_all()
+
+                    return chunk
+
+                if self.head in self.finished:
+                    del self.chunks[self.head]
+                    self.head += 1
+                    self.cond.notify_all()
+                    continue
+
+                if self.head == self.num_tasks:
+                    return None
+
+                self.cond.wait()
+
+    def _put(self, idx: int, chunk):
+        with self.cond:
+            while not (
+                self.size == 0
+                or self.size + len(chunk) <= self.max_bytes
+                or (idx == self.head and not self.chunks[idx])
+            ):
+                if self.is_cancelled:
+                    raise _ReadAheadCancelled
+
+                self.cond.wait()
+
+            self.chunks[idx].append(chunk)
+            self.size += len(chunk)
+            self.cond.notify_all()
+
+    def _finish(self, idx: int, exc: BaseException | None = None):
+        with self.cond:
+            if exc is None:
+                self.finished.add(idx)
+            else:
+                self.exc[idx] = exc
+
+            self.cond.notify_all()
+
+    def _set_num_tasks(self, num_tasks: int):
+        with self.cond:
+            self.num_tasks = num_tasks
+            self.cond.notify_all()
+
+    def _work(self):
+        while not self.is_cancelled:
+            with self.tasks_lock:
+                if self.num_tasks is not None:
+                    return
+
+                idx = self.num_started
+
+                try:
+                    task = next(self.tasks)
+                except StopIteration:
+                    self._set_num_tasks(idx)
+                    return
+                except BaseException as e:
+                    # Error of the task iterator is raised in place of the next task
+                    self._finish(idx, e)
+                    self._set_num_tasks(idx + 1)
+                    return
+
+                self.num_started += 1
+
+            try:
+                for chunk in self.func(*task):
+                    self._put(idx, chunk)
+            except _ReadAheadCancelled:
+                return
+            except BaseException as e:
+                self._finish(idx, e)
+                return
+
+            self._finish(idx)
+
+
+def _check_max_workers(max_workers: int):
+    if max_workers < 1:
+        raise ValueError(
+            f"Number of workers must be a positive integer, got {max_workers}"
+        )
+
+
+def _arrow_batch_to_csv(
+    batch: "pyarrow.RecordBatch", write_options: "pyarrow.csv.WriteOptions"
+) -> "pyarrow.Buffer":
+    import pyarrow
+    from pyarrow import csv
+
+    sink = pyarrow.BufferOutputStream()
+    csv.write_csv(batch, sink, write_options)
+
+    return sink.getvalue()
+
+
 def import_from_parquet(
-    pipe, source: list[Path] | Path | str, **kwargs
+    pipe,
+    source: list[Path] | Path | str,
+    max_workers: int | None = None,
+    max_bytes: int = READ_AHEAD_MAX_BYTES,
+    **kwargs,
 ):  # NOSONAR(S3776)
     """
     Basic example of how to import from :class:`pyarrow.parquet.ParquetFile` via local parquet file(s)
@@ -245,6 +480,12 @@ def import_from_parquet(
             all files matching the following pattern *.parquet will be processed.
             - str: representing a filepath which already contains a glob pattern
             (e.g., "/local_dir/*.parquet")
+        max_workers:
+            Number of threads decoding row groups into CSV ahead of the pipe. By default,
+            files are decoded one batch at a time in the calling thread.
+        max_bytes:
+            Maximum total size of CSV data decoded by threads ahead of the pipe,
+            used with ``max_workers`` only.
         **kwargs:
             Custom params for :func:`pyarrow.parquet.ParquetFile.iter_batches`. This can be used
             to specify what columns should be read and their preferred order.
@@ -252,12 +493,13 @@ def import_from_parquet(
     Please note that nested or hierarchical column types are not supported.
     """
     from pyarrow import (
-        csv,
         parquet,
         types,
     )
 
-    def ensure_no_nested_columns(schema, requested_columns: list[str] | None) -> None:
+    def ensure_no_nested_columns(
+        file: Path, schema, requested_columns: list[str] | None
+    ) -> None:
         nested_fields = []
         for field in schema:
             if not types.is_nested(field.type):
@@ -272,16 +514,53 @@ def import_from_parquet(
                 f"Fields {nested_fields} of schema from file {file} is hierarchical which is not supported."
             )
 
+    if max_workers is not None:
+        _check_max_workers(max_workers)
+
     if not (parquet_files := get_parquet_files(source)):
         raise ValueError(f"source {source} does not match any files")
 
     columns = kwargs.get("columns", None)
-    for file in parquet_files:
-        parquet_file = parquet.ParquetFile(file, memory_map=True)
-        ensure_no_nested_columns(parquet_file.schema_arrow, columns)
-        for batch in parquet_file.iter_batches(**kwargs):
-            write_options = csv.WriteOptions(include_header=False)
-            csv.write_csv(batch, pipe, write_options=write_options)
+
+    if max_workers is None:
+        for file in parquet_files:
+            parquet_file = parquet.ParquetFile(file, memory_map=True)
+            ensure_no_nested_columns(file, parquet_file.schema_arrow, columns)
+            write_arrow_batches(pipe, parquet_file.iter_batches(**kwargs))
+        return
+
+    from pyarrow import csv
+
+    row_groups = kwargs.pop("row_groups", None)
+    batch_size = kwargs.pop("batch_size", ARROW_MAX_CHUNKSIZE)
+    write_options = csv.WriteOptions(include_header=False)
+    worker_files = threading.local()
+
+    def iter_tasks() -> Iterator[tuple[Path, int]]:
+        for file in parquet_files:
+            parquet_file = parquet.ParquetFile(file, memory_map=True)
+            ensure_no_nested_columns(file, parquet_file.schema_arrow, columns)
+
+            for row_group in (
+                row_groups
+                if row_groups is not None
+                else range(parquet_file.num_row_groups)
+            ):
+                yield file, row_group
+
+    def decode_row_group(file: Path, row_group: int) -> Iterator["pyarrow.Buffer"]:
+        # Tasks are ordered by file, so every worker opens every file at most once
+        if getattr(worker_files, "path", None) != file:
+            worker_files.path = file
+            worker_files.parquet_file = parquet.ParquetFile(file, memory_map=True)
+
+        for batch in worker_files.parquet_file.iter_batches(
+            batch_size=batch_size, row_groups=[row_group], **kwargs
+        ):
+            yield _arrow_batch_to_csv(batch, write_options)
+
+    for data in _ReadAhead(decode_row_group, iter_tasks(), max_workers, max_bytes):
+        pipe.write(data)
 
 
 def import_from_polars(
@@ -294,6 +573,13 @@ def import_from_polars(
     import polars
 
     if isinstance(src, polars.LazyFrame):
+        # Stream LazyFrame in batches instead of materializing it with collect()
+        # LazyFrame.collect_batches() is not available in older versions of polars
+        if hasattr(src, "collect_batches"):
+            for batch in src.collect_batches():
+                batch.write_csv(pipe, include_header=False, **kwargs)
+            return None
+
         src = src.collect()
     elif not isinstance(src, polars.DataFrame):
         raise ValueError("Data source is not polars.DataFrame or polars.LazyFrame")
@@ -301,6 +587,125 @@ def import_from_polars(
     return src.write_csv(pipe, include_header=False, **kwargs)
 
 
+def get_arrow_batches(
+    src, max_chunksize: int = ARROW_MAX_CHUNKSIZE
+) -> Iterator["pyarrow.RecordBatch"]:
+    """
+    Convert an Arrow-compatible source into a stream of :class:`pyarrow.RecordBatch`
+
+    Supported sources are :class:`pyarrow.Table`, :class:`pyarrow.RecordBatch`,
+    :class:`pyarrow.RecordBatchReader`, :class:`pandas.DataFrame`,
+    :class:`polars.DataFrame`, :class:`polars.LazyFrame` and any object implementing
+    the Arrow PyCapsule stream interface (``__arrow_c_stream__``).
+
+    Sources are converted lazily, in batches of up to `max_chunksize` rows where
+    possible, so the whole source is never converted at once.
+    """
+    import pyarrow
+
+    if isinstance(src, pyarrow.Table):
+        return iter(src.to_batches(max_chunksize=max_chunksize))
+
+    if isinstance(src, pyarrow.RecordBatch):
+        return iter([src])
+
+    if isinstance(src, pyarrow.RecordBatchReader):
+        return iter(src)
+
+    # Avoid importing optional libraries which were not loaded by the user
+    pandas = sys.modules.get("pandas")
+    if pandas is not None and isinstance(src, pandas.DataFrame):
+        return (
+            pyarrow.RecordBatch.from_pandas(
+                src.iloc[i : i + max_chunksize], preserve_index=False
+            )
+            for i in range(0, len(src), max_chunksize)
+        )
+
+    polars = sys.modules.get("polars")
+    if polars is not None and isinstance(src, polars.LazyFrame):
+        if hasattr(src, "collect_batches"):
+            return (
+                batch
+                for df in src.collect_batches(chunk_size=max_chunksize)
+                for batch in df.to_arrow().to_batches()
+            )
+        src = src.collect()
+
+    if polars is not None and isinstance(src, polars.DataFrame):
+        return iter(src.to_arrow().to_batches(max_chunksize=max_chunksize))
+
+    if hasattr(src, "__arrow_c_stream__"):
+        return iter(pyarrow.RecordBatchReader.from_stream(src))
+
+    raise ValueError(f"Data source of type {type(src)} is not Arrow-compatible")
+
+
+def write_arrow_batches(
+    pipe, batches: Iterable["pyarrow.RecordBatch"], **kwargs
+) -> None:
+    """
+    Write :class:`pyarrow.RecordBatch` stream into pipe as CSV without header using
+    a single :class:`pyarrow.csv.CSVWriter`, one batch at a time.
+    Custom params for :class:`pyarrow.csv.WriteOptions` may be passed in `**kwargs`
+    """
+    from pyarrow import csv
+
+    batches = iter(batches)
+
+    if (first_batch := next(batches, None)) is None:
+        return
+
+    write_options = csv.WriteOptions(include_header=False, **kwargs)
+
+    with csv.CSVWriter(pipe, first_batch.schema, write_options=write_options) as writer:
+        writer.write_batch(first_batch)
+
+        for batch in batches:
+            writer.write_batch(batch)
+
+
+def import_from_arrow(
+    pipe,
+    src,
+    max_workers: int | None = None,
+    max_bytes: int = READ_AHEAD_MAX_BYTES,
+    **kwargs,
+):
+    """
+    Basic example of how to import from any Arrow-compatible source using the
+    Arrow CSV writer, see :func:`get_arrow_batches` for supported sources.
+    The source is converted and written one :class:`pyarrow.RecordBatch` at a time.
+
+    Args:
+        max_workers:
+            Number of threads converting record batches into CSV ahead of the pipe.
+            By default, batches are converted in the calling thread.
+        max_bytes:
+            Maximum total size of CSV data converted by threads ahead of the pipe,
+            used with ``max_workers`` only.
+        **kwargs:
+            Custom params for :class:`pyarrow.csv.WriteOptions`.
+    """
+    if max_workers is None:
+        write_arrow_batches(pipe, get_arrow_batches(src), **kwargs)
+        return
+
+    _check_max_workers(max_workers)
+
+    from pyarrow import csv
+
+    write_options = csv.WriteOptions(include_header=False, **kwargs)
+
+    def convert_batch(batch: "pyarrow.RecordBatch") -> Iterator["pyarrow.Buffer"]:
+        yield _arrow_batch_to_csv(batch, write_options)
+
+    tasks = ((batch,) for batch in get_arrow_batches(src))
+
+    for data in _ReadAhead(convert_batch, tasks, max_workers, max_bytes):
+        pipe.write(data)
+
+
 def import_from_file(pipe, src):
     """
     Basic example of how to import from file or file-like object opened in binary mode
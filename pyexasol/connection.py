@@ -1,4 +1,6 @@
 import base64
+import concurrent.futures
+import contextlib
 import getpass
 import hashlib
 import itertools
@@ -14,6 +16,7 @@ import zlib
 from collections.abc import (
     Callable,
     Iterable,
+    Iterator,
 )
 from inspect import (
     Signature,
@@ -23,7 +26,9 @@ from inspect import (
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
+    Any,
     NamedTuple,
+    TextIO,
     Union,
 )
 from warnings import warn
@@ -36,7 +41,7 @@ from packaging.version import Version
 from . import callback as cb
 from . import constant
 from ._metadata import __version__
-from ._sql_splitter import split_sql_script
+from ._sql_splitter import iter_sql_script
 from .exceptions import (
     ExaAuthError,
     ExaCommunicationError,
@@ -55,12 +60,20 @@ from .ext import ExaExtension
 from .formatter import ExaFormatter
 from .http_transport import (
     ExaHttpThread,
+    ExaHttpThreadPool,
+    ExaHttpTransportStats,
     ExaSQLExportThread,
     ExaSQLImportThread,
 )
 from .logger import ExaLogger
 from .meta import ExaMetaData
-from .script_output import ExaScriptOutputProcess
+from .script_output import (
+    ExaScriptOutputDirStorage,
+    ExaScriptOutputDispatcher,
+    ExaScriptOutputIndexedStorage,
+    ExaScriptOutputSelectorServer,
+    check_udf_output_compression,
+)
 from .statement import ExaStatement
 from .warnings import PyexasolWarning
 
@@ -130,6 +143,8 @@ class ExaConnection:
         compression: bool = False,
         encryption: bool = True,
         fetch_dict: bool = False,
+        fetch_rows: str = "tuple",
+        row_factory: Callable[[tuple[str, ...]], Callable] | None = None,
         fetch_mapper=None,
         fetch_size_bytes=constant.DEFAULT_FETCH_SIZE_BYTES,
         lower_ident: bool = False,
@@ -150,6 +165,20 @@ class ExaConnection:
         websocket_sslopt: dict | None = None,
         access_token: str | None = None,
         refresh_token: str | None = None,
+        http_compression_level: int = constant.DEFAULT_HTTP_COMPRESSION_LEVEL,
+        http_compression_threads: int = constant.DEFAULT_HTTP_COMPRESSION_THREADS,
+        http_progress: Callable[[int, int, float], None] | None = None,
+        http_progress_interval: int = constant.DEFAULT_HTTP_PROGRESS_INTERVAL,
+        http_max_bytes_per_sec: int | None = None,
+        http_pool_size: int = 0,
+        result_cache=None,
+        meta_cache_ttl: float | None = None,
+        meta_cache_max_entries: int = constant.DEFAULT_META_CACHE_MAX_ENTRIES,
+        meta_nosql: bool = False,
+        format_max_list_size: int | None = None,
+        udf_output_compression: str | None = None,
+        udf_output_max_bytes: int | None = None,
+        udf_output_indexed: bool = False,
     ):
         """
         Exasol connection object
@@ -188,6 +217,17 @@ class ExaConnection:
                 (Default: True)
             fetch_dict:
                 Fetch result rows as dicts instead of tuples (Default: False)
+            fetch_rows:
+                Type of fetched result rows: ``tuple``, ``dict`` or ``record``
+                (:class:`pyexasol.ExaRecord`, tuple with access to values by column name).
+                ``fetch_dict=True`` takes precedence over this option
+                (Default: tuple)
+            row_factory:
+                Function called once per result set with a tuple of column names, which
+                returns a function converting every row tuple into the fetched object,
+                e.g. :func:`pyexasol.row.namedtuple_row_factory`.
+                Takes precedence over ``fetch_rows``
+                (Default: None)
             fetch_mapper:
                 Use custom mapper function to convert Exasol values into
                 Python objects during fetching
@@ -251,6 +291,66 @@ class ExaConnection:
                 OpenID access token to use for the login process
             refresh_token:
                 OpenID refresh token to use for the login process
+            http_compression_level:
+                zlib compression level for IMPORT data sent with HTTP transport,
+                from 0 to 9 or -1 for zlib default
+                (Default: -1, zlib default)
+            http_compression_threads:
+                Number of threads compressing IMPORT data sent with HTTP transport
+                into independent gzip members in parallel
+                (Default: 1, compress in HTTP transport thread)
+            http_progress:
+                Function called with number of uncompressed bytes, approximate
+                number of rows and elapsed seconds during HTTP transport.
+                It is called from the HTTP transport thread, not from the calling thread.
+                Exception raised by this function aborts the transfer and is re-raised
+                as :class:`pyexasol.ExaExportError` or :class:`pyexasol.ExaImportError`
+                (Default: None)
+            http_progress_interval:
+                Call ``http_progress`` every time this number of bytes was transferred
+                and once after transfer is finished
+                (Default: 64Mb)
+            http_max_bytes_per_sec:
+                Limit network throughput of every HTTP transport thread
+                (Default: None, no limit)
+            http_pool_size:
+                Number of HTTP transport tunnels established in background ahead of
+                the next IMPORT or EXPORT, useful for frequent small batches.
+                Encrypted tunnels of the pool share one temporary certificate
+                (Default: 0, no pool)
+            result_cache:
+                Instance of :class:`pyexasol.ExaResultCache` used by
+                :class:`pyexasol.ExaCachedStatement`, see ``cls_statement``
+                (Default: None)
+            meta_cache_ttl:
+                Cache results of :class:`pyexasol.ExaMetaData` lookups for this number
+                of seconds. Cache is invalidated on DDL statements executed by this connection
+                (Default: None, no cache)
+            meta_cache_max_entries:
+                Maximum number of cached metadata lookups
+                (Default: 1000)
+            meta_nosql:
+                Use lighter metadata commands instead of SQL queries in
+                :meth:`pyexasol.ExaMetaData.list_schemas`, ``list_tables``, ``list_views``
+                and ``list_columns`` if protocol version 2 or higher is available.
+                Warning: result rows have different columns
+                (Default: False)
+            format_max_list_size:
+                Maximum number of values in a list passed as a value for placeholder
+                in :meth:`pyexasol.ExaFormatter.format`
+                (Default: None, no limit)
+            udf_output_compression:
+                Compress captured UDF script output logs with ``gzip`` or ``zstd``,
+                ``zstd`` requires Python 3.14+ or package ``zstandard``
+                (Default: None, no compression)
+            udf_output_max_bytes:
+                Store only the first number of bytes of UDF script output of every VM,
+                the rest is discarded
+                (Default: None, no limit)
+            udf_output_indexed:
+                Store UDF script output of all VMs of a statement in one indexed file
+                <session_id>_<statement_id>.udflog instead of one file per VM
+                (Default: False)
         """
 
         # convert all arguments to a dict[argument_name, argument_value]
@@ -273,6 +373,10 @@ class ExaConnection:
         self.last_stmt = None
         self.stmt_count = 0
 
+        self.last_http_stats: ExaHttpTransportStats | None = None
+        self._http_thread_pool: ExaHttpThreadPool | None = None
+        self._udf_output_server: ExaScriptOutputSelectorServer | None = None
+
         self.json_encode = None
         self.json_decode = None
 
@@ -281,6 +385,8 @@ class ExaConnection:
 
         self._init_format()
         self._init_json()
+        self._init_udf_output()
+        self._init_http_compression()
         self._init_ext()
         self._init_meta()
 
@@ -333,11 +439,15 @@ class ExaConnection:
         """
         return self.cls_statement(self, query, query_params)
 
-    def execute_sql_script(self, script: str) -> list[ExaStatement]:
+    def execute_sql_script(
+        self, script: str | TextIO | Iterable[str]
+    ) -> list[ExaStatement]:
         """
         Execute a SQL script containing one or more statements.
 
-        The script is split into statements before execution. Semicolons inside
+        The script may be a string, a text file object or an iterable of text chunks.
+        It is split lazily, so every statement is executed as soon as it is complete,
+        before the rest of the script is read and scanned. Semicolons inside
         string literals, quoted SQL identifiers, line comments, block comments,
         and Exasol script bodies do not terminate statements. Exasol script
         bodies are terminated by a standalone ``/`` line.
@@ -350,9 +460,15 @@ class ExaConnection:
         Query parameters are intentionally not supported for SQL scripts.
         Use :meth:`execute` for parameterized single statements.
         """
-        return [self.execute(statement) for statement in split_sql_script(script)]
+        return [self.execute(statement) for statement in iter_sql_script(script)]
 
-    def execute_udf_output(self, query: str, query_params: dict | None = None):
+    def execute_udf_output(
+        self,
+        query: str,
+        query_params: dict | None = None,
+        on_output: Callable[[int, Any], None] | None = None,
+        output_json: bool = False,
+    ):
         """
         Execute SQL query with UDF script, capture output
 
@@ -366,14 +482,32 @@ class ExaConnection:
                 SQL query text, possibly with placeholders
             query_params:
                 Values for placeholders
+            on_output:
+                Function called for every line of output while the statement is running,
+                with number of VM connection (same as number in the name of log file)
+                and line without line break. It is called in a separate thread. If it is
+                too slow, output of all VMs is throttled, not only of the VM producing
+                output, because one server thread reads output of all VMs. Exception
+                raised by this function is re-raised after the statement has finished.
+            output_json:
+                Decode every line passed to ``on_output`` as JSON. Lines which are not
+                valid JSON are passed as strings.
 
         Returns:
             Return tuple with two elements: (1) instance of :class:`pyexasol.ExaStatement`
-            and (2) list of :class:`Path` objects for script output log files.
+            and (2) list of :class:`Path` objects for script output log files, or list of
+            :class:`pyexasol.ExaScriptOutputLog` objects if ``udf_output_indexed``
+            connection option is enabled.
 
         Attention:
             Exasol should be able to open connection to the machine where current script is running
 
+        Note:
+            Script output TCP server runs in a background thread of the current process.
+            It is started by the first call and reused by all following calls until the
+            connection is closed. If the server fails, the error is logged and a new
+            server is started by the next call.
+
         Examples:
             >>> con = ExaConnection(...)
             >>> stmt, output_files = con.execute_udf_output(
@@ -381,25 +515,47 @@ class ExaConnection:
             ...        query_params={'table': 'users', 'col1':'bar'}
             ...)
         """
-        stmt_output_dir = self._get_stmt_output_dir()
-
-        script_output = ExaScriptOutputProcess(
-            (
-                self.options["udf_output_bind_address"][0]
-                if self.options["udf_output_bind_address"]
-                else None
-            ),
-            (
-                self.options["udf_output_bind_address"][1]
-                if self.options["udf_output_bind_address"]
-                else None
-            ),
-            stmt_output_dir,
-        )
+        # Server is replaced if it was stopped by an unexpected error of previous call
+        if self._udf_output_server is None or self._udf_output_server.is_closed:
+            bind_address = self.options["udf_output_bind_address"]
+
+            self._udf_output_server = ExaScriptOutputSelectorServer(
+                bind_address[0] if bind_address else None,
+                bind_address[1] if bind_address else None,
+                logger=self.logger,
+            )
+
+        script_output = self._udf_output_server
+        storage = self._get_udf_output_storage()
+        dispatcher = None
+
+        if on_output is not None:
+            dispatcher = ExaScriptOutputDispatcher(
+                on_output, self.json_decode if output_json else None
+            )
 
         try:
-            script_output.start()
+            script_output.start_statement(storage, dispatcher)
+            stmt = self._execute_udf_output_query(script_output, query, query_params)
+        finally:
+            try:
+                log_files = storage.close()
+            finally:
+                if dispatcher is not None:
+                    dispatcher.close()
 
+        if dispatcher is not None and dispatcher.exc is not None:
+            raise dispatcher.exc
+
+        return stmt, log_files
+
+    def _execute_udf_output_query(
+        self,
+        script_output: ExaScriptOutputSelectorServer,
+        query: str,
+        query_params: dict | None,
+    ) -> ExaStatement:
+        try:
             # This option is useful to get around complex network setups, like Exasol running in Docker containers
             if self.options["udf_output_connect_address"]:
                 address = f"{self.options['udf_output_connect_address'][0]}:{self.options['udf_output_connect_address'][1]}"
@@ -412,22 +568,14 @@ class ExaConnection:
             )
 
             stmt = self.execute(query, query_params)
-            log_files = sorted(stmt_output_dir.glob("*.log"))
-
-            if len(log_files) > 0:
-                script_output.join_with_exc()
-            else:
-                # In some cases Exasol does not run any VM's even when UDF scripts are being called
-                # In this case we must terminate TCP server, since it won't stop automatically
-                script_output.terminate()
-                script_output.join()
-        except ExaQueryError:
-            script_output.terminate()
-            script_output.join()
-
+        except BaseException:
+            script_output.abort_statement()
             raise
 
-        return stmt, log_files
+        # Server is not stopped, it is reused by the next statements of this connection
+        script_output.finish_statement()
+
+        return stmt
 
     def commit(self):
         """Wrapper for query 'COMMIT'"""
@@ -604,6 +752,65 @@ class ExaConnection:
             export_params,
         )
 
+    def export_to_pandas_chunks(
+        self,
+        query_or_table: str,
+        chunksize: int = constant.DEFAULT_EXPORT_CHUNKSIZE,
+        query_params: dict | None = None,
+        callback_params: dict | None = None,
+        export_params: dict | None = None,
+    ) -> Iterator["pandas.DataFrame"]:
+        """
+        Export large amount of data from Exasol to a sequence of :class:`pandas.DataFrame` chunks.
+
+        Args:
+            query_or_table:
+                SQL query or table from which to export data.
+            chunksize:
+                Maximum number of rows in every yielded chunk
+                (Default: 100000)
+            query_params:
+                Values for SQL query placeholders.
+            callback_params:
+                Dictionary with additional parameters for callback function
+                `pandas.read_csv <https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.read_csv.html>`__.
+            export_params:
+                 Custom parameters for EXPORT query.
+
+        Yields:
+            instances of :class:`pandas.DataFrame` with up to ``chunksize`` rows each
+
+        Note:
+            Chunks are yielded while the HTTP transport is still receiving data, so
+            only a few chunks are held in memory at any time. If the consumer is slower
+            than Exasol, the pipe between the HTTP thread and the consumer fills up
+            and Exasol pauses sending data until the consumer catches up.
+
+            If the generator is closed before it was exhausted, the EXPORT query
+            is aborted.
+
+        Examples:
+            >>> con = ExaConnection(...)
+            >>> for df in con.export_to_pandas_chunks(
+            ...    query_or_table="SELECT * FROM table",
+            ...    chunksize=50000,
+            ... ):
+            ...    process(df)
+        """
+        export_params = {**(export_params or {}), "with_column_names": True}
+
+        if callback_params is None:
+            callback_params = {}
+
+        return self._export_to_iterator(
+            cb.export_to_pandas_chunks,
+            None,
+            query_or_table,
+            query_params,
+            {**callback_params, "chunksize": chunksize},
+            export_params,
+        )
+
     def export_to_parquet(
         self,
         dst: Path | str,
@@ -679,6 +886,88 @@ class ExaConnection:
             export_params,
         )
 
+    def export_to_parquet_parallel(
+        self,
+        dst: Path | str,
+        query_or_table: str,
+        pool_size: int | None = None,
+        query_params: dict | None = None,
+        callback_params: dict | None = None,
+        export_params: dict | None = None,
+    ) -> None:
+        """
+        Export large amounts of data from Exasol to local parquet file(s) using one
+        HTTP transport tunnel per Exasol node.
+
+        Every tunnel is decoded and written by its own worker thread. Files of every
+        worker are prefixed with a unique worker number, so workers never write into
+        the same file, even when the output is partitioned.
+
+        Args:
+            dst:
+                Local path to directory for exporting files. Same requirements apply
+                as for :meth:`export_to_parquet`.
+            query_or_table:
+                SQL query or table from which to export data.
+            pool_size:
+                Number of parallel tunnels and workers. By default, one per active
+                Exasol node, see :meth:`get_nodes`.
+            query_params:
+                Values for SQL query placeholders.
+            callback_params:
+                Dictionary with additional parameters for callback function
+                `pyarrow.dataset.write_dataset <https://arrow.apache.org/docs/python/generated/pyarrow.dataset.write_dataset.html>`__,
+                e.g. ``partitioning`` and ``partitioning_flavor``.
+                ``existing_data_behavior="delete_matching"`` is not supported,
+                because workers would delete files of each other.
+            export_params:
+                Custom parameters for EXPORT query.
+
+        Note:
+            Column types are inferred for every stream independently. Pass
+            ``schema`` in ``callback_params`` if some streams may contain only NULL
+            values in some columns.
+        """
+        if not callback_params:
+            callback_params = {}
+
+        if not export_params:
+            export_params = {}
+
+        if callback_params.get("existing_data_behavior") == "delete_matching":
+            raise ValueError(
+                "`callback_params['existing_data_behavior']` 'delete_matching' is not supported for parallel export"
+            )
+
+        cb.check_export_to_parquet_directory_setting(
+            dst=dst, callback_params=callback_params
+        )
+
+        export_params["with_column_names"] = True
+
+        nodes = self.get_nodes(pool_size)
+        basename_template = callback_params.get("basename_template", "part-{i}.parquet")
+
+        worker_callback_params = [
+            {
+                **callback_params,
+                # Directory was checked above, workers add files next to each other
+                "existing_data_behavior": "overwrite_or_ignore",
+                "basename_template": f"{node['idx']:03}-{basename_template}",
+            }
+            for node in nodes
+        ]
+
+        self._export_to_callback_parallel(
+            cb.export_to_parquet,
+            dst,
+            query_or_table,
+            query_params,
+            worker_callback_params,
+            export_params,
+            nodes,
+        )
+
     def export_to_polars(
         self,
         query_or_table: str,
@@ -770,6 +1059,7 @@ class ExaConnection:
         table: str,
         callback_params: dict | None = None,
         import_params: dict | None = None,
+        method: str = "import",
     ):
         """
         Import a large amount of data from :class:`pandas.DataFrame`.
@@ -784,11 +1074,107 @@ class ExaConnection:
                 `pandas.DataFrame.to_csv <https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.to_csv.html>`__.
             import_params:
                 Custom parameters for IMPORT query.
+            method:
+                - ``"import"``: IMPORT query with HTTP transport
+                - ``"prepared"``: INSERT prepared statement, columns of the data frame
+                  are sent over the WebSocket connection without HTTP transport
+                - ``"auto"``: ``"prepared"`` if the data frame takes less than
+                  ``constant.PANDAS_PREPARED_IMPORT_MAX_BYTES`` bytes of memory according to
+                  ``DataFrame.memory_usage(deep=True)``, ``"import"`` otherwise or if any
+                  callback parameters or import parameters are given
+
+        Note:
+            ``"prepared"`` only supports the ``columns`` import parameter and no callback parameters.
+            It avoids the fixed cost of HTTP transport, which dominates for small and medium data frames.
+            Data is sent in chunks of ``constant.PANDAS_PREPARED_IMPORT_CHUNK_ROWS`` rows,
+            so unlike IMPORT it is not atomic if ``autocommit`` is enabled.
         """
+        if method not in ("import", "prepared", "auto"):
+            raise ValueError(f"Unsupported import method [{method}]")
+
+        if method == "auto":
+            method = self._choose_pandas_import_method(
+                src, callback_params, import_params
+            )
+
+        if method == "prepared":
+            if callback_params or not {"columns"}.issuperset(import_params or {}):
+                raise ValueError(
+                    "Method 'prepared' does not support callback parameters "
+                    "and import parameters other than 'columns'"
+                )
+
+            return self._import_from_pandas_prepared(
+                src, table, (import_params or {}).get("columns")
+            )
+
         return self.import_from_callback(
             cb.import_from_pandas, src, table, callback_params, import_params
         )
 
+    def _choose_pandas_import_method(
+        self,
+        src: "pandas.DataFrame",
+        callback_params: dict | None,
+        import_params: dict | None,
+    ) -> str:
+        import pandas
+
+        if callback_params or import_params or not isinstance(src, pandas.DataFrame):
+            return "import"
+
+        size = int(src.memory_usage(index=True, deep=True).sum())
+
+        if size < constant.PANDAS_PREPARED_IMPORT_MAX_BYTES:
+            return "prepared"
+
+        return "import"
+
+    def _import_from_pandas_prepared(
+        self, src: "pandas.DataFrame", table: str, columns: list[str] | None
+    ):
+        import pandas
+
+        from ._pandas_serializer import serialize_dataframe
+
+        if not isinstance(src, pandas.DataFrame):
+            raise ValueError("Data source is not pandas.DataFrame")
+
+        if len(src) == 0:
+            return
+
+        chunk_rows = constant.PANDAS_PREPARED_IMPORT_CHUNK_ROWS
+
+        stmt = self._prepare_insert(table, len(src.columns), columns)
+        try:
+            for pos in range(0, len(src), chunk_rows):
+                chunk = src.iloc[pos : pos + chunk_rows]
+                stmt._execute_prepared_columns(serialize_dataframe(chunk), len(chunk))
+        finally:
+            stmt.close()
+
+    def _prepare_insert(
+        self, table: str, num_values: int, columns: list[str] | None = None
+    ):
+        """
+        Prepare INSERT statement with ``num_values`` placeholders, shared by
+        :meth:`import_from_pandas` and :meth:`pyexasol.ExaExtension.insert_multi`
+        """
+        params = {
+            "table_name": self.format.default_format_ident(table),
+            "columns": "",
+            "values": ", ".join(["?"] * num_values),
+        }
+
+        if columns:
+            params["columns"] = (
+                f"({','.join([self.format.default_format_ident(c) for c in columns])})"
+            )
+
+        query = "INSERT INTO {table_name!r}{columns!r} VALUES ({values!r})"
+
+        return self.cls_statement(self, query, params, prepare=True)
+
     def import_from_polars(
         self,
         src: Union["polars.LazyFrame", "polars.DataFrame"],
@@ -836,6 +1222,8 @@ class ExaConnection:
             callback_params:
                 Dict with additional parameters for callback function
                 `parquet.ParquetFile.iter_batches <https://arrow.apache.org/docs/python/generated/pyarrow.parquet.ParquetFile.html#pyarrow.parquet.ParquetFile.iter_batches>`__.
+                Use ``max_workers`` to decode row groups of the next files in
+                a pool of threads while the current data is being sent.
             import_params:
                 Custom parameters for IMPORT query.
         """
@@ -843,6 +1231,40 @@ class ExaConnection:
             cb.import_from_parquet, source, table, callback_params, import_params
         )
 
+    def import_from_arrow(
+        self,
+        src,
+        table: str,
+        callback_params: dict | None = None,
+        import_params: dict | None = None,
+    ):
+        """
+        Import a large amount of data from any Arrow-compatible source using the Arrow CSV writer.
+
+        Args:
+            src:
+                Source :class:`pyarrow.Table`, :class:`pyarrow.RecordBatch`,
+                :class:`pyarrow.RecordBatchReader`, :class:`pandas.DataFrame`,
+                :class:`polars.DataFrame`, :class:`polars.LazyFrame` or any object
+                implementing ``__arrow_c_stream__``.
+            table:
+                Destination table for IMPORT.
+            callback_params:
+                Dict with additional parameters for
+                `pyarrow.csv.WriteOptions <https://arrow.apache.org/docs/python/generated/pyarrow.csv.WriteOptions.html>`__.
+                Use ``max_workers`` to convert record batches into CSV in a pool of
+                threads while the current data is being sent.
+            import_params:
+                Custom parameters for IMPORT query.
+
+        Note:
+            The source is converted and sent one record batch at a time,
+            so it is never converted into CSV as a whole.
+        """
+        return self.import_from_callback(
+            cb.import_from_arrow, src, table, callback_params, import_params
+        )
+
     def export_to_callback(
         self,
         callback: Callable,
@@ -896,6 +1318,39 @@ class ExaConnection:
         if callback_params is None:
             callback_params = {}
 
+        with self._export_pipe(query_or_table, query_params, export_params) as pipe:
+            return callback(pipe, dst, **callback_params)
+
+    def _export_to_iterator(
+        self,
+        callback: Callable,
+        dst,
+        query_or_table: str,
+        query_params: dict | None = None,
+        callback_params: dict | None = None,
+        export_params: dict | None = None,
+    ) -> Iterator:
+        """
+        Same as :meth:`export_to_callback`, but for callbacks returning an iterator.
+        Items are passed to the caller while the EXPORT query is still running.
+        """
+        if callback_params is None:
+            callback_params = {}
+
+        with self._export_pipe(query_or_table, query_params, export_params) as pipe:
+            yield from callback(pipe, dst, **callback_params)
+
+    @contextlib.contextmanager
+    def _export_pipe(
+        self,
+        query_or_table: str,
+        query_params: dict | None = None,
+        export_params: dict | None = None,
+    ) -> Iterator:
+        """
+        Run EXPORT query and HTTP transport in background threads, yield the pipe
+        with exported data. Threads are stopped if the caller fails or stops reading early.
+        """
         if export_params is None:
             export_params = {}
 
@@ -906,12 +1361,7 @@ class ExaConnection:
             False if ("format" in export_params) else self.options["compression"]
         )
 
-        http_thread = ExaHttpThread(
-            self.ws_ipaddr,  # type: ignore
-            self.ws_port,  # type: ignore
-            compression,
-            self.options["encryption"],
-        )
+        http_thread = self._create_http_thread(compression)
         sql_thread = ExaSQLExportThread(
             self, compression, query_or_table, export_params
         )
@@ -923,29 +1373,174 @@ class ExaConnection:
             sql_thread.start()
 
             with http_thread.read_pipe as pipe:
-                result = callback(pipe, dst, **callback_params)
+                yield pipe
 
             http_thread.join_with_exc()
             sql_thread.join_with_exc()
 
-            return result
+        except GeneratorExit:
+            # Consumer stopped iterating early, remaining data is not needed
+            self._stop_export_threads(http_thread, sql_thread)
+            raise
 
         except (Exception, KeyboardInterrupt) as ex:
-            http_thread.terminate()
-            http_thread.join()
-
-            sql_thread.join(1)
-
-            # Prevent infinite lock if SQL query is still running
-            if sql_thread.is_alive():
-                self.abort_query()
-                sql_thread.join()
+            self._stop_export_threads(http_thread, sql_thread)
 
             raise ExaExportError(
                 connection=self,
                 exceptions=(ex, http_thread.exc, sql_thread.exc),
             ) from ex
 
+    def _create_http_thread(self, compression: bool) -> ExaHttpThread:
+        if self.options["http_pool_size"]:
+            if self._http_thread_pool is None:
+                self._http_thread_pool = ExaHttpThreadPool(
+                    self.ws_ipaddr,  # type: ignore
+                    self.ws_port,  # type: ignore
+                    self.options["http_pool_size"],
+                    self.options["encryption"],
+                    logger=self.logger,
+                    **self._http_thread_options(),
+                )
+
+            http_thread = self._http_thread_pool.acquire(compression)
+        else:
+            http_thread = ExaHttpThread(
+                self.ws_ipaddr,  # type: ignore
+                self.ws_port,  # type: ignore
+                compression,
+                self.options["encryption"],
+                **self._http_thread_options(),
+            )
+
+        self.last_http_stats = http_thread.stats
+        return http_thread
+
+    def _http_thread_options(self) -> dict:
+        return {
+            "compression_level": self.options["http_compression_level"],
+            "compression_threads": self.options["http_compression_threads"],
+            "progress": self.options["http_progress"],
+            "progress_interval": self.options["http_progress_interval"],
+            "max_bytes_per_sec": self.options["http_max_bytes_per_sec"],
+        }
+
+    def _stop_export_threads(self, http_thread, sql_thread):
+        http_thread.terminate()
+        http_thread.join()
+
+        sql_thread.join(1)
+
+        # Prevent infinite lock if SQL query is still running
+        if sql_thread.is_alive():
+            self.abort_query()
+            sql_thread.join()
+
+    def _export_to_callback_parallel(
+        self,
+        callback: Callable,
+        dst,
+        query_or_table: str,
+        query_params: dict | None,
+        worker_callback_params: list[dict],
+        export_params: dict | None,
+        nodes: list[dict],
+    ) -> list:
+        """
+        Run one EXPORT query into one HTTP transport tunnel per node.
+        Every tunnel is consumed by its own worker thread running the callback function
+        with the respective element of `worker_callback_params`.
+        """
+        if export_params is None:
+            export_params = {}
+
+        if query_params is not None:
+            query_or_table = self.format.format(query_or_table, **query_params)
+
+        compression = (
+            False if ("format" in export_params) else self.options["compression"]
+        )
+
+        http_threads: list[ExaHttpThread] = []
+        sql_thread = ExaSQLExportThread(
+            self, compression, query_or_table, export_params
+        )
+
+        def run_callback(http_thread: ExaHttpThread, callback_params: dict):
+            with http_thread.read_pipe as pipe:
+                return callback(pipe, dst, **callback_params)
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(nodes), thread_name_prefix="pyexasol-export"
+        ) as executor:
+            try:
+                for node in nodes:
+                    http_threads.append(
+                        ExaHttpThread(
+                            node["ipaddr"],
+                            node["port"],
+                            compression,
+                            self.options["encryption"],
+                            **self._http_thread_options(),
+                        )
+                    )
+
+                for http_thread in http_threads:
+                    http_thread.start()
+
+                sql_thread.set_http_threads(http_threads)
+                sql_thread.start()
+
+                futures = [
+                    executor.submit(run_callback, http_thread, callback_params)
+                    for http_thread, callback_params in zip(
+                        http_threads, worker_callback_params
+                    )
+                ]
+
+                # Fail fast if any callback function raises an exception
+                concurrent.futures.wait(
+                    futures, return_when=concurrent.futures.FIRST_EXCEPTION
+                )
+                result = [future.result() for future in futures]
+
+                for http_thread in http_threads:
+                    http_thread.join_with_exc()
+
+                sql_thread.join_with_exc()
+
+                return result
+
+            except (Exception, KeyboardInterrupt) as ex:
+                for http_thread in http_threads:
+                    http_thread.terminate()
+
+                for http_thread in http_threads:
+                    if http_thread.is_alive():
+                        http_thread.join()
+
+                if sql_thread.is_alive():
+                    sql_thread.join(1)
+
+                    # Prevent infinite lock if SQL query is still running
+                    if sql_thread.is_alive():
+                        self.abort_query()
+                        sql_thread.join()
+
+                raise ExaExportError(
+                    connection=self,
+                    exceptions=(
+                        ex,
+                        *(http_thread.exc for http_thread in http_threads),
+                        sql_thread.exc,
+                    ),
+                ) from ex
+
+            finally:
+                self.last_http_stats = ExaHttpTransportStats.merge(
+                    http_thread.stats for http_thread in http_threads
+                )
+
     def import_from_callback(
         self,
         callback: Callable,
@@ -987,12 +1582,7 @@ class ExaConnection:
             False if ("format" in import_params) else self.options["compression"]
         )
 
-        http_thread = ExaHttpThread(
-            self.ws_ipaddr,  # type: ignore
-            self.ws_port,  # type: ignore
-            compression,
-            self.options["encryption"],
-        )
+        http_thread = self._create_http_thread(compression)
         sql_thread = ExaSQLImportThread(self, compression, table, import_params)
 
         try:
@@ -1153,6 +1743,23 @@ class ExaConnection:
 
         return self.last_stmt
 
+    def last_http_transport_stats(self) -> ExaHttpTransportStats:
+        """
+        Throughput and backpressure statistics of the last HTTP transport
+
+        Returns:
+            ExaHttpTransportStats: statistics of the last `export_*` or `import_*` call,
+            combined for all HTTP transport threads of parallel exports.
+
+        Tip:
+            Compare ``pipe_wait_time`` with ``socket_wait_time`` to find out if
+            the callback function or Exasol server is the bottleneck.
+        """
+        if self.last_http_stats is None:
+            raise ExaRuntimeError(self, "Last HTTP transport not found")
+
+        return self.last_http_stats
+
     def close(self, disconnect=True):
         """
         Closes connection to database.
@@ -1172,6 +1779,14 @@ class ExaConnection:
             self.logger.debug("[WebSocket connection close]")
             self._ws.close()
 
+        if self._http_thread_pool is not None:
+            self._http_thread_pool.close()
+            self._http_thread_pool = None
+
+        if self._udf_output_server is not None:
+            self._udf_output_server.close()
+            self._udf_output_server = None
+
         self.is_closed = True
         self.last_stmt = None
 
@@ -1724,31 +2339,62 @@ class ExaConnection:
         else:
             raise ValueError(f"Unsupported json library [{self.options['json_lib']}]")
 
+    def _init_udf_output(self):
+        check_udf_output_compression(self.options["udf_output_compression"])
+
+    def _init_http_compression(self):
+        level = self.options["http_compression_level"]
+        threads = self.options["http_compression_threads"]
+
+        # Invalid values would only fail later in HTTP transport thread
+        if not isinstance(level, int) or not -1 <= level <= 9:
+            raise ValueError(
+                f"HTTP compression level must be an integer from -1 to 9, got {level!r}"
+            )
+
+        if not isinstance(threads, int) or threads < 1:
+            raise ValueError(
+                f"Number of HTTP compression threads must be a positive integer, got {threads!r}"
+            )
+
     def _init_ext(self):
         self.ext = self.cls_extension(self)
 
     def _init_meta(self):
         self.meta = self.cls_meta(self)
 
-    def _get_stmt_output_dir(self) -> Path:
+    def _get_udf_output_storage(
+        self,
+    ) -> ExaScriptOutputDirStorage | ExaScriptOutputIndexedStorage:
         import pathlib
         import tempfile
 
         if self.options["udf_output_dir"]:
-            base_output_dir = self.options["udf_output_dir"]
+            base_output_dir = pathlib.Path(self.options["udf_output_dir"])
         else:
-            base_output_dir = tempfile.gettempdir()
+            base_output_dir = pathlib.Path(tempfile.gettempdir())
 
-        # Create unique subdirectory for every statement of every session
+        # Unique subdirectory or file for every statement of every session
         self._udf_output_count += 1
+        stmt_output_name = f"{self.session_id()}_{self._udf_output_count}"
 
-        stmt_output_dir = (
-            pathlib.Path(base_output_dir)
-            / f"{self.session_id()}_{self._udf_output_count}"
-        )
+        if self.options["udf_output_indexed"]:
+            base_output_dir.mkdir(parents=True, exist_ok=True)
+
+            return ExaScriptOutputIndexedStorage(
+                base_output_dir / f"{stmt_output_name}.udflog",
+                self.options["udf_output_compression"],
+                self.options["udf_output_max_bytes"],
+            )
+
+        stmt_output_dir = base_output_dir / stmt_output_name
         stmt_output_dir.mkdir(parents=True, exist_ok=True)
 
-        return stmt_output_dir
+        return ExaScriptOutputDirStorage(
+            stmt_output_dir,
+            self.options["udf_output_compression"],
+            self.options["udf_output_max_bytes"],
+        )
 
     def __repr__(self):
         return (
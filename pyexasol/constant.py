@@ -10,8 +10,49 @@ DEFAULT_SOCKET_TIMEOUT = 30
 DEFAULT_QUERY_TIMEOUT = 0
 
 DEFAULT_FETCHMANY_SIZE = 10000
+DEFAULT_EXPORT_CHUNKSIZE = 100000
 DEFAULT_FETCH_SIZE_BYTES = 5 * 1024 * 1024
 
+DEFAULT_META_CACHE_MAX_ENTRIES = 1000
+
+# Maximum number of compiled query templates cached by ExaFormatter
+FORMATTER_TEMPLATE_CACHE_SIZE = 1024
+
+# Size of chunks read from file objects by the SQL script splitter
+SQL_SCRIPT_READ_SIZE = 1024 * 1024
+
+# Buffer sizes of in-process UDF script output server, write buffer is allocated per VM connection
+UDF_OUTPUT_READ_SIZE = 64 * 1024
+UDF_OUTPUT_WRITE_BUFFER_SIZE = 32 * 1024
+
+# Maximum number of UDF output lines waiting for on_output callback, server stops reading when it is full
+UDF_OUTPUT_QUEUE_SIZE = 10000
+# Longer UDF output lines are split
+UDF_OUTPUT_MAX_LINE_SIZE = 1024 * 1024
+# Compression level of UDF output with udf_output_compression="gzip", favours speed over ratio
+UDF_OUTPUT_GZIP_LEVEL = 6
+
+# Maximum number of cached row classes generated for distinct lists of column names
+ROW_CLASS_CACHE_SIZE = 256
+
+# Same as zlib.Z_DEFAULT_COMPRESSION
+DEFAULT_HTTP_COMPRESSION_LEVEL = -1
+DEFAULT_HTTP_COMPRESSION_THREADS = 1
+DEFAULT_HTTP_PROGRESS_INTERVAL = 64 * 1024 * 1024
+DEFAULT_HTTP_POOL_MAX_IDLE_TIME = 60
+
+# Number of rows of pandas.DataFrame sent by one request of INSERT prepared statement
+PANDAS_PREPARED_IMPORT_CHUNK_ROWS = 10000
+
+# Memory usage of pandas.DataFrame below which import_from_pandas(method="auto") uses
+# INSERT prepared statement instead of IMPORT. Conservative estimate, to be adjusted with
+# test/performance/connection/import_pandas_method_performance_test.py
+PANDAS_PREPARED_IMPORT_MAX_BYTES = 1024 * 1024
+
+# Temporary certificate shared by tunnels of HTTP transport pool is valid for 365 days,
+# it is regenerated long before expiration
+HTTP_ADHOC_CERTIFICATE_MAX_AGE = 24 * 60 * 60
+
 DRIVER_NAME = "PyExasol"
 
 LOGGER_FILENAME_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S_%f"
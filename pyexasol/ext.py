@@ -47,13 +47,7 @@ class ExaExtension:
         Note:
             It relies on a prepared statement that will be closed immediately without execution
         """
-        stmt = self.connection.cls_statement(
-            self.connection, query, query_params, prepare=True
-        )
-        columns = stmt.columns()
-        stmt.close()
-
-        return columns
+        return self.connection.meta.sql_columns(query, query_params)
 
     def insert_multi(self, table_name, data, columns=None):
         """
@@ -91,22 +85,7 @@ class ExaExtension:
                 "At least one row of data is required for insert_multi()",
             )
 
-        params = {
-            "table_name": self.connection.format.default_format_ident(table_name),
-            "columns": "",
-            "values": ", ".join(["?"] * len(data[0])),
-        }
-
-        if columns:
-            params["columns"] = (
-                f"({','.join([self.connection.format.default_format_ident(c) for c in columns])})"
-            )
-
-        query = "INSERT INTO {table_name!r}{columns!r} VALUES ({values!r})"
-
-        stmt = self.connection.cls_statement(
-            self.connection, query, params, prepare=True
-        )
+        stmt = self.connection._prepare_insert(table_name, len(data[0]), columns)
         stmt.execute_prepared(data)
         stmt.close()
 
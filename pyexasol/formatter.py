@@ -1,6 +1,74 @@
+import decimal
+import functools
 import re
 import string
 
+from . import constant
+
+# Methods of string.Formatter, which are bypassed by compiled templates
+_FORMATTER_HOOKS = (
+    "parse",
+    "get_field",
+    "get_value",
+    "convert_field",
+    "format_field",
+    "check_unused_args",
+)
+
+
+@functools.lru_cache(maxsize=constant.FORMATTER_TEMPLATE_CACHE_SIZE)
+def _compile_template(format_string: str) -> tuple[tuple[str, ...], tuple[tuple, ...]]:
+    """
+    Split template into literal segments and fields, cached by template string.
+
+    Returns ``N+1`` literals and ``N`` fields. Every field is a tuple of
+    (key, conversion, complex field name). Key is ``int`` for positional arguments
+    and ``str`` for keyword arguments. Complex field names (e.g. ``a.b`` or ``a[0]``)
+    are resolved with :meth:`string.Formatter.get_field` instead of key.
+    """
+    literals = [""]
+    fields = []
+    auto_idx = 0
+    is_manual = False
+
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(
+        format_string
+    ):
+        literals[-1] += literal
+
+        if field_name is None:
+            continue
+
+        if format_spec:
+            raise ValueError("format_spec is disabled for ExaFormatter")
+
+        first, rest = field_name, ""
+        for idx, char in enumerate(field_name):
+            if char in ".[":
+                first, rest = field_name[:idx], field_name[idx:]
+                break
+
+        if first == "":
+            if is_manual:
+                raise ValueError(
+                    "cannot switch from manual field specification to automatic field numbering"
+                )
+            first = str(auto_idx)
+            field_name = first + rest
+            auto_idx += 1
+        elif first.isdigit():
+            if auto_idx:
+                raise ValueError(
+                    "cannot switch from automatic field numbering to manual field specification"
+                )
+            is_manual = True
+
+        key = int(first) if first.isdigit() else first
+        fields.append((key, conversion, field_name if rest else None))
+        literals.append("")
+
+    return tuple(literals), tuple(fields)
+
 
 class ExaFormatter(string.Formatter):
     """
@@ -24,6 +92,15 @@ class ExaFormatter(string.Formatter):
     safe_decimal_regexp = re.compile(r"^(\+|-)?[0-9]+(\.[0-9]+)?$")
     safe_float_regexp = re.compile(r"^(\+|-)?[0-9]+(\.[0-9]+((e|E)(\+|-)[0-9]+)?)?$")
 
+    # Same as above for values joined with ", ", used to validate lists in one pass
+    safe_decimal_list_regexp = re.compile(
+        r"(\+|-)?[0-9]+(\.[0-9]+)?(, (\+|-)?[0-9]+(\.[0-9]+)?)*"
+    )
+    safe_float_list_regexp = re.compile(
+        r"(\+|-)?[0-9]+(\.[0-9]+((e|E)(\+|-)[0-9]+)?)?"
+        r"(, (\+|-)?[0-9]+(\.[0-9]+((e|E)(\+|-)[0-9]+)?)?)*"
+    )
+
     def __init__(self, connection):
         self.connection = connection
 
@@ -37,6 +114,13 @@ class ExaFormatter(string.Formatter):
         }
 
         self.default_conversion = "s"
+        self.max_list_size = self.connection.options.get("format_max_list_size")
+
+        # Compiled templates are used only if string.Formatter hooks were not customized
+        self.is_compiled = all(
+            getattr(type(self), name) is getattr(ExaFormatter, name)
+            for name in _FORMATTER_HOOKS
+        )
 
         # Set default treatment for identifiers passed as strings to relevant functions
         if self.connection.options["quote_ident"]:
@@ -54,6 +138,38 @@ class ExaFormatter(string.Formatter):
                 str.upper
             )  # Identifier values will be transformed to upper-case
 
+    def vformat(self, format_string, args, kwargs):
+        if not self.is_compiled:
+            return super().vformat(format_string, args, kwargs)
+
+        literals, fields = _compile_template(format_string)
+        conversions = self.conversions
+        parts = [literals[0]]
+
+        for (key, conversion, field_name), literal in zip(fields, literals[1:]):
+            if field_name is not None:
+                value = self.get_field(field_name, args, kwargs)[0]
+            elif isinstance(key, int):
+                value = args[key]
+            else:
+                value = kwargs[key]
+
+            converter = conversions.get(conversion or self.default_conversion)
+
+            if converter is None:
+                raise ValueError(f"Unknown conversion {conversion}")
+
+            if isinstance(value, list):
+                parts.append(
+                    self._convert_list(value, conversion or self.default_conversion)
+                )
+            else:
+                parts.append(converter(value))
+
+            parts.append(literal)
+
+        return "".join(parts)
+
     def format_field(self, value, format_spec):
         if format_spec != "":
             raise ValueError("format_spec is disabled for ExaFormatter")
@@ -68,12 +184,68 @@ class ExaFormatter(string.Formatter):
             raise ValueError(f"Unknown conversion {conversion}")
 
         if isinstance(value, list):
-            if not value:
-                raise ValueError("Trying to format an empty list")
-            return ", ".join([self.conversions[conversion](v) for v in value])
+            return self._convert_list(value, conversion)
         else:
             return self.conversions[conversion](value)
 
+    def _convert_list(self, values, conversion):
+        if not values:
+            raise ValueError("Trying to format an empty list")
+
+        if self.max_list_size is not None and len(values) > self.max_list_size:
+            raise ValueError(
+                f"Trying to format a list of {len(values)} values, maximum is {self.max_list_size}. "
+                f"Please import values into a table and use JOIN or sub-query instead."
+            )
+
+        converter = self.conversions[conversion]
+        bulk_converter = _BULK_CONVERTERS.get(getattr(converter, "__func__", None))
+
+        # Bulk converter returns None if values are not homogeneous or not valid
+        if bulk_converter is not None:
+            result = bulk_converter(self, values)
+
+            if result is not None:
+                return result
+
+        return ", ".join([converter(v) for v in values])
+
+    def _bulk_quote(self, values):
+        if set(map(type, values)) != {str}:
+            return None
+
+        joined = "', '".join(values)
+
+        # Escape values only if at least one value contains a single quote
+        if joined.count("'") != 2 * (len(values) - 1):
+            joined = "', '".join([v.replace("'", "''") for v in values])
+
+        return f"'{joined}'"
+
+    def _bulk_safe_decimal(self, values):
+        types = set(map(type, values))
+
+        # Result of str() is always safe for int, but not for subclasses (e.g. bool)
+        if types == {int}:
+            return ", ".join(map(str, values))
+
+        if types <= {int, decimal.Decimal}:
+            joined = ", ".join(map(str, values))
+
+            if self.safe_decimal_list_regexp.fullmatch(joined):
+                return joined
+
+        return None
+
+    def _bulk_safe_float(self, values):
+        if set(map(type, values)) <= {int, float}:
+            joined = ", ".join(map(str, values))
+
+            if self.safe_float_list_regexp.fullmatch(joined):
+                return joined
+
+        return None
+
     @classmethod
     def escape(cls, val):
         """
@@ -238,3 +410,11 @@ class ExaFormatter(string.Formatter):
 
     def __repr__(self):
         return f"<{self.__class__.__name__} session_id={self.connection.session_id()}>"
+
+
+# Bulk converters are used only if converter was not overridden in subclass
+_BULK_CONVERTERS = {
+    ExaFormatter.quote.__func__: ExaFormatter._bulk_quote,
+    ExaFormatter.safe_decimal.__func__: ExaFormatter._bulk_safe_decimal,
+    ExaFormatter.safe_float.__func__: ExaFormatter._bulk_safe_float,
+}
@@ -1,25 +1,149 @@
 from __future__ import annotations
 
+import collections
+import concurrent.futures
 import hashlib
+import logging
 import os
+import queue
 import re
+import select
 import socket
 import socketserver
 import struct
 import sys
 import threading
+import time
 import zlib
-from collections.abc import Iterable
-from dataclasses import dataclass
+from collections.abc import (
+    Callable,
+    Iterable,
+)
+from dataclasses import (
+    dataclass,
+    field,
+)
 from ssl import SSLContext
 from typing import TYPE_CHECKING
 
 from packaging.version import Version
 
+from . import constant
+
 if TYPE_CHECKING:
     from pyexasol import ExaConnection
 
 
+@dataclass
+class ExaHttpTransportStats:
+    """
+    Throughput and backpressure statistics of HTTP transport.
+
+    All times are in seconds, measured from start of HTTP transport thread.
+
+    Attributes:
+        wire_bytes:
+            Payload bytes sent or received over network, compressed if compression is enabled
+        data_bytes:
+            Bytes read from or written into the callback pipe, uncompressed
+        chunks:
+            Number of HTTP chunks sent or received
+        pipe_wait_time:
+            Time blocked on the callback pipe. High value means that callback function
+            is slow to consume (EXPORT) or to produce (IMPORT) data
+        socket_wait_time:
+            Time blocked on the network socket. High value means that Exasol server
+            or network is slow
+        time_to_first_byte:
+            Time until the first chunk was sent or received
+        total_time:
+            Total time of HTTP transport thread
+    """
+
+    wire_bytes: int = 0
+    data_bytes: int = 0
+    chunks: int = 0
+    pipe_wait_time: float = 0.0
+    socket_wait_time: float = 0.0
+    time_to_first_byte: float | None = None
+    total_time: float | None = None
+    start_time: float = field(default_factory=time.perf_counter, repr=False)
+
+    @property
+    def compression_ratio(self) -> float | None:
+        """Ratio of uncompressed to compressed bytes, 1.0 without compression"""
+        if not self.wire_bytes:
+            return None
+
+        return self.data_bytes / self.wire_bytes
+
+    def add_chunk(self, chunk_len: int) -> None:
+        if self.time_to_first_byte is None:
+            self.time_to_first_byte = time.perf_counter() - self.start_time
+
+        self.chunks += 1
+        self.wire_bytes += chunk_len
+
+    def finish(self) -> None:
+        self.total_time = time.perf_counter() - self.start_time
+
+    @classmethod
+    def merge(
+        cls, stats_list: Iterable[ExaHttpTransportStats]
+    ) -> ExaHttpTransportStats:
+        """
+        Combine statistics of HTTP transport threads running in parallel.
+        Bytes, chunks and wait times are summed up, other times are taken from
+        the earliest first byte and from the slowest thread.
+        """
+        stats_list = list(stats_list)
+        first_bytes = [
+            s.time_to_first_byte for s in stats_list if s.time_to_first_byte is not None
+        ]
+        total_times = [s.total_time for s in stats_list if s.total_time is not None]
+
+        return cls(
+            wire_bytes=sum(s.wire_bytes for s in stats_list),
+            data_bytes=sum(s.data_bytes for s in stats_list),
+            chunks=sum(s.chunks for s in stats_list),
+            pipe_wait_time=sum(s.pipe_wait_time for s in stats_list),
+            socket_wait_time=sum(s.socket_wait_time for s in stats_list),
+            time_to_first_byte=min(first_bytes, default=None),
+            total_time=max(total_times, default=None),
+            start_time=min(
+                (s.start_time for s in stats_list), default=time.perf_counter()
+            ),
+        )
+
+
+class ExaTokenBucket:
+    """
+    Token bucket limiting throughput of HTTP transport to `rate` bytes per second.
+    Short bursts up to `rate` bytes are allowed.
+    """
+
+    def __init__(self, rate: int):
+        if rate <= 0:
+            raise ValueError(f"Rate must be a positive number, got {rate}")
+
+        self.rate = rate
+        self.tokens = float(rate)
+        self.timestamp = time.monotonic()
+
+    def consume(self, amount: int) -> None:
+        """
+        Take `amount` tokens from bucket, block until they are available
+        """
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.timestamp) * self.rate)
+        self.timestamp = now
+
+        self.tokens -= amount
+
+        if self.tokens < 0:
+            time.sleep(-self.tokens / self.rate)
+
+
 @dataclass
 class SqlQuery:
     connection: ExaConnection
@@ -303,15 +427,20 @@ class ExaSQLThread(threading.Thread):
         self.compression = compression
 
         self.params: dict = {}
-        self.http_thread = None
+        self.http_threads: list[ExaHttpThread] = []
         self.exa_address_list: list[str] = []
         self.exc = None
 
         super().__init__()
 
     def set_http_thread(self, http_thread):
-        self.http_thread = http_thread
-        self.exa_address_list = [http_thread.exa_address]
+        self.set_http_threads([http_thread])
+
+    def set_http_threads(self, http_threads):
+        self.http_threads = http_threads
+        self.exa_address_list = [
+            http_thread.exa_address for http_thread in http_threads
+        ]
 
     def set_exa_address_list(self, exa_address_list):
         self.exa_address_list = exa_address_list
@@ -322,9 +451,9 @@ class ExaSQLThread(threading.Thread):
         except BaseException as e:
             self.exc = e
 
-            # In case of SQL error stop HTTP server, close pipes and interrupt I/O in callback function
-            if self.http_thread:
-                self.http_thread.terminate()
+            # In case of SQL error stop HTTP servers, close pipes and interrupt I/O in callback functions
+            for http_thread in self.http_threads:
+                http_thread.terminate()
 
     def run_sql(self):
         pass
@@ -354,6 +483,14 @@ class ExaSQLExportThread(ExaSQLThread):
         self.query_or_table = query_or_table
         self.params = export_params
 
+    def set_http_threads(self, http_threads):
+        super().set_http_threads(http_threads)
+
+        # Exasol writes CSV header line into every HTTP stream
+        if self.params.get("with_column_names"):
+            for http_thread in http_threads:
+                http_thread.server.progress_header_lines = 1
+
     def run_sql(self):
         if (
             isinstance(self.query_or_table, tuple)
@@ -414,12 +551,30 @@ class ExaHttpThread(threading.Thread):
     - https://pythonforthelab.com/blog/differences-between-multiprocessing-windows-and-linux/
     """
 
-    def __init__(self, ipaddr: str, port: int, compression: bool, encryption: bool):
+    def __init__(
+        self,
+        ipaddr: str,
+        port: int,
+        compression: bool,
+        encryption: bool,
+        compression_level: int = constant.DEFAULT_HTTP_COMPRESSION_LEVEL,
+        compression_threads: int = constant.DEFAULT_HTTP_COMPRESSION_THREADS,
+        progress: Callable[[int, int, float], None] | None = None,
+        progress_interval: int = constant.DEFAULT_HTTP_PROGRESS_INTERVAL,
+        max_bytes_per_sec: int | None = None,
+        ssl_context: tuple[SSLContext, str] | None = None,
+    ):
         self.server = ExaTCPServer(
             (ipaddr, port),
             ExaHttpRequestHandler,
             compression=compression,
             encryption=encryption,
+            compression_level=compression_level,
+            compression_threads=compression_threads,
+            progress=progress,
+            progress_interval=progress_interval,
+            max_bytes_per_sec=max_bytes_per_sec,
+            ssl_context=ssl_context,
         )
 
         self.read_pipe = self.server.read_pipe
@@ -429,6 +584,10 @@ class ExaHttpThread(threading.Thread):
 
         super().__init__()
 
+    @property
+    def stats(self) -> ExaHttpTransportStats:
+        return self.server.stats
+
     @property
     def exa_address(self) -> str:
         address = f"{self.server.exa_address_ipaddr}:{self.server.exa_address_port}"
@@ -442,11 +601,33 @@ class ExaHttpThread(threading.Thread):
             # Exit loop if thread was explicitly terminated prior to receiving HTTP request
             while self.server.total_clients == 0 and not self.server.is_terminated:
                 self.server.handle_request()
+
+            if self.server.handler_exc is not None:
+                raise self.server.handler_exc
+
+            if self.server.progress is not None and not self.server.is_terminated:
+                self.server.report_progress()
         except BaseException as e:
             self.exc = e
         finally:
+            self.server.stats.finish()
             self.server.server_close()
 
+    def is_stale(self) -> bool:
+        """
+        Tunnel of a thread which was not started yet was closed by Exasol server.
+        Exasol does not send any data before the HTTP request, so readable socket means EOF.
+        """
+        readable, _, _ = select.select([self.server.socket], [], [], 0)
+        return bool(readable)
+
+    def close(self):
+        """
+        Release tunnel and pipes of a thread which was not started
+        """
+        self.terminate()
+        self.server.server_close()
+
     def join(self, timeout=None):
         self.server.can_finish_get.set()
         super().join(timeout)
@@ -467,6 +648,141 @@ class ExaHttpThread(threading.Thread):
         self.read_pipe.close()
 
 
+class ExaHttpThreadPool:
+    """
+    Warm pool of HTTP transport tunnels to one Exasol node.
+
+    Exasol server closes the tunnel after exactly one HTTP request, so tunnels
+    cannot be reused. Instead, connection, tunnel handshake and TLS setup are done
+    in background ahead of the next IMPORT or EXPORT, so only the thread start
+    remains on the critical path.
+
+    Tunnels of the pool share one temporary certificate and RSA key, which is
+    regenerated every ``HTTP_ADHOC_CERTIFICATE_MAX_AGE`` seconds. Generation of the
+    key takes longer than the tunnel handshake itself.
+    """
+
+    def __init__(
+        self,
+        ipaddr: str,
+        port: int,
+        size: int,
+        encryption: bool,
+        max_idle_time: float = constant.DEFAULT_HTTP_POOL_MAX_IDLE_TIME,
+        logger: logging.Logger | None = None,
+        **thread_options,
+    ):
+        if size < 1:
+            raise ValueError(f"Pool size must be a positive integer, got {size}")
+
+        self.ipaddr = ipaddr
+        self.port = port
+        self.size = size
+        self.encryption = encryption
+        self.max_idle_time = max_idle_time
+        self.logger = logger
+        self.thread_options = thread_options
+
+        self.is_closed = False
+
+        self._ssl_context: tuple[SSLContext, str] | None = None
+        self._ssl_context_created_at = 0.0
+        self._ssl_context_lock = threading.Lock()
+
+        # Ready threads with timestamp of tunnel creation
+        self.ready: queue.SimpleQueue[tuple[ExaHttpThread, float]] = queue.SimpleQueue()
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="pyexasol_http_pool"
+        )
+
+        for _ in range(size):
+            self.executor.submit(self._fill)
+
+    def acquire(self, compression: bool) -> ExaHttpThread:
+        """
+        Return thread with established tunnel, create a new one if pool is empty.
+        Replacement is created in background.
+        """
+        if self.is_closed:
+            raise RuntimeError("HTTP transport pool is closed")
+
+        http_thread = None
+
+        while http_thread is None:
+            try:
+                candidate, created_at = self.ready.get_nowait()
+            except queue.Empty:
+                break
+
+            if (
+                time.monotonic() - created_at > self.max_idle_time
+                or candidate.is_stale()
+            ):
+                candidate.close()
+            else:
+                http_thread = candidate
+
+        self.executor.submit(self._fill)
+
+        if http_thread is None:
+            return self._create_thread(compression)
+
+        # Statistics must not include the time spent idle in pool
+        http_thread.server.compression = compression
+        http_thread.server.stats = ExaHttpTransportStats()
+
+        return http_thread
+
+    def close(self):
+        self.is_closed = True
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+        while True:
+            try:
+                http_thread, _ = self.ready.get_nowait()
+            except queue.Empty:
+                break
+
+            http_thread.close()
+
+    def _create_thread(self, compression: bool) -> ExaHttpThread:
+        return ExaHttpThread(
+            self.ipaddr,
+            self.port,
+            compression,
+            self.encryption,
+            ssl_context=self._get_ssl_context() if self.encryption else None,
+            **self.thread_options,
+        )
+
+    def _get_ssl_context(self) -> tuple[SSLContext, str]:
+        with self._ssl_context_lock:
+            if self._ssl_context is None or (
+                time.monotonic() - self._ssl_context_created_at
+                > constant.HTTP_ADHOC_CERTIFICATE_MAX_AGE
+            ):
+                self._ssl_context = ExaTCPServer.generate_adhoc_ssl_context()
+                self._ssl_context_created_at = time.monotonic()
+
+            return self._ssl_context
+
+    def _fill(self):
+        if self.is_closed or self.ready.qsize() >= self.size:
+            return
+
+        # Error is raised again by acquire() creating a thread directly if pool is empty
+        try:
+            http_thread = self._create_thread(compression=False)
+        except Exception as e:
+            if self.logger is not None:
+                self.logger.warning(
+                    f"Failed to establish HTTP transport tunnel in background: {e!r}"
+                )
+            return
+
+        self.ready.put((http_thread, time.monotonic()))
+
+
 class ExaHTTPTransportWrapper:
     """
     Wrapper for :ref:`http_transport_parallel`.
@@ -488,8 +804,23 @@ class ExaHTTPTransportWrapper:
         port: int,
         compression: bool = False,
         encryption: bool = True,
+        compression_level: int = constant.DEFAULT_HTTP_COMPRESSION_LEVEL,
+        compression_threads: int = constant.DEFAULT_HTTP_COMPRESSION_THREADS,
+        progress: Callable[[int, int, float], None] | None = None,
+        progress_interval: int = constant.DEFAULT_HTTP_PROGRESS_INTERVAL,
+        max_bytes_per_sec: int | None = None,
     ):
-        self.http_thread = ExaHttpThread(ipaddr, port, compression, encryption)
+        self.http_thread = ExaHttpThread(
+            ipaddr,
+            port,
+            compression,
+            encryption,
+            compression_level=compression_level,
+            compression_threads=compression_threads,
+            progress=progress,
+            progress_interval=progress_interval,
+            max_bytes_per_sec=max_bytes_per_sec,
+        )
         self.http_thread.start()
 
     @property
@@ -504,6 +835,13 @@ class ExaHTTPTransportWrapper:
         """
         return self.http_thread.exa_address
 
+    @property
+    def stats(self) -> ExaHttpTransportStats:
+        """
+        Throughput and backpressure statistics of HTTP transport.
+        """
+        return self.http_thread.stats
+
     def get_proxy(self):
         """
         Caution:
@@ -606,6 +944,39 @@ class ExaTCPServer(socketserver.TCPServer):
     def __init__(self, *args, **kwargs):
         self.compression: bool = kwargs.pop("compression", False)
         self.encryption: bool = kwargs.pop("encryption", True)
+        self.compression_level: int = kwargs.pop(
+            "compression_level", constant.DEFAULT_HTTP_COMPRESSION_LEVEL
+        )
+        self.compression_threads: int = kwargs.pop(
+            "compression_threads", constant.DEFAULT_HTTP_COMPRESSION_THREADS
+        )
+        # Temporary certificate for encryption, a new one is generated by default
+        self.ssl_context: tuple[SSLContext, str] | None = kwargs.pop(
+            "ssl_context", None
+        )
+
+        # Progress of uncompressed data, reported every `progress_interval` bytes
+        self.progress: Callable[[int, int, float], None] | None = kwargs.pop(
+            "progress", None
+        )
+        self.progress_interval: int = kwargs.pop(
+            "progress_interval", constant.DEFAULT_HTTP_PROGRESS_INTERVAL
+        )
+        self.progress_rows = 0
+        # CSV header line is not a row, it is set by EXPORT with column names
+        self.progress_header_lines = 0
+        self.next_progress_bytes = self.progress_interval
+
+        # Limit of network throughput
+        max_bytes_per_sec = kwargs.pop("max_bytes_per_sec", None)
+        self.rate_limiter = (
+            ExaTokenBucket(max_bytes_per_sec) if max_bytes_per_sec else None
+        )
+
+        self.stats = ExaHttpTransportStats()
+
+        # Error raised by request handler, e.g. by progress callback
+        self.handler_exc: BaseException | None = None
 
         r_fd, w_fd = os.pipe()
 
@@ -625,6 +996,26 @@ class ExaTCPServer(socketserver.TCPServer):
 
         super().__init__(*args, **kwargs)
 
+    def handle_error(self, request, client_address):
+        # Default implementation prints traceback and ignores the error,
+        # it is raised by HTTP thread instead to fail the transfer
+        self.handler_exc = sys.exc_info()[1]
+
+    def track_progress(self, data: bytes) -> None:
+        # Row count is based on line breaks, it is approximate if values contain line breaks
+        self.progress_rows += data.count(b"\n")
+
+        if self.stats.data_bytes >= self.next_progress_bytes:
+            self.report_progress()
+            self.next_progress_bytes = self.stats.data_bytes + self.progress_interval
+
+    def report_progress(self) -> None:
+        self.progress(
+            self.stats.data_bytes,
+            max(self.progress_rows - self.progress_header_lines, 0),
+            time.perf_counter() - self.stats.start_time,
+        )
+
     def server_bind(self):
         self.set_sock_opts()
 
@@ -637,7 +1028,9 @@ class ExaTCPServer(socketserver.TCPServer):
         self.exa_address_port = port
 
         if self.encryption:
-            context, public_key_sha = self.generate_adhoc_ssl_context()
+            context, public_key_sha = (
+                self.ssl_context or self.generate_adhoc_ssl_context()
+            )
             self.socket = context.wrap_socket(
                 self.socket, server_side=True, do_handshake_on_connect=False
             )
@@ -782,6 +1175,12 @@ class ExaHttpRequestHandler(socketserver.StreamRequestHandler):
         b"HTTP/1.1 500 Internal Server Error\r\n" b"Connection: close\r\n" b"\r\n"
     )
 
+    # Exasol server produces chunks of this size (without chunk header part)
+    get_chunk_size = 65524
+
+    # Size of uncompressed data in every gzip member compressed in a separate thread
+    compression_block_size = 1024 * 1024
+
     server: ExaTCPServer
 
     def handle(self):
@@ -815,7 +1214,7 @@ class ExaHttpRequestHandler(socketserver.StreamRequestHandler):
                 if data is None:
                     break
 
-                self.server.write_pipe.write(data)
+                self.write_to_pipe(data)
 
         except Exception as e:
             self.write_error_headers()
@@ -836,10 +1235,10 @@ class ExaHttpRequestHandler(socketserver.StreamRequestHandler):
                 data = self.read_chunk()
 
                 if data is None:
-                    self.server.write_pipe.write(d.flush())
+                    self.write_to_pipe(d.flush())
                     break
 
-                self.server.write_pipe.write(d.decompress(data))
+                self.write_to_pipe(d.decompress(data))
 
         except Exception as e:
             self.write_error_headers()
@@ -857,10 +1256,9 @@ class ExaHttpRequestHandler(socketserver.StreamRequestHandler):
             self.write_success_headers()
 
             while not self.server.is_terminated:
-                # Exasol server produces chunks of this size (without chunk header part)
-                data = self.server.read_pipe.read(65524)
+                data = self.read_from_pipe(self.get_chunk_size)
 
-                if data is None or len(data) == 0:
+                if not data:
                     break
 
                 self.write_chunk(data)
@@ -875,15 +1273,20 @@ class ExaHttpRequestHandler(socketserver.StreamRequestHandler):
             self.write_final_chunk()
 
     def method_get_compressed(self):
+        if self.server.compression_threads > 1:
+            return self.method_get_compressed_parallel()
+
         try:
             self.write_success_headers()
-            c = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+            c = zlib.compressobj(
+                self.server.compression_level, wbits=16 + zlib.MAX_WBITS
+            )
 
             while not self.server.is_terminated:
                 #  Linux common pipe buffer, 64Kb
-                data = self.server.read_pipe.read(65536)
+                data = self.read_from_pipe(65536)
 
-                if data is None or len(data) == 0:
+                if not data:
                     self.write_chunk(c.flush(zlib.Z_FINISH))
                     break
 
@@ -898,7 +1301,99 @@ class ExaHttpRequestHandler(socketserver.StreamRequestHandler):
         if self.server.can_finish_get.wait() and not self.server.is_terminated:
             self.write_final_chunk()
 
+    def method_get_compressed_parallel(self):
+        """
+        Compress blocks of data into independent gzip members in a pool of threads.
+        Exasol accepts concatenated gzip members as a single gzip stream.
+        zlib releases the GIL, so blocks are compressed in parallel while data is
+        being read from pipe and sent to socket. At most ``2 * compression_threads``
+        blocks are kept in memory.
+        """
+        max_pending = 2 * self.server.compression_threads
+        pending: collections.deque[concurrent.futures.Future] = collections.deque()
+        is_empty = True
+
+        try:
+            self.write_success_headers()
+
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.server.compression_threads,
+                thread_name_prefix="pyexasol-compression",
+            ) as executor:
+                try:
+                    while not self.server.is_terminated:
+                        block = self.read_block(self.compression_block_size)
+
+                        if not block:
+                            break
+
+                        pending.append(executor.submit(self.compress_member, block))
+                        is_empty = False
+
+                        if len(pending) >= max_pending:
+                            self.write_chunk(pending.popleft().result())
+
+                    while pending and not self.server.is_terminated:
+                        self.write_chunk(pending.popleft().result())
+
+                    # Empty stream must still be a valid gzip stream
+                    if is_empty:
+                        self.write_chunk(self.compress_member(b""))
+
+                finally:
+                    for future in pending:
+                        future.cancel()
+
+        finally:
+            self.server.read_pipe.close()
+
+        if self.server.can_finish_get.wait() and not self.server.is_terminated:
+            self.write_final_chunk()
+
+    def compress_member(self, data) -> bytes:
+        c = zlib.compressobj(self.server.compression_level, wbits=16 + zlib.MAX_WBITS)
+        return c.compress(data) + c.flush(zlib.Z_FINISH)
+
+    def read_block(self, size: int) -> bytearray:
+        """
+        Read from pipe until `size` bytes are collected or pipe is closed
+        """
+        block = bytearray()
+
+        while len(block) < size:
+            data = self.read_from_pipe(size - len(block))
+
+            if not data:
+                break
+
+            block += data
+
+        return block
+
+    def write_to_pipe(self, data) -> None:
+        start_time = time.perf_counter()
+        self.server.write_pipe.write(data)
+
+        self.server.stats.pipe_wait_time += time.perf_counter() - start_time
+        self.server.stats.data_bytes += len(data)
+
+        if self.server.progress is not None:
+            self.server.track_progress(data)
+
+    def read_from_pipe(self, size: int) -> bytes:
+        start_time = time.perf_counter()
+        data = self.server.read_pipe.read(size) or b""
+
+        self.server.stats.pipe_wait_time += time.perf_counter() - start_time
+        self.server.stats.data_bytes += len(data)
+
+        if self.server.progress is not None:
+            self.server.track_progress(data)
+
+        return data
+
     def read_chunk(self):
+        start_time = time.perf_counter()
         hex_length = self.rfile.readline().rstrip()
 
         if len(hex_length) == 0:
@@ -907,6 +1402,7 @@ class ExaHttpRequestHandler(socketserver.StreamRequestHandler):
             chunk_len = int(hex_length, 16)
 
         if chunk_len == 0:
+            self.server.stats.socket_wait_time += time.perf_counter() - start_time
             return None
 
         data = self.rfile.read(chunk_len)
@@ -914,6 +1410,12 @@ class ExaHttpRequestHandler(socketserver.StreamRequestHandler):
         if self.rfile.read(2) != b"\r\n":
             raise RuntimeError("Invalid chunk delimiter in HTTP stream")
 
+        self.server.stats.socket_wait_time += time.perf_counter() - start_time
+        self.server.stats.add_chunk(chunk_len)
+
+        if self.server.rate_limiter is not None:
+            self.server.rate_limiter.consume(chunk_len)
+
         return data
 
     def write_chunk(self, data):
@@ -922,8 +1424,16 @@ class ExaHttpRequestHandler(socketserver.StreamRequestHandler):
         if chunk_len == 0:
             return
 
+        start_time = time.perf_counter()
+
         self.wfile.write(b"%X\r\n%b\r\n" % (chunk_len, data))
 
+        self.server.stats.socket_wait_time += time.perf_counter() - start_time
+        self.server.stats.add_chunk(chunk_len)
+
+        if self.server.rate_limiter is not None:
+            self.server.rate_limiter.consume(chunk_len)
+
     def write_final_chunk(self):
         self.wfile.write(b"0\r\n\r\n")
 
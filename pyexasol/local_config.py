@@ -27,6 +27,17 @@ class ExaLocalConfig:
         "verbose_error": bool,
         "debug": bool,
         "udf_output_port": int,
+        "http_compression_level": int,
+        "http_compression_threads": int,
+        "http_progress_interval": int,
+        "http_max_bytes_per_sec": int,
+        "http_pool_size": int,
+        "meta_cache_ttl": float,
+        "meta_cache_max_entries": int,
+        "meta_nosql": bool,
+        "format_max_list_size": int,
+        "udf_output_max_bytes": int,
+        "udf_output_indexed": bool,
     }
 
     def __init__(self, config_path=None):
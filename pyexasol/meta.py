@@ -1,6 +1,115 @@
+import collections
+import copy
+import functools
+import inspect
+import re
+import time
+
 from . import constant
 from .exceptions import ExaRuntimeError
 
+# Leading comments are skipped to detect DDL statements
+_DDL_QUERY_REGEXP = re.compile(
+    r"^(?:\s+|--[^\n]*\n?|/\*.*?\*/)*(CREATE|ALTER|DROP|RENAME|COMMENT)\b",
+    re.IGNORECASE | re.DOTALL,
+)
+
+_DDL_OBJECT_REGEXP = re.compile(
+    r"\b(?:SCHEMA|TABLE|VIEW|COLUMN)\s+(?:IF\s+(?:NOT\s+)?EXISTS\s+)?"
+    r'((?:"[^"]*"|[\w$#]+)(?:\.(?:"[^"]*"|[\w$#]+))*)',
+    re.IGNORECASE,
+)
+
+
+class _ExaMetaDataCacheEntry:
+    __slots__ = ("value", "text", "expires_at")
+
+    def __init__(self, value, text, expires_at):
+        self.value = value
+        # Object name or query text, used to find entries affected by DDL
+        # None means the entry depends on any object (e.g. LIKE-pattern)
+        self.text = text
+        self.expires_at = expires_at
+
+
+class _ExaMetaDataCache:
+    """
+    LRU cache of metadata lookups with TTL, owned by one connection
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: collections.OrderedDict[tuple, _ExaMetaDataCacheEntry] = (
+            collections.OrderedDict()
+        )
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: tuple):
+        entry = self._entries.get(key)
+
+        if entry is not None and entry.expires_at < time.monotonic():
+            del self._entries[key]
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+
+        return entry
+
+    def put(self, key: tuple, value, text: str | None):
+        self._entries.pop(key, None)
+        self._entries[key] = _ExaMetaDataCacheEntry(
+            value, text, time.monotonic() + self.ttl
+        )
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, object_name: str | None = None):
+        if object_name is None:
+            self._entries.clear()
+            return
+
+        name = object_name.split(".")[-1].strip('"')
+        regexp = re.compile(rf"(?<![\w$#]){re.escape(name)}(?![\w$#])", re.IGNORECASE)
+
+        for key in [
+            k
+            for k, e in self._entries.items()
+            if e.text is None or regexp.search(e.text)
+        ]:
+            del self._entries[key]
+
+
+def _cached_listing(func):
+    """
+    Caches result of list_* method by LIKE-patterns, if metadata cache is enabled.
+    Patterns may match any object, so these entries are removed on every DDL.
+    """
+    sig = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if self.cache is None:
+            return func(self, *args, **kwargs)
+
+        bound = sig.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = (func.__name__, *list(bound.arguments.values())[1:])
+
+        return self._get_cached(key, None, lambda: func(self, *args, **kwargs))
+
+    return wrapper
+
 
 class ExaMetaData:
     """
@@ -23,6 +132,13 @@ class ExaMetaData:
     def __init__(self, connection):
         self.connection = connection
         self.sql_keywords = None
+        self.cache = None
+
+        if self.connection.options["meta_cache_ttl"]:
+            self.cache = _ExaMetaDataCache(
+                ttl=self.connection.options["meta_cache_ttl"],
+                max_entries=self.connection.options["meta_cache_max_entries"],
+            )
 
     def sql_columns(self, query, query_params=None):
         """
@@ -38,6 +154,21 @@ class ExaMetaData:
             Columns of SQL query result without executing it.
             Output format is similar to :meth:`pyexasol.ExaStatement.columns`.
         """
+        if self.cache is None:
+            return self._sql_columns(query, query_params)
+
+        if query_params is not None:
+            query = self.connection.format.format(query, **query_params)
+
+        query = str(query).strip(" \n;")
+
+        return self._get_cached(
+            ("sql_columns", self.connection.current_schema(), query),
+            query,
+            lambda: self._sql_columns(query),
+        )
+
+    def _sql_columns(self, query, query_params=None):
         st = self.connection.cls_statement(
             self.connection, query, query_params, prepare=True
         )
@@ -59,6 +190,13 @@ class ExaMetaData:
         """
         object_name = self.connection.format.default_format_ident_value(schema_name)
 
+        return self._get_cached(
+            ("schema_exists", object_name),
+            object_name,
+            lambda: self._schema_exists(object_name),
+        )
+
+    def _schema_exists(self, object_name):
         if self.connection.protocol_version() >= constant.PROTOCOL_V2:
             st = self.execute_meta_nosql(
                 "getSchemas",
@@ -92,17 +230,15 @@ class ExaMetaData:
         Returns:
             ``True`` if the table exists, otherwise ``False``.
         """
-        if isinstance(table_name, tuple):
-            object_schema = self.connection.format.default_format_ident_value(
-                table_name[0]
-            )
-            object_name = self.connection.format.default_format_ident_value(
-                table_name[1]
-            )
-        else:
-            object_schema = self.connection.current_schema()
-            object_name = self.connection.format.default_format_ident_value(table_name)
+        object_schema, object_name = self._split_object_name(table_name)
+
+        return self._get_cached(
+            ("table_exists", object_schema, object_name),
+            f"{object_schema}.{object_name}",
+            lambda: self._table_exists(object_schema, object_name),
+        )
 
+    def _table_exists(self, object_schema, object_name):
         if self.connection.protocol_version() >= constant.PROTOCOL_V2:
             st = self.execute_meta_nosql(
                 "getTables",
@@ -140,17 +276,15 @@ class ExaMetaData:
         Returns:
             ``True`` if the view exists, otherwise ``False``.
         """
-        if isinstance(view_name, tuple):
-            object_schema = self.connection.format.default_format_ident_value(
-                view_name[0]
-            )
-            object_name = self.connection.format.default_format_ident_value(
-                view_name[1]
-            )
-        else:
-            object_schema = self.connection.current_schema()
-            object_name = self.connection.format.default_format_ident_value(view_name)
+        object_schema, object_name = self._split_object_name(view_name)
+
+        return self._get_cached(
+            ("view_exists", object_schema, object_name),
+            f"{object_schema}.{object_name}",
+            lambda: self._view_exists(object_schema, object_name),
+        )
 
+    def _view_exists(self, object_schema, object_name):
         if self.connection.protocol_version() >= constant.PROTOCOL_V2:
             st = self.execute_meta_nosql(
                 "getTables",
@@ -176,6 +310,189 @@ class ExaMetaData:
 
         return st.rowcount() > 0
 
+    def schemas_exist(self, schema_names):
+        """
+        Check if multiple schemas exist with one request.
+
+        Args:
+            schema_names:
+                Names of the schemas to check.
+
+        Returns:
+            ``dict`` with passed names as keys and ``True`` or ``False`` as values.
+        """
+        objects = {
+            name: (self.connection.format.default_format_ident_value(name),)
+            for name in schema_names
+        }
+
+        return self._objects_exist(
+            "schema_exists", objects, "sys.exa_schemas", None, "schema_name"
+        )
+
+    def tables_exist(self, table_names):
+        """
+        Check if multiple tables exist with one request.
+
+        Args:
+            table_names:
+                Names of the tables to check, may be passed as tuples to specify schema.
+                If schema was not specified, ``current_schema`` is used.
+
+        Returns:
+            ``dict`` with passed names as keys and ``True`` or ``False`` as values.
+
+        Examples:
+
+            >>> C.meta.tables_exist(['USERS', ('OTHER_SCHEMA', 'PAYMENTS')])
+            {'USERS': True, ('OTHER_SCHEMA', 'PAYMENTS'): False}
+        """
+        objects = {name: self._split_object_name(name) for name in table_names}
+
+        return self._objects_exist(
+            "table_exists", objects, "sys.exa_all_tables", "table_schema", "table_name"
+        )
+
+    def views_exist(self, view_names):
+        """
+        Check if multiple views exist with one request.
+
+        Args:
+            view_names:
+                Names of the views to check, may be passed as tuples to specify schema.
+                If schema was not specified, ``current_schema`` is used.
+
+        Returns:
+            ``dict`` with passed names as keys and ``True`` or ``False`` as values.
+        """
+        objects = {name: self._split_object_name(name) for name in view_names}
+
+        return self._objects_exist(
+            "view_exists", objects, "sys.exa_all_views", "view_schema", "view_name"
+        )
+
+    def columns_for(self, object_names):
+        """
+        Get columns of multiple tables or views with one request.
+
+        Args:
+            object_names:
+                Names of the tables or views, may be passed as tuples to specify schema.
+                If schema was not specified, ``current_schema`` is used.
+
+        Returns:
+            ``dict`` with passed names as keys and lists of columns from
+            `EXA_ALL_COLUMNS <https://docs.exasol.com/db/latest/sql_references/system_tables/metadata/exa_all_columns.htm>`_
+            system view ordered by position as values. List is empty if object does not exist.
+        """
+        objects = {name: self._split_object_name(name) for name in object_names}
+        columns = self._get_cached_many("columns_for", objects.values())
+        missing = {obj for obj in objects.values() if obj not in columns}
+
+        if missing:
+            st = self.execute_snapshot(f"""
+                SELECT *
+                FROM sys.exa_all_columns
+                WHERE {self._get_objects_condition(missing, "column_schema", "column_table")}
+                ORDER BY column_schema, column_table, column_ordinal_position
+            """)
+
+            found = {obj: [] for obj in missing}
+            keys = {name.upper(): name for name in st.column_names()}
+
+            for row in st:
+                found[(row[keys["COLUMN_SCHEMA"]], row[keys["COLUMN_TABLE"]])].append(
+                    row
+                )
+
+            self._put_cached_many("columns_for", found)
+            columns.update(found)
+
+        return {name: columns[obj] for name, obj in objects.items()}
+
+    def sql_columns_many(self, queries):
+        """
+        Get result set columns of multiple SQL queries without executing them.
+
+        Args:
+            queries:
+                SQL query texts.
+
+        Returns:
+            ``dict`` with passed queries as keys and columns as values,
+            same format as :meth:`sql_columns`.
+
+        Note:
+            Exasol requires one prepared statement per query. Duplicate queries are
+            requested only once, cached queries are not requested if metadata cache is enabled.
+        """
+        result = {}
+
+        for query in queries:
+            if query not in result:
+                result[query] = self.sql_columns(query)
+
+        return result
+
+    def _objects_exist(self, kind, objects, view, schema_column, name_column):
+        exist = self._get_cached_many(kind, objects.values())
+        missing = {obj for obj in objects.values() if obj not in exist}
+
+        if missing:
+            if schema_column is None:
+                condition = f"{name_column} IN ({self._quote_list(o[0] for o in sorted(missing))})"
+                select = name_column
+            else:
+                condition = self._get_objects_condition(
+                    missing, schema_column, name_column
+                )
+                select = f"{schema_column}, {name_column}"
+
+            st = self.execute_snapshot(f"""
+                SELECT {select}
+                FROM {view}
+                WHERE {condition}
+            """)
+
+            found = {tuple(row.values()) for row in st}
+            found = {obj: obj in found for obj in missing}
+
+            self._put_cached_many(kind, found)
+            exist.update(found)
+
+        return {name: exist[obj] for name, obj in objects.items()}
+
+    def _get_objects_condition(self, objects, schema_column, name_column):
+        """
+        SQL condition matching objects grouped by schema
+        """
+        schemas = collections.defaultdict(list)
+
+        for object_schema, object_name in sorted(objects):
+            schemas[object_schema].append(object_name)
+
+        return " OR ".join(
+            f"({schema_column}={self.connection.format.quote(object_schema)} "
+            f"AND {name_column} IN ({self._quote_list(object_names)}))"
+            for object_schema, object_names in schemas.items()
+        )
+
+    def _quote_list(self, values):
+        return ", ".join(self.connection.format.quote(v) for v in values)
+
+    def _split_object_name(self, object_name):
+        if isinstance(object_name, tuple):
+            return (
+                self.connection.format.default_format_ident_value(object_name[0]),
+                self.connection.format.default_format_ident_value(object_name[1]),
+            )
+
+        return (
+            self.connection.current_schema(),
+            self.connection.format.default_format_ident_value(object_name),
+        )
+
+    @_cached_listing
     def list_schemas(self, schema_name_pattern="%"):
         """
         List Schemas.
@@ -187,10 +504,16 @@ class ExaMetaData:
 
         Returns:
             List of schemas from `EXA_SCHEMAS <https://docs.exasol.com/db/latest/sql_references/system_tables/metadata/exa_schemas.htm>`_ system view matching LIKE-pattern.
+            Format of ``getSchemas`` command is used if ``meta_nosql`` connection option is enabled.
 
         Note:
             Patterns are case-sensitive. You may escape LIKE-patterns.
         """
+        if self._use_meta_nosql():
+            return self.execute_meta_nosql(
+                "getSchemas", {"schema": schema_name_pattern}
+            ).fetchall()
+
         st = self.execute_snapshot(
             """
             SELECT *
@@ -205,6 +528,7 @@ class ExaMetaData:
 
         return st.fetchall()
 
+    @_cached_listing
     def list_tables(self, table_schema_pattern="%", table_name_pattern="%"):
         """
         List Tables.
@@ -219,10 +543,21 @@ class ExaMetaData:
 
         Returns:
             List of tables from `EXA_ALL_TABLES <https://docs.exasol.com/db/latest/sql_references/system_tables/metadata/exa_all_tables.htm>`_ system view matching LIKE-pattern.
+            Format of ``getTables`` command is used if ``meta_nosql`` connection option is enabled.
 
         Note:
             Patterns are case-sensitive. You may escape LIKE-patterns.
         """
+        if self._use_meta_nosql():
+            return self.execute_meta_nosql(
+                "getTables",
+                {
+                    "schema": table_schema_pattern,
+                    "table": table_name_pattern,
+                    "tableTypes": ["TABLE"],
+                },
+            ).fetchall()
+
         st = self.execute_snapshot(
             """
             SELECT *
@@ -239,6 +574,7 @@ class ExaMetaData:
 
         return st.fetchall()
 
+    @_cached_listing
     def list_views(self, view_schema_pattern="%", view_name_pattern="%"):
         """
         List Views.
@@ -253,10 +589,21 @@ class ExaMetaData:
 
         Returns:
             List of views from `EXA_ALL_VIEWS <https://docs.exasol.com/db/latest/sql_references/system_tables/metadata/exa_all_views.htm>`_ system view matching LIKE-pattern.
+            Format of ``getTables`` command is used if ``meta_nosql`` connection option is enabled.
 
         Note:
             Patterns are case-sensitive. You may escape LIKE-patterns.
         """
+        if self._use_meta_nosql():
+            return self.execute_meta_nosql(
+                "getTables",
+                {
+                    "schema": view_schema_pattern,
+                    "table": view_name_pattern,
+                    "tableTypes": ["VIEW"],
+                },
+            ).fetchall()
+
         st = self.execute_snapshot(
             """
             SELECT *
@@ -273,6 +620,7 @@ class ExaMetaData:
 
         return st.fetchall()
 
+    @_cached_listing
     def list_columns(
         self,
         column_schema_pattern="%",
@@ -299,10 +647,23 @@ class ExaMetaData:
 
         Returns:
             List of columns from `EXA_ALL_COLUMNS <https://docs.exasol.com/db/latest/sql_references/system_tables/metadata/exa_all_columns.htm>`_ system view matching LIKE-pattern.
+            Format of ``getColumns`` command is used if ``meta_nosql`` connection option is enabled
+            and ``column_object_type_pattern`` is not set.
 
         Note:
             Patterns are case-sensitive. You may escape LIKE-patterns.
         """
+        # getColumns command cannot filter by object type
+        if self._use_meta_nosql() and column_object_type_pattern == "%":
+            return self.execute_meta_nosql(
+                "getColumns",
+                {
+                    "schema": column_schema_pattern,
+                    "table": column_table_pattern,
+                    "column": column_name_pattern,
+                },
+            ).fetchall()
+
         st = self.execute_snapshot(
             """
             SELECT *
@@ -322,6 +683,7 @@ class ExaMetaData:
 
         return st.fetchall()
 
+    @_cached_listing
     def list_objects(
         self,
         object_name_pattern="%",
@@ -491,6 +853,86 @@ class ExaMetaData:
 
         return self.sql_keywords
 
+    def _use_meta_nosql(self):
+        return (
+            self.connection.options["meta_nosql"]
+            and self.connection.protocol_version() >= constant.PROTOCOL_V2
+        )
+
+    def invalidate(self, object_name=None):
+        """
+        Remove cached metadata, see ``meta_cache_ttl`` connection option.
+
+        Args:
+            object_name:
+                Remove only metadata related to this schema, table or view
+                (case-insensitive, schema prefix is ignored) and results of
+                ``list_*`` functions. Remove all if not set.
+
+        Note:
+            It is called automatically when DDL statement is executed
+            by the same connection.
+        """
+        if self.cache is not None:
+            self.cache.invalidate(object_name)
+
+    def _invalidate_by_query(self, query):
+        """
+        Remove cached metadata of objects affected by DDL statement
+        """
+        match = _DDL_QUERY_REGEXP.match(query)
+
+        if not match:
+            return
+
+        object_names = _DDL_OBJECT_REGEXP.findall(query)
+
+        # New name of renamed object is not detected, unknown statements invalidate everything
+        if not object_names or match.group(1).upper() == "RENAME":
+            self.cache.invalidate()
+            return
+
+        for object_name in object_names:
+            self.cache.invalidate(object_name)
+
+    def _get_cached(self, key, text, func):
+        if self.cache is None:
+            return func()
+
+        entry = self.cache.get(key)
+
+        if entry is None:
+            value = func()
+            self.cache.put(key, copy.deepcopy(value), text)
+            return value
+
+        # Cached values are copied, so users may modify returned objects safely
+        return copy.deepcopy(entry.value)
+
+    def _get_cached_many(self, kind, objects):
+        """
+        Cached values of multiple objects, keys are tuples (schema, name) or (schema,)
+        """
+        if self.cache is None:
+            return {}
+
+        result = {}
+
+        for obj in objects:
+            entry = self.cache.get((kind, *obj))
+
+            if entry is not None:
+                result[obj] = copy.deepcopy(entry.value)
+
+        return result
+
+    def _put_cached_many(self, kind, values):
+        if self.cache is None:
+            return
+
+        for obj, value in values.items():
+            self.cache.put((kind, *obj), copy.deepcopy(value), ".".join(obj))
+
     def execute_snapshot(self, query, query_params=None):
         """
         Execute query in snapshot transaction mode using SQL hint
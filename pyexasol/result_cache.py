@@ -0,0 +1,294 @@
+"""
+Client-side cache of result sets for repeated read-only queries.
+
+Enable it by setting ``cls_statement = ExaCachedStatement`` in a subclass of
+:class:`pyexasol.ExaConnection` and by passing an instance of :class:`ExaResultCache`
+with the ``result_cache`` connection option.
+"""
+
+from __future__ import annotations
+
+import collections
+import pickle
+import re
+import threading
+import time
+from dataclasses import dataclass
+
+from .statement import ExaStatement
+
+# Session attributes which may change the result of the same SQL text
+RESULT_CACHE_ATTRIBUTES = (
+    "currentSchema",
+    "dateFormat",
+    "dateLanguage",
+    "datetimeFormat",
+    "defaultLikeEscapeCharacter",
+    "numericCharacters",
+    "resultSetMaxRows",
+    "timestampUtcEnabled",
+    "timezone",
+    "timeZoneBehavior",
+)
+
+# Leading comments are skipped to detect read-only queries
+_READ_ONLY_QUERY_REGEXP = re.compile(
+    r"^(?:\s+|--[^\n]*\n?|/\*.*?\*/)*(?:SELECT|WITH)\b", re.IGNORECASE | re.DOTALL
+)
+
+
+@dataclass
+class _ExaResultCacheEntry:
+    query: str
+    columns: list[dict]
+    num_rows: int
+    # Pickled list of columns for every chunk, exactly as received from Exasol
+    chunks: list[bytes]
+    size: int
+    expires_at: float
+
+
+class ExaResultCache:
+    """
+    LRU cache of result sets with TTL and a cap on the total size in bytes.
+
+    The same instance may be shared by multiple connections and threads.
+    Key is the SQL text after formatting, the DSN, the user and relevant session
+    attributes, including current schema.
+
+    Warning:
+        Cache is not invalidated automatically on data changes. Call
+        :meth:`invalidate` after DML and choose ``ttl`` according to
+        acceptable staleness. Results of non-deterministic queries
+        (e.g. ``RANDOM()``, ``CURRENT_TIMESTAMP``) are cached as well.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: float = 60,
+        max_entries: int = 1000,
+    ):
+        """
+        Args:
+            max_bytes:
+                Maximum total size of cached result sets in bytes (pickled). Larger
+                result sets are not cached.
+            ttl:
+                Time to live of cached result set in seconds.
+            max_entries:
+                Maximum number of cached result sets.
+        """
+        if max_bytes <= 0 or ttl <= 0 or max_entries <= 0:
+            raise ValueError("max_bytes, ttl and max_entries must be positive numbers")
+
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: collections.OrderedDict[tuple, _ExaResultCacheEntry] = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def get_key(connection, query: str) -> tuple | None:
+        """
+        Key of cached result set, ``None`` if query is not a read-only query
+        """
+        if not _READ_ONLY_QUERY_REGEXP.match(query):
+            return None
+
+        return (
+            query,
+            connection.options["dsn"],
+            connection.options["user"],
+            tuple(connection.attr.get(name) for name in RESULT_CACHE_ATTRIBUTES),
+        )
+
+    def get(self, key: tuple) -> _ExaResultCacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry.expires_at < time.monotonic():
+                self._remove(key)
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+            return entry
+
+    def put(self, key: tuple, columns: list[dict], num_rows: int, chunks: list[bytes]):
+        size = sum(len(c) for c in chunks)
+
+        if size > self.max_bytes:
+            return
+
+        entry = _ExaResultCacheEntry(
+            query=key[0],
+            columns=columns,
+            num_rows=num_rows,
+            chunks=chunks,
+            size=size,
+            expires_at=time.monotonic() + self.ttl,
+        )
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = entry
+            self.size += size
+
+            # Evict least recently used entries
+            while self.size > self.max_bytes or len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, table: str | None = None):
+        """
+        Remove cached result sets.
+
+        Args:
+            table:
+                Remove only result sets of queries mentioning this table or view name
+                (case-insensitive, schema prefix is ignored). Remove all if not set.
+        """
+        with self._lock:
+            if table is None:
+                self._entries.clear()
+                self.size = 0
+                return
+
+            name = table.split(".")[-1].strip('"')
+            regexp = re.compile(
+                rf"(?<![\w$#]){re.escape(name)}(?![\w$#])", re.IGNORECASE
+            )
+
+            for key in [k for k, e in self._entries.items() if regexp.search(e.query)]:
+                self._remove(key)
+
+    def _remove(self, key: tuple):
+        self.size -= self._entries.pop(key).size
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} entries={len(self)} size={self.size} "
+            f"hits={self.hits} misses={self.misses}>"
+        )
+
+
+class ExaCachedStatement(ExaStatement):
+    """
+    :class:`pyexasol.ExaStatement` serving read-only queries from
+    :class:`pyexasol.ExaResultCache` set by the ``result_cache`` connection option.
+
+    On cache hit, no request is sent to Exasol and all rows are available as one chunk.
+    On cache miss, chunks are recorded while they are fetched. Result set is cached
+    only after all rows were fetched.
+    """
+
+    def _execute(self):
+        self.result_cache = self.connection.options.get("result_cache")
+        self.result_cache_key = None
+        self.is_result_cached = False
+
+        if self.result_cache is not None:
+            self.result_cache_key = self.result_cache.get_key(
+                self.connection, self.query
+            )
+
+        if self.result_cache_key is not None:
+            entry = self.result_cache.get(self.result_cache_key)
+
+            if entry is not None:
+                self.is_result_cached = True
+                self._init_result_set(self._get_cached_response(entry))
+                return
+
+        super()._execute()
+
+    def _init_result_set(self, ret):
+        super()._init_result_set(ret)
+
+        self._cached_chunks: list[bytes] | None = None
+        self._cached_rows = 0
+        self._cached_size = 0
+
+        if (
+            getattr(self, "result_cache_key", None) is not None
+            and not self.is_result_cached
+            and self.result_type == "resultSet"
+        ):
+            result_set = ret["responseData"]["results"][0]["resultSet"]
+
+            self._columns = result_set["columns"]
+            self._cached_chunks = []
+            self._record_chunk(result_set)
+
+    def _init_chunk(self, response_data):
+        super()._init_chunk(response_data)
+
+        if self._cached_chunks is not None:
+            self._record_chunk(response_data)
+
+    def _record_chunk(self, response_data):
+        chunk = pickle.dumps(
+            response_data.get("data", []), protocol=pickle.HIGHEST_PROTOCOL
+        )
+
+        self._cached_chunks.append(chunk)
+        self._cached_size += len(chunk)
+        # First chunk is part of result set, next chunks are responses of "fetch"
+        self._cached_rows += response_data.get(
+            "numRowsInMessage", response_data["numRows"]
+        )
+
+        # Stop recording result sets which are too large to be cached
+        if self._cached_size > self.result_cache.max_bytes:
+            self._cached_chunks = None
+            return
+
+        if self._cached_rows >= self.num_rows_total:
+            self.result_cache.put(
+                self.result_cache_key,
+                self._columns,
+                self.num_rows_total,
+                self._cached_chunks,
+            )
+            self._cached_chunks = None
+
+    def _get_cached_response(self, entry: _ExaResultCacheEntry) -> dict:
+        data = [[] for _ in entry.columns]
+
+        for chunk in entry.chunks:
+            for column, values in zip(data, pickle.loads(chunk)):
+                column.extend(values)
+
+        return {
+            "responseData": {
+                "results": [
+                    {
+                        "resultType": "resultSet",
+                        "resultSet": {
+                            "numColumns": len(entry.columns),
+                            "numRows": entry.num_rows,
+                            "numRowsInMessage": entry.num_rows,
+                            "columns": entry.columns,
+                            "data": data,
+                        },
+                    }
+                ],
+            }
+        }
@@ -0,0 +1,165 @@
+"""
+Row objects of result sets, see ``fetch_rows`` and ``row_factory`` connection options.
+
+Row factory is called once per result set with a tuple of column names and returns
+a callable, which converts every row tuple into the row object. Row classes are generated
+once per list of column names and cached, so all rows of all result sets with the same
+columns share one class and one mapping of names to positions.
+"""
+
+from __future__ import annotations
+
+import collections
+import functools
+import keyword
+import operator
+from collections.abc import Callable
+
+from . import constant
+
+FETCH_ROWS_MODES = ("tuple", "dict", "record")
+
+
+class ExaRecord(tuple):
+    """
+    Row of result set, which is a ``tuple`` with access to values by column name.
+
+    Values are available by index (``row[0]``), by column name (``row["USER_ID"]``)
+    and as attributes if column name is a valid Python identifier (``row.USER_ID``).
+    Iteration, ``len()``, ``in``, comparison and hashing behave like ``tuple``.
+
+    Instances do not have ``__dict__``, so memory usage is the same as for ``tuple``.
+    Column names are stored once per class in ``_fields``.
+    """
+
+    __slots__ = ()
+
+    _fields: tuple[str, ...] = ()
+    _field_index: dict[str, int] = {}
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            try:
+                key = self._field_index[key]
+            except KeyError:
+                raise KeyError(key) from None
+
+        return tuple.__getitem__(self, key)
+
+    def get(self, key: str, default=None):
+        """
+        Value of column, ``default`` if column does not exist.
+        """
+        idx = self._field_index.get(key)
+
+        if idx is None:
+            return default
+
+        return tuple.__getitem__(self, idx)
+
+    def keys(self) -> tuple[str, ...]:
+        """
+        Column names.
+        """
+        return self._fields
+
+    def values(self) -> tuple:
+        """
+        Values as plain ``tuple``.
+        """
+        return tuple(self)
+
+    def items(self) -> zip:
+        """
+        Pairs of column name and value.
+        """
+        return zip(self._fields, self)
+
+    def _asdict(self) -> dict:
+        return dict(zip(self._fields, self))
+
+    def __reduce__(self):
+        # Generated classes are not importable by name, so rows are pickled with column names
+        return _unpickle_record, (self._fields, tuple(self))
+
+    def __repr__(self):
+        values = ", ".join(f"{k}={v!r}" for k, v in zip(self._fields, self))
+        return f"{self.__class__.__name__}({values})"
+
+
+@functools.lru_cache(maxsize=constant.ROW_CLASS_CACHE_SIZE)
+def get_record_class(col_names: tuple[str, ...]) -> type[ExaRecord]:
+    """
+    Subclass of :class:`ExaRecord` for the given column names, cached by column names.
+    """
+    namespace: dict = {
+        "__slots__": (),
+        "_fields": col_names,
+        "_field_index": {name: idx for idx, name in enumerate(col_names)},
+    }
+
+    for idx, name in enumerate(col_names):
+        if (
+            name.isidentifier()
+            and not keyword.iskeyword(name)
+            and not name.startswith("_")
+            and not hasattr(ExaRecord, name)
+        ):
+            namespace[name] = property(operator.itemgetter(idx))
+
+    return type(ExaRecord.__name__, (ExaRecord,), namespace)
+
+
+def record_row_factory(col_names: tuple[str, ...]) -> Callable[[tuple], ExaRecord]:
+    """
+    Row factory returning rows as :class:`pyexasol.ExaRecord`, same as ``fetch_rows="record"``.
+    """
+    return get_record_class(col_names)
+
+
+@functools.lru_cache(maxsize=constant.ROW_CLASS_CACHE_SIZE)
+def get_namedtuple_class(col_names: tuple[str, ...]) -> type[tuple]:
+    """
+    Named tuple class for the given column names, cached by column names.
+
+    Column names which are not valid field names are replaced by ``_<index>``.
+    """
+    return collections.namedtuple("Row", col_names, rename=True)
+
+
+def namedtuple_row_factory(col_names: tuple[str, ...]) -> Callable[[tuple], tuple]:
+    """
+    Row factory returning rows as :func:`collections.namedtuple`.
+    """
+    # tuple.__new__ avoids the Python-level call of namedtuple.__new__ for every row
+    return functools.partial(tuple.__new__, get_namedtuple_class(col_names))
+
+
+def class_row_factory(cls: Callable) -> Callable[[tuple[str, ...]], Callable]:
+    """
+    Row factory creating instances of a user-supplied class, e.g. a dataclass.
+
+    Values are passed as keyword arguments with column names as keys, so
+    ``lower_ident=True`` is usually required to match Python attribute names.
+
+    Examples:
+
+        >>> @dataclasses.dataclass(slots=True)
+        ... class User:
+        ...     user_id: int
+        ...     user_name: str
+        ...
+        >>> C = pyexasol.connect(..., lower_ident=True, row_factory=class_row_factory(User))
+    """
+
+    def factory(col_names: tuple[str, ...]) -> Callable[[tuple], object]:
+        def make_row(row: tuple):
+            return cls(**dict(zip(col_names, row)))
+
+        return make_row
+
+    return factory
+
+
+def _unpickle_record(col_names: tuple[str, ...], values: tuple) -> ExaRecord:
+    return get_record_class(col_names)(values)
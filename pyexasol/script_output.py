@@ -1,64 +1,702 @@
+import abc
+import collections
+import gzip
+import json
+import logging
 import os
-import subprocess
-import sys
+import selectors
+import socket
+import struct
+import threading
+from collections.abc import Callable
+from pathlib import Path
 
+from . import constant
 
-class ExaScriptOutputProcess:
-    def __init__(self, host, port, output_dir):
-        self.host = host
-        self.port = port
+UDF_OUTPUT_COMPRESSIONS = ("gzip", "zstd")
 
+# Trailer of indexed output file: length of JSON index and magic bytes
+_INDEX_TRAILER = struct.Struct("<Q8s")
+_INDEX_MAGIC = b"PXUDFIDX"
+
+
+def _get_codec(compression: str | None) -> tuple[Callable, Callable, Callable, str]:
+    """
+    Functions to compress block, decompress block, open file for streaming, and file suffix
+    """
+    if compression is None:
+        return bytes, bytes, open, ""
+
+    if compression == "gzip":
+        return (
+            lambda data: gzip.compress(
+                data, compresslevel=constant.UDF_OUTPUT_GZIP_LEVEL
+            ),
+            gzip.decompress,
+            lambda path, mode: gzip.open(
+                path, mode, compresslevel=constant.UDF_OUTPUT_GZIP_LEVEL
+            ),
+            ".gz",
+        )
+
+    if compression == "zstd":
+        try:
+            # Python 3.14+
+            from compression import zstd
+
+            return zstd.compress, zstd.decompress, zstd.open, ".zst"
+        except ImportError:
+            pass
+
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError(
+                "UDF output compression [zstd] requires Python 3.14+ "
+                "or package 'zstandard' to be installed"
+            ) from e
+
+        return (
+            zstandard.ZstdCompressor().compress,
+            zstandard.ZstdDecompressor().decompress,
+            zstandard.open,
+            ".zst",
+        )
+
+    raise ValueError(
+        f"Unsupported UDF output compression [{compression}], "
+        f"supported compressions: {', '.join(UDF_OUTPUT_COMPRESSIONS)}"
+    )
+
+
+def check_udf_output_compression(compression: str | None):
+    """
+    Raise an error early if UDF output compression is not supported or not available
+    """
+    _get_codec(compression)
+
+
+class _ExaScriptOutputSink(abc.ABC):
+    """
+    Output of one VM. First ``max_bytes`` bytes are stored, the rest is discarded.
+    """
+
+    def __init__(self, max_bytes: int | None):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.received = 0
+
+    def write(self, data: bytes):
+        self.received += len(data)
+
+        if self.max_bytes is not None:
+            if self.size >= self.max_bytes:
+                return
+
+            data = data[: self.max_bytes - self.size]
+
+        self.size += len(data)
+        self._write(data)
+
+    @abc.abstractmethod
+    def _write(self, data: bytes):
+        pass
+
+    @abc.abstractmethod
+    def close(self):
+        pass
+
+
+class _ExaScriptOutputFileSink(_ExaScriptOutputSink):
+    def __init__(self, path: Path, open_func: Callable, max_bytes: int | None):
+        super().__init__(max_bytes)
+
+        if open_func is open:
+            self.file = open(
+                path, "wb", buffering=constant.UDF_OUTPUT_WRITE_BUFFER_SIZE
+            )
+        else:
+            self.file = open_func(path, "wb")
+
+    def _write(self, data: bytes):
+        self.file.write(data)
+
+    def close(self):
+        self.file.close()
+
+
+class ExaScriptOutputDirStorage:
+    """
+    Output of every VM is written into a separate log file ``<vm_id>.log`` in the directory
+    of the statement, optionally compressed.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        compression: str | None = None,
+        max_bytes: int | None = None,
+    ):
         self.output_dir = output_dir
-        self.output_address = None
-
-        self.proc = None
-
-    def start(self):
-        args = [
-            sys.executable,
-            "-m",
-            "pyexasol_utils.script_output",
-            "--output-dir",
-            str(self.output_dir),
-            "--ppid",
-            str(os.getpid()),
+        self.compression = compression
+        self.max_bytes = max_bytes
+        _, _, self.open_func, self.suffix = _get_codec(compression)
+
+    def open_sink(self, vm_id: int) -> _ExaScriptOutputFileSink:
+        return _ExaScriptOutputFileSink(
+            self.output_dir / f"{vm_id:05}.log{self.suffix}",
+            self.open_func,
+            self.max_bytes,
+        )
+
+    def close(self) -> list[Path]:
+        return sorted(self.output_dir.glob(f"*.log{self.suffix}"))
+
+
+class _ExaScriptOutputIndexedSink(_ExaScriptOutputSink):
+    def __init__(
+        self,
+        storage: "ExaScriptOutputIndexedStorage",
+        entry: dict,
+        max_bytes: int | None,
+    ):
+        super().__init__(max_bytes)
+
+        self.storage = storage
+        self.entry = entry
+        self.buffer = bytearray()
+
+    def _write(self, data: bytes):
+        self.buffer += data
+
+        if len(self.buffer) >= constant.UDF_OUTPUT_WRITE_BUFFER_SIZE:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            self.entry["blocks"].append(self.storage.write_block(self.buffer))
+            self.buffer = bytearray()
+
+    def close(self):
+        self.flush()
+        self.entry["size"] = self.size
+        self.entry["received"] = self.received
+
+
+class ExaScriptOutputIndexedStorage:
+    """
+    Output of all VMs is written into one file per statement.
+
+    Output of every VM is collected into blocks, which are compressed independently
+    and appended to the file as they are ready. Index with positions of blocks of every
+    VM is written as JSON at the end of the file, followed by a fixed-size trailer.
+    Use :class:`ExaScriptOutputIndexedFile` to read it.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        compression: str | None = None,
+        max_bytes: int | None = None,
+    ):
+        self.path = path
+        self.compression = compression
+        self.max_bytes = max_bytes
+        self.compress = _get_codec(compression)[0]
+        self.entries: list[dict] = []
+
+        self.file = open(path, "wb")
+        self.offset = 0
+
+    def open_sink(self, vm_id: int) -> _ExaScriptOutputIndexedSink:
+        entry = {"vm_id": vm_id, "size": 0, "received": 0, "blocks": []}
+        self.entries.append(entry)
+
+        return _ExaScriptOutputIndexedSink(self, entry, self.max_bytes)
+
+    def write_block(self, data: bytes) -> tuple[int, int]:
+        block = self.compress(data)
+        self.file.write(block)
+
+        position = (self.offset, len(block))
+        self.offset += len(block)
+
+        return position
+
+    def close(self) -> list["ExaScriptOutputLog"]:
+        index = json.dumps(
+            {"compression": self.compression, "logs": self.entries}
+        ).encode()
+
+        self.file.write(index)
+        self.file.write(_INDEX_TRAILER.pack(len(index), _INDEX_MAGIC))
+        self.file.close()
+
+        return ExaScriptOutputIndexedFile(self.path).logs
+
+
+class ExaScriptOutputLog:
+    """
+    Output of one VM in :class:`ExaScriptOutputIndexedFile`.
+
+    Provides ``read_bytes()`` and ``read_text()`` like :class:`pathlib.Path` of log file.
+    """
+
+    def __init__(self, path: Path, compression: str | None, entry: dict):
+        self.path = path
+        self.compression = compression
+        self.vm_id: int = entry["vm_id"]
+        # Number of bytes stored and received, they differ if output was truncated
+        self.size: int = entry["size"]
+        self.received: int = entry["received"]
+        self.blocks: list[list[int]] = entry["blocks"]
+
+    @property
+    def is_truncated(self) -> bool:
+        return self.received > self.size
+
+    def read_bytes(self) -> bytes:
+        decompress = _get_codec(self.compression)[1]
+
+        with open(self.path, "rb") as f:
+            chunks = []
+
+            for offset, length in self.blocks:
+                f.seek(offset)
+                chunks.append(decompress(f.read(length)))
+
+        return b"".join(chunks)
+
+    def read_text(self, encoding: str = "utf-8", errors: str = "strict") -> str:
+        return self.read_bytes().decode(encoding, errors)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} path={self.path} vm_id={self.vm_id} size={self.size}>"
+
+
+class ExaScriptOutputIndexedFile:
+    """
+    Reader of UDF output file written with ``udf_output_indexed=True`` connection option.
+    """
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+
+        with open(self.path, "rb") as f:
+            f.seek(-_INDEX_TRAILER.size, os.SEEK_END)
+            index_length, magic = _INDEX_TRAILER.unpack(f.read(_INDEX_TRAILER.size))
+
+            if magic != _INDEX_MAGIC:
+                raise ValueError(f"Not an indexed UDF output file: {self.path}")
+
+            f.seek(-_INDEX_TRAILER.size - index_length, os.SEEK_END)
+            index = json.loads(f.read(index_length))
+
+        self.compression: str | None = index["compression"]
+        self.logs = [
+            ExaScriptOutputLog(self.path, self.compression, entry)
+            for entry in index["logs"]
         ]
 
-        if self.host:
-            args.append("--host")
-            args.append(self.host)
+    def __repr__(self):
+        return f"<{self.__class__.__name__} path={self.path} logs={len(self.logs)}>"
+
+
+class ExaScriptOutputDispatcher:
+    """
+    Calls ``on_output`` callback for every line of UDF output in a separate thread.
+
+    Lines are passed from the server through a bounded queue. If the callback is slower
+    than VMs, the queue fills up and the server stops reading. The server reads output
+    of all VMs in one thread, so all VMs are throttled by TCP flow control, not only
+    the VM producing output. Exception raised by the callback is stored, following
+    lines are discarded.
+    """
+
+    def __init__(
+        self,
+        on_output: Callable[[int, object], None],
+        json_decode: Callable[[str], object] | None = None,
+    ):
+        self.on_output = on_output
+        self.json_decode = json_decode
+        self.exc: BaseException | None = None
+        self.is_cancelled = False
+
+        self.queue: collections.deque[tuple[int, bytes] | None] = collections.deque()
+        self._cond = threading.Condition()
+
+        self.thread = threading.Thread(
+            target=self._run, name="pyexasol_udf_output_callback", daemon=True
+        )
+        self.thread.start()
+
+    def put(self, vm_id: int, line: bytes):
+        """
+        Wait for free space in the queue, line is discarded if dispatcher was cancelled.
+        """
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self.is_cancelled
+                or len(self.queue) < constant.UDF_OUTPUT_QUEUE_SIZE
+            )
+
+            if not self.is_cancelled:
+                self.queue.append((vm_id, line))
+                self._cond.notify_all()
+
+    def cancel(self):
+        """
+        Stop waiting in :meth:`put` immediately and discard following lines.
+        """
+        with self._cond:
+            self.is_cancelled = True
+            self._cond.notify_all()
+
+    def close(self):
+        """
+        Wait until callback was called for all lines.
+        """
+        with self._cond:
+            self.queue.append(None)
+            self._cond.notify_all()
+
+        self.thread.join()
+
+    def _get(self) -> tuple[int, bytes] | None:
+        with self._cond:
+            self._cond.wait_for(lambda: self.queue)
+            item = self.queue.popleft()
+            self._cond.notify_all()
+
+            return item
+
+    def _run(self):
+        while (item := self._get()) is not None:
+            if self.exc is not None:
+                continue
+
+            vm_id, line = item
+            value = line.decode(errors="replace").removesuffix("\r")
+
+            # Lines which are not valid JSON, e.g. tracebacks, are passed as strings
+            if self.json_decode is not None:
+                try:
+                    value = self.json_decode(value)
+                except ValueError:
+                    pass
+
+            try:
+                self.on_output(vm_id, value)
+            except BaseException as e:
+                self.exc = e
+
+
+class _ExaScriptOutputClient:
+    """
+    Connection of one VM, output is written into the sink of storage and split into lines
+    for the dispatcher. Output of connections not related to any statement is discarded.
+    """
+
+    def __init__(
+        self,
+        sock: socket.socket,
+        sink: _ExaScriptOutputSink | None = None,
+        vm_id: int = 0,
+        dispatcher: ExaScriptOutputDispatcher | None = None,
+    ):
+        self.sock = sock
+        self.sink = sink
+        self.vm_id = vm_id
+        self.dispatcher = dispatcher
+        self.partial_line = bytearray()
+
+    def write(self, data: bytes):
+        if self.sink is not None:
+            self.sink.write(data)
+
+    def split_lines(self, data: bytes) -> list[bytes]:
+        self.partial_line += data
+
+        if b"\n" in data:
+            *lines, rest = self.partial_line.split(b"\n")
+            self.partial_line = bytearray(rest)
+        else:
+            lines = []
+
+        if len(self.partial_line) >= constant.UDF_OUTPUT_MAX_LINE_SIZE:
+            lines.append(self.partial_line)
+            self.partial_line = bytearray()
+
+        return lines
+
+    def close(self):
+        try:
+            if self.sink is not None:
+                self.sink.close()
+        finally:
+            self.sock.close()
+
+
+class ExaScriptOutputSelectorServer:
+    """
+    In-process TCP server capturing UDF script output in script mode.
+
+    One background thread serves all VM connections with :mod:`selectors`, so thousands
+    of VMs connected in parallel do not require thousands of threads. Server is created
+    once per connection and reused by all statements, output of each statement is written
+    into its own storage, either a directory with one log file per VM or one indexed file.
+    """
+
+    def __init__(
+        self,
+        host: str | None = None,
+        port: int | None = None,
+        logger: logging.Logger | None = None,
+    ):
+        self.logger = logger
+        self.listen_socket = socket.create_server(
+            (host or "", port or 0), backlog=socket.SOMAXCONN
+        )
+        self.listen_socket.setblocking(False)
+        self.port = self.listen_socket.getsockname()[1]
+
+        # Socket pair wakes up the event loop on requests from other threads
+        self.wakeup_recv, self.wakeup_send = socket.socketpair()
+        self.wakeup_recv.setblocking(False)
+        self.wakeup_send.setblocking(False)
+
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.listen_socket, selectors.EVENT_READ)
+        self.selector.register(self.wakeup_recv, selectors.EVENT_READ)
 
-        if self.port:
-            args.append("--port")
-            args.append(str(self.port))
+        self.storage: (
+            ExaScriptOutputDirStorage | ExaScriptOutputIndexedStorage | None
+        ) = None
+        self.dispatcher: ExaScriptOutputDispatcher | None = None
+        self.connected_clients = 0
+        self.total_clients = 0
+        self.exc: BaseException | None = None
+        self.is_closed = False
 
-        self.proc = subprocess.Popen(args, stdout=subprocess.PIPE)
-        self.output_address = self.proc.stdout.readline().decode().rstrip("\n")
+        self._cond = threading.Condition()
+        self._loop_count = 0
+        self._required_loop_count = 0
+        self._is_abort_requested = False
 
-        self.proc.stdout.close()
+        self.thread = threading.Thread(
+            target=self._serve, name="pyexasol_udf_output", daemon=True
+        )
+        self.thread.start()
 
-    def get_output_address(self):
-        if self.output_address is None:
-            raise RuntimeError("Script output address 'host:port' is not available")
+    def get_output_address(self) -> str:
+        return f"{socket.gethostbyname(socket.getfqdn())}:{self.port}"
 
-        return self.output_address
+    def start_statement(
+        self,
+        storage: ExaScriptOutputDirStorage | ExaScriptOutputIndexedStorage,
+        dispatcher: ExaScriptOutputDispatcher | None = None,
+    ):
+        """
+        Write output of VMs connected from now on into ``storage`` enumerated by VM
+        and pass it line by line to ``dispatcher``.
 
-    def join(self):
-        if self.proc:
-            return self.proc.wait()
+        Storage is closed by caller after :meth:`finish_statement` or :meth:`abort_statement`.
+        """
+        with self._cond:
+            if self.is_closed:
+                raise RuntimeError("Script output server is closed")
 
-        return None
+            self.storage = storage
+            self.dispatcher = dispatcher
+            self.total_clients = 0
+            self.exc = None
 
-    def join_with_exc(self):
-        code = self.join()
+    def finish_statement(self):
+        """
+        Wait until all VMs of the current statement closed their connections.
 
-        if code != 0:
-            raise RuntimeError(
-                f"Script output server process finished with exitcode: {code}"
+        Must be called after the statement has finished, when no more VMs connect.
+        """
+        self._wait_loop(lambda: self.connected_clients == 0)
+
+        if self.exc is not None:
+            raise RuntimeError("Script output server failed") from self.exc
+
+    def abort_statement(self):
+        """
+        Close connections of the current statement without waiting for VMs.
+        """
+        with self._cond:
+            self._is_abort_requested = True
+
+            if self.dispatcher is not None:
+                self.dispatcher.cancel()
+
+        self._wait_loop(lambda: not self._is_abort_requested)
+
+    def close(self):
+        with self._cond:
+            if self.is_closed:
+                return
+
+            self.is_closed = True
+
+            if self.dispatcher is not None:
+                self.dispatcher.cancel()
+
+        self._wakeup()
+        self.thread.join()
+
+    def _wait_loop(self, predicate):
+        with self._cond:
+            # Second pass of event loop selects events which happened before this call,
+            # including connections waiting to be accepted
+            self._required_loop_count = self._loop_count + 2
+            self._wakeup()
+
+            self._cond.wait_for(
+                lambda: self.is_closed
+                or (self._loop_count >= self._required_loop_count and predicate())
             )
 
-        return code
+            self.storage = None
+            self.dispatcher = None
+
+    def _wakeup(self):
+        # Pending wakeup is enough if the socket buffer is full, socket is closed with the server
+        try:
+            self.wakeup_send.send(b"\0")
+        except OSError:
+            pass
+
+    def _serve(self):
+        try:
+            while not self.is_closed:
+                for key, _ in self.selector.select():
+                    if key.fileobj is self.listen_socket:
+                        self._accept()
+                    elif key.fileobj is self.wakeup_recv:
+                        self._drain_wakeup()
+                    else:
+                        self._read(key.data)
+
+                with self._cond:
+                    if self._is_abort_requested:
+                        self._close_clients()
+                        self._is_abort_requested = False
+
+                    self._loop_count += 1
+                    self._cond.notify_all()
+
+                    if self._loop_count < self._required_loop_count:
+                        self._wakeup()
+        except BaseException as e:
+            if self.logger is not None:
+                self.logger.error(f"Script output server failed: {e!r}")
+
+            with self._cond:
+                self.exc = e
+                self.is_closed = True
+                self._cond.notify_all()
+        finally:
+            self._close_clients()
+            self.selector.close()
+            self.listen_socket.close()
+            self.wakeup_recv.close()
+            self.wakeup_send.close()
+
+    def _accept(self):
+        while True:
+            try:
+                sock, _ = self.listen_socket.accept()
+            except BlockingIOError:
+                return
+
+            sock.setblocking(False)
+            storage = None
+            dispatcher = None
+
+            with self._cond:
+                if self.storage is not None:
+                    self.total_clients += 1
+                    storage = self.storage
+                    dispatcher = self.dispatcher
+
+                self.connected_clients += 1
+
+            try:
+                sink = (
+                    None if storage is None else storage.open_sink(self.total_clients)
+                )
+                client = _ExaScriptOutputClient(
+                    sock, sink, self.total_clients, dispatcher
+                )
+            except OSError as e:
+                self._fail_client(_ExaScriptOutputClient(sock, None), e)
+                continue
+
+            self.selector.register(sock, selectors.EVENT_READ, client)
+
+    def _read(self, client: _ExaScriptOutputClient):
+        try:
+            data = client.sock.recv(constant.UDF_OUTPUT_READ_SIZE)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+
+        try:
+            if data:
+                client.write(data)
+
+                if client.dispatcher is not None:
+                    for line in client.split_lines(data):
+                        client.dispatcher.put(client.vm_id, line)
+            else:
+                self._close_client(client)
+        except OSError as e:
+            self._fail_client(client, e)
+
+    def _fail_client(self, client: _ExaScriptOutputClient, exc: BaseException):
+        with self._cond:
+            self.exc = exc
+
+        try:
+            self._close_client(client)
+        except OSError:
+            pass
+
+    def _close_client(self, client: _ExaScriptOutputClient):
+        if self.selector.get_map().get(client.sock) is not None:
+            self.selector.unregister(client.sock)
+
+        with self._cond:
+            self.connected_clients -= 1
+
+        # Last line without line break
+        if client.dispatcher is not None and client.partial_line:
+            client.dispatcher.put(client.vm_id, client.partial_line)
+
+        client.close()
+
+    def _close_clients(self):
+        for key in list(self.selector.get_map().values()):
+            if isinstance(key.data, _ExaScriptOutputClient):
+                try:
+                    self._close_client(key.data)
+                except OSError:
+                    pass
+
+    def _drain_wakeup(self):
+        try:
+            while self.wakeup_recv.recv(1024):
+                pass
+        except BlockingIOError:
+            pass
 
-    def terminate(self):
-        if self.proc:
-            self.proc.terminate()
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} port={self.port} "
+            f"connected={self.connected_clients}>"
+        )
@@ -0,0 +1,277 @@
+"""
+On-disk spool of result sets, see :meth:`pyexasol.ExaStatement.fetch_to_spool`.
+
+Every chunk fetched from Exasol is written as one block. Positions of blocks are kept
+in memory, blocks are decoded lazily from a memory-mapped file on access.
+"""
+
+from __future__ import annotations
+
+import bisect
+import mmap
+import os
+import pickle
+import tempfile
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    Sequence,
+)
+from pathlib import Path
+
+SPOOL_FORMATS = ("pickle", "arrow-ipc")
+
+
+class _PickleSpoolFile:
+    """
+    Blocks are lists of row tuples serialized with pickle, stored one after another
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.block_offsets: list[int] = [0]
+        self.mmap: mmap.mmap | None = None
+
+    def write(self, blocks: Iterable[list[tuple]], col_types: list[dict]) -> list[int]:
+        block_rows = []
+
+        with open(self.path, "wb") as f:
+            for rows in blocks:
+                f.write(pickle.dumps(rows, protocol=pickle.HIGHEST_PROTOCOL))
+                self.block_offsets.append(f.tell())
+                block_rows.append(len(rows))
+
+        return block_rows
+
+    def open(self):
+        # Empty file cannot be memory-mapped
+        if self.block_offsets[-1] > 0:
+            with open(self.path, "rb") as f:
+                self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def read_block(self, idx: int) -> list[tuple]:
+        with memoryview(self.mmap) as view:
+            return pickle.loads(
+                view[self.block_offsets[idx] : self.block_offsets[idx + 1]]
+            )
+
+    def close(self):
+        if self.mmap is not None:
+            self.mmap.close()
+            self.mmap = None
+
+
+class _ArrowSpoolFile:
+    """
+    Blocks are record batches of Arrow IPC file, which are read without copying
+    """
+
+    def __init__(self, path: Path, col_names: list[str]):
+        self.path = path
+        self.col_names = col_names
+        self.reader = None
+        self.source = None
+
+    @staticmethod
+    def get_arrow_type(data_type: dict):
+        import pyarrow
+
+        if data_type["type"] == "DOUBLE":
+            return pyarrow.float64()
+        if data_type["type"] == "BOOLEAN":
+            return pyarrow.bool_()
+        # Exasol returns decimals with scale and big decimals as strings
+        if (
+            data_type["type"] == "DECIMAL"
+            and data_type["scale"] == 0
+            and data_type["precision"] <= 18
+        ):
+            return pyarrow.int64()
+
+        return pyarrow.large_string()
+
+    def write(self, blocks: Iterable[list[tuple]], col_types: list[dict]) -> list[int]:
+        import pyarrow
+
+        schema = pyarrow.schema(
+            [
+                (name, self.get_arrow_type(data_type))
+                for name, data_type in zip(self.col_names, col_types)
+            ]
+        )
+        block_rows = []
+
+        with pyarrow.ipc.new_file(str(self.path), schema) as writer:
+            for rows in blocks:
+                columns = list(zip(*rows))
+                writer.write_batch(
+                    pyarrow.record_batch(
+                        [
+                            pyarrow.array(column, type=field.type)
+                            for column, field in zip(columns, schema)
+                        ],
+                        schema=schema,
+                    )
+                )
+                block_rows.append(len(rows))
+
+        return block_rows
+
+    def open(self):
+        import pyarrow
+
+        self.source = pyarrow.memory_map(str(self.path), "r")
+        self.reader = pyarrow.ipc.open_file(self.source)
+
+    def read_block(self, idx: int) -> list[tuple]:
+        batch = self.reader.get_batch(idx)
+        return list(zip(*(column.to_pylist() for column in batch.columns)))
+
+    def close(self):
+        if self.source is not None:
+            self.source.close()
+            self.source = None
+            self.reader = None
+
+
+class ExaResultSpool(Sequence):
+    """
+    Read-only sequence of rows of a result set spooled to disk.
+
+    Rows are returned exactly like :class:`pyexasol.ExaStatement` returns them,
+    as ``tuple``, ``dict`` or :class:`pyexasol.ExaRecord` with ``fetch_mapper`` applied. Only one decoded block
+    is kept in memory, so sequential access is much faster than random access.
+
+    You may iterate over the spool any number of times without running the query again.
+    Call :meth:`close` to release the file, temporary file is deleted.
+    """
+
+    def __init__(
+        self,
+        blocks: Iterable[list[tuple]],
+        col_names: list[str],
+        col_types: list[dict],
+        path: Path | str | None = None,
+        format: str = "pickle",
+        fetch_mapper: Callable | None = None,
+        fetch_dict: bool = False,
+        row_maker: Callable | None = None,
+    ):
+        if format not in SPOOL_FORMATS:
+            raise ValueError(
+                f"Unsupported spool format [{format}], "
+                f"supported formats: {', '.join(SPOOL_FORMATS)}"
+            )
+
+        self.format = format
+        self.col_names = col_names
+        self.col_types = col_types
+        self.fetch_mapper = fetch_mapper
+        self.fetch_dict = fetch_dict
+        self.row_maker = row_maker
+        self.is_closed = False
+
+        # Temporary file is owned by spool, custom file is kept after close()
+        self.is_temporary = path is None
+
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix="pyexasol_spool_", suffix=f".{format}")
+            os.close(fd)
+
+        self.path = Path(path)
+
+        if format == "arrow-ipc":
+            self._file = _ArrowSpoolFile(self.path, col_names)
+        else:
+            self._file = _PickleSpoolFile(self.path)
+
+        try:
+            block_rows = self._file.write(blocks, col_types)
+            self._file.open()
+        except BaseException:
+            self.close()
+            raise
+
+        # Position of the first row of every block, last item is the total number of rows
+        self.row_offsets = [0]
+        for num_rows in block_rows:
+            self.row_offsets.append(self.row_offsets[-1] + num_rows)
+
+        self._block_idx: int | None = None
+        self._block: list[tuple] = []
+
+    def __len__(self) -> int:
+        return self.row_offsets[-1]
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+
+        if idx < 0:
+            idx += len(self)
+
+        if not 0 <= idx < len(self):
+            raise IndexError("Spool index out of range")
+
+        block_idx = bisect.bisect_right(self.row_offsets, idx) - 1
+
+        return self._map_row(
+            self._get_block(block_idx)[idx - self.row_offsets[block_idx]]
+        )
+
+    def __iter__(self) -> Iterator:
+        for block_idx in range(len(self.row_offsets) - 1):
+            for row in self._get_block(block_idx):
+                yield self._map_row(row)
+
+    def close(self):
+        """
+        Close spool file, temporary file is deleted.
+        """
+        if self.is_closed:
+            return
+
+        self._file.close()
+        self._block = []
+        self._block_idx = None
+        self.is_closed = True
+
+        if self.is_temporary:
+            self.path.unlink(missing_ok=True)
+
+    def _get_block(self, block_idx: int) -> list[tuple]:
+        if self.is_closed:
+            raise ValueError("Spool is closed")
+
+        if self._block_idx != block_idx:
+            self._block = self._file.read_block(block_idx)
+            self._block_idx = block_idx
+
+        return self._block
+
+    def _map_row(self, row: tuple):
+        if self.fetch_mapper:
+            row = tuple(map(self.fetch_mapper, row, self.col_types))
+
+        if self.fetch_dict:
+            row = dict(zip(self.col_names, row))
+        elif self.row_maker is not None:
+            row = self.row_maker(row)
+
+        return row
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} path={self.path} format={self.format} rows={len(self)}>"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
@@ -3,6 +3,10 @@ import itertools
 
 from . import constant
 from .exceptions import ExaRuntimeError
+from .row import (
+    FETCH_ROWS_MODES,
+    record_row_factory,
+)
 
 
 class ExaStatement:
@@ -14,7 +18,9 @@ class ExaStatement:
 
     Note:
         :class:`pyexasol.ExaStatement` may fetch result set rows as ``tuples`` (default)
-        or as ``dict`` (set `fetch_dict=True` in connection options).
+        or as ``dict`` (set `fetch_dict=True` in connection options)
+        or as :class:`pyexasol.ExaRecord` (set `fetch_rows="record"` in connection options)
+        or as objects created by custom row factory (set `row_factory=<func>` in connection options).
 
         :class:`pyexasol.ExaStatement` may use custom data-type mapper during fetching
         (set `fetch_mapper=<func>` in connection options).
@@ -62,6 +68,12 @@ class ExaStatement:
         self.fetch_dict = options.get(
             "fetch_dict", self.connection.options["fetch_dict"]
         )
+        self.fetch_rows = options.get(
+            "fetch_rows", self.connection.options["fetch_rows"]
+        )
+        self._row_factory = options.get(
+            "row_factory", self.connection.options["row_factory"]
+        )
         self.fetch_mapper = options.get(
             "fetch_mapper", self.connection.options["fetch_mapper"]
         )
@@ -72,9 +84,20 @@ class ExaStatement:
             "lower_ident", self.connection.options["lower_ident"]
         )
 
+        if self.fetch_rows not in FETCH_ROWS_MODES:
+            raise ValueError(
+                f"Unsupported fetch_rows [{self.fetch_rows}], "
+                f"supported values: {', '.join(FETCH_ROWS_MODES)}"
+            )
+
+        if self.fetch_rows == "dict":
+            self.fetch_dict = True
+
         self.data_zip = zip()
         self.col_names = []
         self.col_types = []
+        # Converts row tuple into object returned by fetch functions, set per result set
+        self.row_maker = None
 
         self.num_columns = 0
         self.num_rows_total = 0
@@ -114,7 +137,8 @@ class ExaStatement:
         The best way to fetch result set of statement is to use iterator:
 
         Yields:
-            ``tuple`` or ``dict`` depending on ``fetch_dict`` connection option.
+            ``tuple``, ``dict``, :class:`pyexasol.ExaRecord` or custom object depending on
+            ``fetch_dict``, ``fetch_rows`` and ``row_factory`` connection options.
 
         Examples:
 
@@ -145,12 +169,33 @@ class ExaStatement:
 
         if self.fetch_dict:
             row = dict(zip(self.col_names, row))
+        elif self.row_maker is not None:
+            row = self.row_maker(row)
 
         self.pos_total += 1
         self.pos_chunk += 1
 
         return row
 
+    @property
+    def row_factory(self):
+        """
+        Function called once per result set with a ``tuple`` of column names,
+        which returns a function converting every row ``tuple`` into the fetched object.
+
+        Built-in factories are available in :mod:`pyexasol.row`.
+        It may be changed before fetching, similar to ``sqlite3.Cursor.row_factory``.
+        Ignored if ``fetch_dict=True``.
+        """
+        return self._row_factory
+
+    @row_factory.setter
+    def row_factory(self, value):
+        self._row_factory = value
+
+        if self.result_type == "resultSet":
+            self._init_row_maker()
+
     def fetchone(self):
         """
         Fetches one row of data.
@@ -190,9 +235,42 @@ class ExaStatement:
 
         Warning:
             This function may exhaust available memory.
+            Consider :meth:`fetch_to_spool` for huge result sets.
         """
         return [row for row in self]
 
+    def fetch_to_spool(self, path=None, format="pickle"):
+        """
+        Fetches all remaining rows into a file on disk.
+
+        Args:
+            path:
+                Path of spool file. Temporary file is created and deleted
+                on :meth:`pyexasol.ExaResultSpool.close` if not set.
+            format:
+                ``"pickle"`` or ``"arrow-ipc"`` (requires ``pyarrow``).
+
+        Returns:
+            :class:`pyexasol.ExaResultSpool`, read-only sequence of rows.
+            Rows are decoded lazily from a memory-mapped file.
+
+        Tip:
+            Use it to iterate over huge result sets multiple times without
+            running the query again and without holding all rows in memory.
+        """
+        from .spool import ExaResultSpool
+
+        return ExaResultSpool(
+            self._fetch_raw_chunks(),
+            col_names=self.col_names,
+            col_types=self.col_types,
+            path=path,
+            format=format,
+            fetch_mapper=self.fetch_mapper,
+            fetch_dict=self.fetch_dict,
+            row_maker=self.row_maker,
+        )
+
     def fetchcol(self):
         """
         Fetches all values from the first column.
@@ -202,6 +280,7 @@ class ExaStatement:
             Empty ``list`` if all rows were fetched previously.
         """
         self.fetch_dict = False
+        self.row_maker = None
         return [row[0] for row in self]
 
     def fetchval(self):
@@ -217,6 +296,7 @@ class ExaStatement:
             ``SELECT count(*) FROM table``.
         """
         self.fetch_dict = False
+        self.row_maker = None
 
         try:
             row = next(self)
@@ -340,6 +420,10 @@ class ExaStatement:
         self.execution_time = self.connection.ws_req_time
         self._init_result_set(ret)
 
+        # DDL statements return row count, metadata of affected objects may be cached
+        if self.result_type == "rowCount" and self.connection.meta.cache is not None:
+            self.connection.meta._invalidate_by_query(self.query)
+
     def _execute_meta_nosql(self):
         meta_params = self.query_params if self.query_params is not None else {}
 
@@ -398,6 +482,16 @@ class ExaStatement:
         ...)
         >>> exa_stmt.execute_prepared( [('A', 1), ('B', 2), ('C', 3)] )
         """
+        if data:
+            self._execute_prepared_columns(list(zip(*data)), len(data))
+        else:
+            self._execute_prepared_columns([], 0)
+
+    def _execute_prepared_columns(self, data_columns: list, num_rows: int):
+        """
+        Same as :meth:`execute_prepared`, but data is already in columnar format,
+        which is the format expected by Exasol
+        """
         if self.connection.is_closed or not self.statement_handle:
             raise ExaRuntimeError(
                 self.connection, "Prepared statement is already closed"
@@ -409,11 +503,11 @@ class ExaStatement:
                 "numColumns": (
                     self.parameter_data["numColumns"] if self.parameter_data else 0
                 ),
-                "numRows": len(data) if data else 0,
+                "numRows": num_rows,
                 "columns": (
                     self.parameter_data["columns"] if self.parameter_data else []
                 ),
-                "data": list(zip(*data)) if data else [],
+                "data": data_columns,
             }
         )
 
@@ -450,6 +544,7 @@ class ExaStatement:
             self.num_rows_chunk = res["resultSet"]["numRowsInMessage"]
 
             self._check_duplicate_col_names()
+            self._init_row_maker()
         elif self.result_type == "rowCount":
             self.row_count = res["rowCount"]
         else:
@@ -457,6 +552,14 @@ class ExaStatement:
                 self.connection, f"Unknown resultType: {self.result_type}"
             )
 
+    def _init_row_maker(self):
+        if self._row_factory is not None:
+            self.row_maker = self._row_factory(tuple(self.col_names))
+        elif self.fetch_rows == "record":
+            self.row_maker = record_row_factory(tuple(self.col_names))
+        else:
+            self.row_maker = None
+
     def _next_chunk(self):
         ret = self.connection.req(
             {
@@ -467,14 +570,45 @@ class ExaStatement:
             }
         )
 
-        if "data" in ret["responseData"]:
-            self.data_zip = zip(*ret["responseData"]["data"])
+        self._init_chunk(ret["responseData"])
+
+    def _init_chunk(self, response_data):
+        if "data" in response_data:
+            self.data_zip = zip(*response_data["data"])
         else:
             self.data_zip = zip()
 
-        self.num_rows_chunk = ret["responseData"]["numRows"]
+        self.num_rows_chunk = response_data["numRows"]
         self.pos_chunk = 0
 
+    def _fetch_raw_chunks(self):
+        """
+        Yields remaining rows of every chunk as a list, without mapping rows
+        """
+        if self.result_type != "resultSet":
+            raise ExaRuntimeError(
+                self.connection,
+                "Attempt to fetch from statement without result set",
+            )
+
+        while self.pos_total < self.num_rows_total:
+            if self.pos_chunk >= self.num_rows_chunk:
+                self._next_chunk()
+
+            rows = list(
+                itertools.islice(self.data_zip, self.num_rows_chunk - self.pos_chunk)
+            )
+
+            if not rows:
+                break
+
+            self.pos_total += len(rows)
+            self.pos_chunk += len(rows)
+
+            yield rows
+
+        self._close_result_set_handle()
+
     def _check_duplicate_col_names(self):
         """
         Exasol allows duplicate names in result sets, but it leads to various problems related to dictionaries
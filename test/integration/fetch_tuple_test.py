@@ -210,3 +210,16 @@ def test_fetch_a_single_value(connection):
     expected = "Jessica Mccoy"
     actual = result.fetchval()
     assert expected == actual
+
+
+@pytest.mark.fetch_tuple
+@pytest.mark.parametrize("format", ["pickle", "arrow-ipc"])
+def test_fetch_to_spool(connection, format):
+    statement = "SELECT * FROM USERS ORDER BY USER_ID;"
+    expected = connection.execute(statement).fetchall()
+
+    # Small chunks to spool multiple blocks
+    result = connection.cls_statement(connection, statement, fetch_size_bytes=1024)
+    with result.fetch_to_spool(format=format) as spool:
+        assert list(spool) == expected
+        assert spool[-1] == expected[-1]
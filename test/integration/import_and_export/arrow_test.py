@@ -0,0 +1,34 @@
+from test.integration.import_and_export.helper import select_result
+
+import pyarrow as pa
+import pytest
+
+
+@pytest.mark.parquet
+class TestImportFromArrow:
+    @staticmethod
+    def test_import_table(connection, empty_table, table_name, all_data):
+        table = pa.Table.from_pylist(all_data.list_dict)
+
+        connection.import_from_arrow(table, table_name)
+
+        assert select_result(connection) == all_data.list_tuple()
+
+    @staticmethod
+    def test_import_record_batch_reader(connection, empty_table, table_name, all_data):
+        table = pa.Table.from_pylist(all_data.list_dict)
+
+        connection.import_from_arrow(table.to_reader(max_chunksize=3), table_name)
+
+        assert select_result(connection) == all_data.list_tuple()
+
+    @staticmethod
+    @pytest.mark.pandas
+    def test_import_pandas_dataframe(connection, empty_table, table_name, all_data):
+        import pandas as pd
+
+        df = pd.DataFrame(all_data.list_dict)
+
+        connection.import_from_arrow(df, table_name)
+
+        assert select_result(connection) == all_data.list_tuple()
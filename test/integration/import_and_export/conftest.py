@@ -120,6 +120,12 @@ def connection_without_resolving_hostnames(connection_factory):
         yield con
 
 
+@pytest.fixture
+def connection_with_http_pool(connection_factory):
+    with connection_factory(compression=True, http_pool_size=2) as con:
+        yield con
+
+
 @pytest.fixture
 def connection_with_quote_indent(connection_factory):
     con = connection_factory(quote_ident=True)
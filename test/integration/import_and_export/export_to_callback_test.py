@@ -94,6 +94,15 @@ class TestExportGeneral:
 
         assert output_filepath.read_text() == all_data.csv_str()
 
+    @staticmethod
+    def test_http_transport_stats(connection, fill_table, output_filepath):
+        connection.export_to_file(dst=output_filepath, query_or_table=fill_table)
+
+        stats = connection.last_http_transport_stats()
+        assert stats.data_bytes == output_filepath.stat().st_size
+        assert stats.chunks > 0
+        assert stats.time_to_first_byte <= stats.total_time
+
 
 @pytest.mark.etl
 @pytest.mark.exceptions
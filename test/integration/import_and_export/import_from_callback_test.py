@@ -131,6 +131,20 @@ class TestImportGeneral:
 
         assert select_result(connection) == all_data.list_tuple()
 
+    @staticmethod
+    def test_back_to_back_imports_with_http_pool(
+        connection_with_http_pool, empty_table, tmp_path, all_data
+    ):
+        filepath = all_data.write_csv(directory=tmp_path)
+
+        for _ in range(3):
+            connection_with_http_pool.import_from_file(src=filepath, table=empty_table)
+
+        count = connection_with_http_pool.execute(
+            f"SELECT COUNT(*) FROM {empty_table}"
+        ).fetchval()
+        assert count == 3 * len(all_data.list_tuple())
+
 
 @pytest.mark.etl
 @pytest.mark.exceptions
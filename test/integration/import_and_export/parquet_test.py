@@ -78,6 +78,42 @@ class TestExportToParquet:
         assert m.call_count == 0
 
 
+@pytest.mark.parquet
+class TestExportToParquetParallel:
+    @staticmethod
+    def test_export_from_multiple_streams(
+        connection, fill_table, tmp_path, table_name, all_data
+    ):
+        expected = prepare_parquet_table(all_data.list_dict)
+
+        connection.export_to_parquet_parallel(
+            dst=tmp_path, query_or_table=table_name, pool_size=3
+        )
+
+        assert {p.name for p in tmp_path.glob("*")} <= {
+            f"{idx:03}-part-0.parquet" for idx in range(1, 4)
+        }
+        actual = pq.read_table(tmp_path).sort_by("FIRST_NAME")
+        assert actual == expected.sort_by("FIRST_NAME")
+
+    @staticmethod
+    def test_export_partitioned(connection, fill_table, tmp_path, table_name):
+        connection.export_to_parquet_parallel(
+            dst=tmp_path,
+            query_or_table=table_name,
+            pool_size=2,
+            callback_params={
+                "partitioning": ["IS_GRADUATING"],
+                "partitioning_flavor": "hive",
+            },
+        )
+
+        assert {p.name for p in tmp_path.glob("*")} <= {
+            "IS_GRADUATING=0",
+            "IS_GRADUATING=1",
+        }
+
+
 @pytest.mark.parquet
 class TestImportFromParquet:
     @staticmethod
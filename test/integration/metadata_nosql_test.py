@@ -100,3 +100,12 @@ def test_list_keywords(connection, expected_reserved_words):
     expected = expected_reserved_words
     actual = set(connection.meta.list_sql_keywords())
     assert actual == expected
+
+
+@pytest.mark.metadata
+def test_list_tables_with_meta_nosql_option(connection_factory):
+    with connection_factory(meta_nosql=True) as connection:
+        tables = connection.meta.list_tables("PYEXASOL_TEST")
+    expected = {"USERS", "PAYMENTS"}
+    actual = {table["NAME"] for table in tables}
+    assert actual == expected
@@ -46,6 +46,27 @@ def test_view_exits_returns_false_for_non_existing_view(connection):
     assert not connection.meta.view_exists(view)
 
 
+@pytest.mark.metadata
+def test_tables_exist(connection, schema, view):
+    tables = ["users", (schema, "PAYMENTS"), "this_table_should_not_exist_____", view]
+    expected = {table: connection.meta.table_exists(table) for table in tables}
+    assert connection.meta.tables_exist(tables) == expected
+    assert connection.meta.views_exist([view, "users"]) == {view: True, "users": False}
+
+
+@pytest.mark.metadata
+def test_columns_for(connection, schema, view):
+    columns = connection.meta.list_columns(schema, "USERS")
+    expected = [
+        c["COLUMN_NAME"]
+        for c in sorted(columns, key=lambda c: c["COLUMN_ORDINAL_POSITION"])
+    ]
+    actual = connection.meta.columns_for(["users", view, "this_table_should_not_exist"])
+    assert [c["COLUMN_NAME"] for c in actual["users"]] == expected
+    assert [c["COLUMN_NAME"] for c in actual[view]] == expected
+    assert actual["this_table_should_not_exist"] == []
+
+
 @pytest.mark.metadata
 def test_list_schemas(connection):
     expected = ["PYEXASOL_TEST"]
@@ -42,12 +42,13 @@ def test_export_sql_result_to_pandas(connection):
 @pytest.mark.parametrize(
     "connection", ["connection", "connection_with_compression"], indirect=True
 )
+@pytest.mark.parametrize("method", ["import", "prepared", "auto"])
 @pytest.mark.pandas
-def test_import_from_pandas(connection, empty_table, names):
+def test_import_from_pandas(connection, empty_table, names, method):
     table_name = empty_table
 
     df = pd.DataFrame.from_records(names)
-    connection.import_from_pandas(df, table_name)
+    connection.import_from_pandas(df, table_name, method=method)
     connection.commit()
 
     result = connection.execute(
@@ -60,3 +61,30 @@ def test_import_from_pandas(connection, empty_table, names):
     )
 
     assert actual == expected
+
+
+@pytest.mark.parametrize(
+    "connection", ["connection", "connection_with_compression"], indirect=True
+)
+@pytest.mark.pandas
+def test_export_table_to_pandas_chunks(connection, table):
+    table_name, values = table
+
+    expected = pd.DataFrame.from_records(values)
+    chunks = list(connection.export_to_pandas_chunks(table_name, chunksize=2))
+
+    assert all(len(chunk) <= 2 for chunk in chunks)
+    assert pd.concat(chunks).equals(expected)
+
+
+@pytest.mark.pandas
+def test_export_to_pandas_chunks_stops_early(connection):
+    query = "SELECT USER_NAME, USER_ID FROM USERS ORDER BY USER_ID ASC"
+
+    chunks = connection.export_to_pandas_chunks(query, chunksize=5)
+    first_chunk = next(chunks)
+    chunks.close()
+
+    assert list(first_chunk["USER_ID"]) == [0, 1, 2, 3, 4]
+    # connection is still usable after the EXPORT was aborted
+    assert connection.execute("SELECT 1").fetchval() == 1
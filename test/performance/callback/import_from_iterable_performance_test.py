@@ -0,0 +1,58 @@
+import csv
+import datetime
+import decimal
+import io
+import os
+
+import pytest
+
+from pyexasol.callback import import_from_iterable
+
+NUMBER_OF_ROWS = 200_000
+
+
+def _csv_writer_import_from_iterable(pipe, src, **kwargs):
+    """Row by row implementation used by `import_from_iterable` before batching"""
+    wrapped_pipe = io.TextIOWrapper(pipe, newline="\n", encoding="utf-8")
+    writer = csv.writer(
+        wrapped_pipe, lineterminator="\n", quoting=csv.QUOTE_NONNUMERIC, **kwargs
+    )
+
+    for row in src:
+        writer.writerow(row)
+
+    # Do not close the pipe when the wrapper is garbage collected
+    wrapped_pipe.detach()
+
+
+@pytest.fixture(scope="module")
+def rows():
+    sales_timestamp = datetime.datetime(2024, 1, 1, 0, 0, 0)
+    return [
+        (
+            i,
+            sales_timestamp + datetime.timedelta(seconds=i),
+            decimal.Decimal(i % 125) / 4,
+            i * 0.25,
+            f"customer {i % 1000}",
+            None if i % 10 else "note",
+        )
+        for i in range(NUMBER_OF_ROWS)
+    ]
+
+
+@pytest.fixture
+def pipe():
+    with open(os.devnull, "wb", 0) as devnull:
+        yield devnull
+
+
+@pytest.mark.parametrize(
+    "callback",
+    [
+        pytest.param(_csv_writer_import_from_iterable, id="csv_writer"),
+        pytest.param(import_from_iterable, id="batched"),
+    ],
+)
+def test_import_from_iterable_serialization(benchmark, rows, pipe, callback):
+    benchmark.pedantic(callback, args=(pipe, rows), iterations=1, rounds=10)
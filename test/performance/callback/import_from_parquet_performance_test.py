@@ -0,0 +1,49 @@
+import os
+
+import pyarrow as pa
+import pytest
+from pyarrow import compute as pc
+from pyarrow import parquet as pq
+
+from pyexasol.callback import import_from_parquet
+
+NUMBER_OF_FILES = 8
+ROWS_PER_FILE = 100_000
+
+
+@pytest.fixture(scope="module")
+def parquet_dir(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("parquet")
+
+    for i in range(NUMBER_OF_FILES):
+        ids = pa.array(range(i * ROWS_PER_FILE, (i + 1) * ROWS_PER_FILE))
+        table = pa.Table.from_pydict(
+            {
+                "id": ids,
+                "amount": pc.divide(pc.cast(ids, pa.float64()), 4),
+                "name": pc.binary_join_element_wise(
+                    "customer ", pc.cast(ids, pa.string()), ""
+                ),
+            }
+        )
+        pq.write_table(table, directory / f"file_{i}.parquet", row_group_size=20_000)
+
+    return directory
+
+
+@pytest.fixture
+def pipe():
+    with open(os.devnull, "wb", 0) as devnull:
+        yield devnull
+
+
+@pytest.mark.parquet
+@pytest.mark.parametrize("max_workers", [None, 2, 4], ids=lambda w: f"max_workers={w}")
+def test_import_from_parquet_decode(benchmark, parquet_dir, pipe, max_workers):
+    benchmark.pedantic(
+        import_from_parquet,
+        args=(pipe, parquet_dir),
+        kwargs={"max_workers": max_workers},
+        iterations=1,
+        rounds=5,
+    )
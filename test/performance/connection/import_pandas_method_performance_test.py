@@ -0,0 +1,83 @@
+"""
+Benchmark to find the crossover point between INSERT prepared statement and IMPORT
+for :meth:`pyexasol.ExaConnection.import_from_pandas`.
+
+Results are grouped by number of rows. Memory usage of the data frame is stored in
+``extra_info`` and should be compared with ``constant.PANDAS_PREPARED_IMPORT_MAX_BYTES``,
+which is used by ``method="auto"``.
+"""
+
+from test.performance.connection.helper import create_empty_table
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyexasol import ExaConnection
+
+IMPORT_TABLE_NAME = "TMP_SALES_PANDAS_METHOD"
+
+ROWS = [1_000, 5_000, 20_000, 50_000, 200_000]
+
+
+@pytest.fixture
+def empty_import_into_table(connection: ExaConnection):
+    create_empty_table(connection=connection, table_name=IMPORT_TABLE_NAME)
+
+    yield IMPORT_TABLE_NAME
+
+    ddl = f"DROP TABLE IF EXISTS {IMPORT_TABLE_NAME};"
+    connection.execute(ddl)
+    connection.commit()
+
+
+def _create_dataframe(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed=42)
+    return pd.DataFrame(
+        {
+            "SALES_TIMESTAMP": pd.Timestamp("2024-01-01")
+            + pd.to_timedelta(rng.integers(0, 365 * 24 * 60 * 60, rows), unit="s"),
+            "PRICE": rng.integers(100, 12_500, rows) / 100,
+            "CUSTOMER_NAME": rng.integers(0, 1_000_000, rows).astype(str),
+        }
+    )
+
+
+@pytest.mark.parametrize("rows", ROWS)
+@pytest.mark.parametrize("method", ["import", "prepared", "auto"])
+def test_import_from_pandas_method(
+    benchmark,
+    benchmark_specs,
+    connection: ExaConnection,
+    columns,
+    empty_import_into_table,
+    method: str,
+    rows: int,
+):
+    data = _create_dataframe(rows)
+
+    benchmark.group = f"import_from_pandas_{rows}_rows"
+    benchmark.extra_info["memory_usage"] = int(data.memory_usage(deep=True).sum())
+
+    def setup():
+        connection.execute(f"TRUNCATE TABLE {empty_import_into_table}")
+
+    def func_to_be_measured():
+        return connection.import_from_pandas(
+            data,
+            table=empty_import_into_table,
+            import_params={"columns": columns},
+            method=method,
+        )
+
+    benchmark.pedantic(
+        func_to_be_measured,
+        setup=setup,
+        iterations=1,
+        rounds=benchmark_specs.rounds,
+        warmup_rounds=benchmark_specs.warm_up_rounds,
+    )
+
+    count_query = f"SELECT count(*) FROM {empty_import_into_table};"
+    count = connection.execute(count_query).fetchval()
+    assert count == rows
@@ -0,0 +1,63 @@
+"""
+Benchmark of ``list_*`` functions of :class:`pyexasol.ExaMetaData` comparing SQL queries
+against system views with snapshot hint and metadata commands of WebSocket protocol v2,
+see ``meta_nosql`` connection option.
+"""
+
+import pytest
+
+NUM_TABLES = 200
+
+
+@pytest.fixture(scope="module")
+def many_tables(connection_factory):
+    con = connection_factory()
+    names = [f"TMP_META_{i}" for i in range(NUM_TABLES)]
+
+    for name in names:
+        con.execute(
+            f"CREATE OR REPLACE TABLE {name} (ID DECIMAL(18,0), NAME VARCHAR(100))"
+        )
+    con.commit()
+
+    yield names
+
+    for name in names:
+        con.execute(f"DROP TABLE IF EXISTS {name}")
+    con.commit()
+    con.close()
+
+
+@pytest.fixture(params=[False, True], ids=["sql", "nosql"])
+def meta_connection(request, connection_factory):
+    con = connection_factory(meta_nosql=request.param)
+    yield con
+    con.close()
+
+
+@pytest.mark.parametrize(
+    "func_name, args",
+    [
+        ("list_schemas", ()),
+        ("list_tables", ("%", "TMP_META_%")),
+        ("list_columns", ("%", "TMP_META_%")),
+    ],
+)
+def test_list_metadata(
+    benchmark, benchmark_specs, many_tables, meta_connection, func_name, args
+):
+    benchmark.group = f"meta_{func_name}"
+    func = getattr(meta_connection.meta, func_name)
+
+    result = benchmark.pedantic(
+        func,
+        args=args,
+        iterations=1,
+        rounds=benchmark_specs.rounds,
+        warmup_rounds=benchmark_specs.warm_up_rounds,
+    )
+
+    if func_name == "list_tables":
+        assert len(result) == NUM_TABLES
+    elif func_name == "list_columns":
+        assert len(result) == 2 * NUM_TABLES
@@ -0,0 +1,83 @@
+"""
+Microbenchmarks of :meth:`pyexasol.ExaFormatter.format` with compiled templates
+compared to :class:`string.Formatter` and of bulk formatting of long lists compared
+to formatting value by value. They do not require a database.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from pyexasol import ExaFormatter
+
+TEMPLATE = """
+    SELECT user_id, user_name
+    FROM {schema!q}.{table!i}
+    WHERE user_id IN ({user_ids!d})
+        AND user_name LIKE {user_name}
+        AND user_score > {user_score!f}
+    ORDER BY {order_by!i}
+"""
+
+PARAMS = {
+    "schema": "PYEXASOL_TEST",
+    "table": "USERS",
+    "user_ids": [1, 2, 3, 4, 5],
+    "user_name": "O'Reilly%",
+    "user_score": 12.5,
+    "order_by": "USER_ID",
+}
+
+
+class StdlibExaFormatter(ExaFormatter):
+    def convert_field(self, value, conversion):
+        return super().convert_field(value, conversion)
+
+
+@pytest.mark.parametrize(
+    "cls", [ExaFormatter, StdlibExaFormatter], ids=["compiled", "string_formatter"]
+)
+def test_format(benchmark, cls):
+    formatter = cls(
+        SimpleNamespace(options={"quote_ident": False, "format_max_list_size": None})
+    )
+
+    benchmark.group = "formatter_format"
+    result = benchmark(formatter.format, TEMPLATE, **PARAMS)
+
+    assert "IN (1, 2, 3, 4, 5)" in result
+
+
+class PerValueExaFormatter(ExaFormatter):
+    @classmethod
+    def safe_decimal(cls, val):
+        return super().safe_decimal(val)
+
+    @classmethod
+    def quote(cls, val):
+        return super().quote(val)
+
+
+LIST_SIZE = 50_000
+
+
+@pytest.mark.parametrize(
+    "cls", [ExaFormatter, PerValueExaFormatter], ids=["bulk", "per_value"]
+)
+@pytest.mark.parametrize(
+    "template, values",
+    [
+        ("user_id IN ({values!d})", list(range(LIST_SIZE))),
+        ("user_name IN ({values})", [f"user_{i}" for i in range(LIST_SIZE)]),
+    ],
+    ids=["int", "str"],
+)
+def test_format_list(benchmark, cls, template, values):
+    formatter = cls(
+        SimpleNamespace(options={"quote_ident": False, "format_max_list_size": None})
+    )
+
+    benchmark.group = f"formatter_format_list_{type(values[0]).__name__}"
+    result = benchmark(formatter.format, template, values=values)
+
+    assert result.count(", ") == LIST_SIZE - 1
@@ -0,0 +1,88 @@
+"""
+Microbenchmark of chunked HTTP framing in :class:`pyexasol.http_transport.ExaHttpRequestHandler`
+
+It does not need an Exasol database. A local socket pair is used instead, the
+benchmark is measured in CPU time and the throughput is reported as
+``bytes_per_cpu_second`` in ``extra_info``.
+"""
+
+import os
+import socket
+import threading
+import time
+
+import pytest
+
+from pyexasol.http_transport import (
+    ExaHttpRequestHandler,
+    ExaTCPServer,
+)
+
+CHUNK_SIZE = 65524
+NUMBER_OF_CHUNKS = 2_000
+DATA_SIZE = CHUNK_SIZE * NUMBER_OF_CHUNKS
+
+
+@pytest.fixture(scope="module")
+def put_request() -> bytes:
+    chunk = b"%X\r\n%b\r\n" % (CHUNK_SIZE, os.urandom(CHUNK_SIZE))
+    return b"PUT /000.csv HTTP/1.1\r\n\r\n" + chunk * NUMBER_OF_CHUNKS + b"0\r\n\r\n"
+
+
+@pytest.fixture(scope="module")
+def get_source(tmp_path_factory):
+    filepath = tmp_path_factory.mktemp("http_transport") / "data.csv"
+    filepath.write_bytes(os.urandom(CHUNK_SIZE) * NUMBER_OF_CHUNKS)
+    return filepath
+
+
+def _run_handler(handler_class, request: bytes, read_pipe=None):
+    handler_socket, peer_socket = socket.socketpair()
+
+    # Do not connect to Exasol
+    server = ExaTCPServer(
+        ("127.0.0.1", 0), handler_class, bind_and_activate=False, compression=False
+    )
+    server.read_pipe.close()
+    server.write_pipe.close()
+    server.can_finish_get.set()
+
+    with server, handler_socket, peer_socket, open(os.devnull, "wb", 0) as write_pipe:
+        server.read_pipe = read_pipe
+        server.write_pipe = write_pipe
+
+        def send_and_drain():
+            peer_socket.sendall(request)
+            while peer_socket.recv_into(buffer):
+                pass
+
+        buffer = bytearray(1024 * 1024)
+        peer = threading.Thread(target=send_and_drain)
+        peer.start()
+
+        handler_class(handler_socket, None, server)
+        handler_socket.shutdown(socket.SHUT_WR)
+        peer.join()
+
+
+@pytest.mark.benchmark(timer=time.process_time)
+def test_export_put_read_chunks(benchmark, put_request):
+    benchmark.pedantic(
+        _run_handler,
+        args=(ExaHttpRequestHandler, put_request),
+        iterations=1,
+        rounds=10,
+    )
+    benchmark.extra_info["bytes_per_cpu_second"] = DATA_SIZE / benchmark.stats["mean"]
+
+
+@pytest.mark.benchmark(timer=time.process_time)
+def test_import_get_write_chunks(benchmark, get_source):
+    def run():
+        with open(get_source, "rb", 0) as read_pipe:
+            _run_handler(
+                ExaHttpRequestHandler, b"GET /000.csv HTTP/1.1\r\n\r\n", read_pipe
+            )
+
+    benchmark.pedantic(run, iterations=1, rounds=10)
+    benchmark.extra_info["bytes_per_cpu_second"] = DATA_SIZE / benchmark.stats["mean"]
@@ -0,0 +1,53 @@
+"""
+Microbenchmarks of splitting a multi-MB SQL script of generated INSERT statements
+and of stripping comments from it. They do not require a database.
+"""
+
+import io
+
+import pytest
+
+from pyexasol._sql_splitter import (
+    iter_sql_script,
+    split_sql_script,
+    strip_comments,
+)
+
+ROWS = 50_000
+
+
+@pytest.fixture(scope="module")
+def script() -> str:
+    return "".join(
+        f"-- row {i}\n"
+        f"INSERT INTO users VALUES ({i}, 'user;{i}', 'O''Reilly', NULL); /* done */\n"
+        for i in range(ROWS)
+    )
+
+
+def test_split_sql_script(benchmark, script):
+    benchmark.group = "sql_splitter"
+    benchmark.extra_info["script_size"] = len(script)
+
+    statements = benchmark(split_sql_script, script)
+
+    assert len(statements) == ROWS
+
+
+def test_iter_sql_script_file(benchmark, script):
+    benchmark.group = "sql_splitter"
+    benchmark.extra_info["script_size"] = len(script)
+
+    def func_to_be_measured():
+        return sum(1 for _ in iter_sql_script(io.StringIO(script)))
+
+    assert benchmark(func_to_be_measured) == ROWS
+
+
+def test_strip_comments(benchmark, script):
+    benchmark.group = "sql_splitter"
+    benchmark.extra_info["script_size"] = len(script)
+
+    result = benchmark(strip_comments, script)
+
+    assert "/* done */" not in result
@@ -1,4 +1,5 @@
 import os
+import time
 from io import BytesIO
 from pathlib import Path
 
@@ -9,10 +10,16 @@ from pyarrow import dataset
 from pyarrow.lib import ArrowInvalid
 
 from pyexasol.callback import (
+    _ReadAhead,
     check_export_to_parquet_directory_setting,
+    export_to_pandas_chunks,
     export_to_parquet,
+    get_arrow_batches,
     get_parquet_files,
+    import_from_arrow,
+    import_from_iterable,
     import_from_parquet,
+    split_parquet_files,
 )
 
 
@@ -127,6 +134,24 @@ class TestExportToParquet:
         assert self.get_row_count(dst) == 2
 
 
+@pytest.mark.pandas
+class TestExportToPandasChunks:
+    @staticmethod
+    def test_yields_chunks_of_requested_size(pipe):
+        chunks = list(export_to_pandas_chunks(pipe=pipe, dst=None, chunksize=1))
+
+        assert [len(chunk) for chunk in chunks] == [1, 1]
+        assert list(chunks[0].columns) == ["name", "age", "city"]
+        assert chunks[1].iloc[0]["name"] == "Bob"
+
+    @staticmethod
+    def test_chunksize_larger_than_data(pipe):
+        chunks = list(export_to_pandas_chunks(pipe=pipe, dst=None, chunksize=1000))
+
+        assert len(chunks) == 1
+        assert len(chunks[0]) == 2
+
+
 class TestGetParquetFiles:
     @staticmethod
     def test_str_with_glob_works(tmp_path):
@@ -178,3 +203,233 @@ class TestImportFromParquetExceptions:
 
         with pytest.raises(ValueError, match="is hierarchical which is not supported"):
             import_from_parquet(os.pipe()[0], filepath)
+
+    @staticmethod
+    def test_invalid_max_workers(tmp_path):
+        with pytest.raises(ValueError, match="Number of workers must be a positive"):
+            import_from_parquet(BytesIO(), tmp_path, max_workers=0)
+
+
+@pytest.mark.parquet
+class TestImportFromParquetReadAhead:
+    @staticmethod
+    @pytest.fixture
+    def parquet_dir(tmp_path):
+        for i in range(3):
+            table = pa.Table.from_pydict(
+                {"id": list(range(i * 100, i * 100 + 50 + i)), "name": ["a"] * (50 + i)}
+            )
+            pq.write_table(table, tmp_path / f"file_{i}.parquet", row_group_size=7)
+        return tmp_path
+
+    @staticmethod
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_output_matches_serial_import(parquet_dir, max_workers):
+        expected = BytesIO()
+        import_from_parquet(expected, parquet_dir)
+
+        actual = BytesIO()
+        import_from_parquet(actual, parquet_dir, max_workers=max_workers)
+
+        assert actual.getvalue() == expected.getvalue()
+
+    @staticmethod
+    def test_iter_batches_params_are_applied(parquet_dir):
+        pipe = BytesIO()
+        import_from_parquet(
+            pipe, parquet_dir, max_workers=2, columns=["name"], row_groups=[0]
+        )
+
+        assert pipe.getvalue() == b'"a"\n' * 7 * 3
+
+    @staticmethod
+    def test_hierarchical_data_is_not_supported(tmp_path):
+        filepath = tmp_path / "hierarchical.parquet"
+        pq.write_table(pa.Table.from_pydict({"list": [[1]]}), filepath)
+
+        with pytest.raises(ValueError, match="is hierarchical which is not supported"):
+            import_from_parquet(BytesIO(), filepath, max_workers=2)
+
+    @staticmethod
+    def test_batch_size_and_max_bytes(parquet_dir):
+        expected = BytesIO()
+        import_from_parquet(expected, parquet_dir)
+
+        actual = BytesIO()
+        import_from_parquet(
+            actual, parquet_dir, max_workers=4, max_bytes=1, batch_size=2
+        )
+
+        assert actual.getvalue() == expected.getvalue()
+
+
+def make_chunks(idx, num_chunks):
+    # Later tasks are faster, chunks are still yielded in order of tasks
+    time.sleep(0.001 * (5 - idx))
+    return (b"%d-%d," % (idx, i) for i in range(num_chunks))
+
+
+class TestReadAhead:
+    @staticmethod
+    def test_chunks_in_order_of_tasks():
+        tasks = [(idx, 3) for idx in range(5)]
+
+        chunks = list(_ReadAhead(make_chunks, tasks, 3, 1024))
+
+        assert chunks == [b"%d-%d," % (idx, i) for idx in range(5) for i in range(3)]
+
+    @staticmethod
+    def test_size_is_limited():
+        tasks = [(idx, 20) for idx in range(5)]
+        read_ahead = _ReadAhead(make_chunks, tasks, 4, 10)
+        max_size = 0
+
+        for _ in read_ahead:
+            time.sleep(0.0005)
+            max_size = max(max_size, read_ahead.size)
+
+        # One chunk of the consumed task may exceed the limit
+        assert max_size <= 10 + 4
+
+    @staticmethod
+    def test_errors_are_raised_in_order():
+        def func(idx):
+            if idx == 2:
+                raise ValueError("task 2")
+            return [b"%d" % idx]
+
+        chunks = []
+
+        with pytest.raises(ValueError, match="task 2"):
+            for chunk in _ReadAhead(func, [(idx,) for idx in range(5)], 2, 1024):
+                chunks.append(chunk)
+
+        assert chunks == [b"0", b"1"]
+
+
+class TestSplitParquetFiles:
+    @staticmethod
+    def test_groups_have_similar_size(tmp_path):
+        for name, size in [("a", 100), ("b", 60), ("c", 50), ("d", 10)]:
+            (tmp_path / f"{name}.parquet").write_bytes(b"0" * size)
+
+        groups = split_parquet_files(tmp_path, parts=2)
+
+        assert [[f.name for f in group] for group in groups] == [
+            ["a.parquet", "d.parquet"],
+            ["b.parquet", "c.parquet"],
+        ]
+
+    @staticmethod
+    def test_no_more_groups_than_files(tmp_path):
+        (tmp_path / "a.parquet").touch()
+
+        assert split_parquet_files(tmp_path, parts=3) == [[tmp_path / "a.parquet"]]
+
+    @staticmethod
+    def test_invalid_parts(tmp_path):
+        with pytest.raises(ValueError, match="Number of parts must be a positive"):
+            split_parquet_files(tmp_path, parts=0)
+
+
+class TestImportFromIterable:
+    @staticmethod
+    def test_writes_csv_to_pipe():
+        pipe = BytesIO()
+        import_from_iterable(pipe, [(1, "Bob", None), (2, "Gill", 1.5)])
+
+        assert pipe.getvalue() == b'1,"Bob",""\n2,"Gill",1.5\n'
+
+    @staticmethod
+    def test_source_not_iterable():
+        with pytest.raises(ValueError, match="Data source is not iterable"):
+            import_from_iterable(BytesIO(), 1)
+
+
+class TestGetArrowBatches:
+    @staticmethod
+    def test_table_is_split_into_batches():
+        table = pa.Table.from_pydict({"id": list(range(5))})
+
+        batches = list(get_arrow_batches(table, max_chunksize=2))
+
+        assert [batch.num_rows for batch in batches] == [2, 2, 1]
+
+    @staticmethod
+    def test_record_batch_reader():
+        table = pa.Table.from_pydict({"id": [1, 2, 3]})
+
+        batches = list(get_arrow_batches(table.to_reader(max_chunksize=1)))
+
+        assert pa.Table.from_batches(batches) == table
+
+    @staticmethod
+    @pytest.mark.pandas
+    def test_pandas_dataframe_is_converted_lazily():
+        import pandas as pd
+
+        df = pd.DataFrame({"id": [1, 2, 3]}, index=[10, 20, 30])
+
+        batches = get_arrow_batches(df, max_chunksize=2)
+
+        assert not isinstance(batches, list)
+        assert [batch.to_pydict() for batch in batches] == [
+            {"id": [1, 2]},
+            {"id": [3]},
+        ]
+
+    @staticmethod
+    @pytest.mark.polars
+    def test_polars_lazy_frame():
+        import polars as pl
+
+        lf = pl.LazyFrame({"id": [1, 2, 3]})
+
+        table = pa.Table.from_batches(list(get_arrow_batches(lf)))
+
+        assert table.to_pydict() == {"id": [1, 2, 3]}
+
+    @staticmethod
+    def test_not_arrow_compatible_source():
+        with pytest.raises(ValueError, match="is not Arrow-compatible"):
+            get_arrow_batches([(1, 2)])
+
+
+class TestImportFromArrow:
+    @staticmethod
+    def test_writes_csv_without_header():
+        pipe = BytesIO()
+        table = pa.Table.from_pydict({"id": [1, 2, None], "name": ["a", 'b"c', None]})
+
+        import_from_arrow(pipe, table.to_reader(max_chunksize=1))
+
+        assert pipe.getvalue() == b'1,"a"\n2,"b""c"\n,\n'
+
+    @staticmethod
+    def test_empty_source_writes_nothing():
+        pipe = BytesIO()
+        reader = pa.RecordBatchReader.from_batches(pa.schema([("id", pa.int64())]), [])
+
+        import_from_arrow(pipe, reader)
+
+        assert pipe.getvalue() == b""
+
+    @staticmethod
+    @pytest.mark.parametrize("max_workers", [1, 3])
+    def test_max_workers_matches_serial_import(max_workers):
+        table = pa.Table.from_pydict({"id": list(range(100)), "name": ["a"] * 100})
+
+        expected = BytesIO()
+        import_from_arrow(expected, table.to_reader(max_chunksize=7))
+
+        actual = BytesIO()
+        import_from_arrow(
+            actual, table.to_reader(max_chunksize=7), max_workers=max_workers
+        )
+
+        assert actual.getvalue() == expected.getvalue()
+
+    @staticmethod
+    def test_invalid_max_workers():
+        with pytest.raises(ValueError, match="Number of workers must be a positive"):
+            import_from_arrow(BytesIO(), pa.table({"id": [1]}), max_workers=0)
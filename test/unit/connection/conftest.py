@@ -57,3 +57,90 @@ def mock_exaconnection_factory():
         return mock_exaconnection(**config)
 
     return _exaconnection_fixture
+
+
+class ExaResponseFactory:
+    """
+    WebSocket responses of Exasol for a mocked :meth:`pyexasol.ExaConnection.req`.
+    Data is given column by column, as it is sent by Exasol.
+    """
+
+    ID_NAME_COLUMNS = [
+        {"name": "ID", "dataType": {"type": "DECIMAL", "precision": 18, "scale": 0}},
+        {"name": "NAME", "dataType": {"type": "VARCHAR", "size": 10}},
+    ]
+
+    @staticmethod
+    def column(name: str) -> dict:
+        return {"name": name, "dataType": {"type": "VARCHAR", "size": 128}}
+
+    @classmethod
+    def result_set(
+        cls,
+        data: list[list] | None = None,
+        columns: list[str | dict] | None = None,
+        num_rows: int | None = None,
+        result_set_handle: int | None = None,
+        statement_handle: int | None = None,
+    ) -> dict:
+        """
+        Response of ``execute`` or ``createPreparedStatement`` with one result set.
+        ``columns`` may be names of VARCHAR columns, default is ``ID_NAME_COLUMNS``.
+        """
+        columns = [
+            cls.column(c) if isinstance(c, str) else c
+            for c in (cls.ID_NAME_COLUMNS if columns is None else columns)
+        ]
+        num_rows_in_message = len(data[0]) if data else 0
+        result_set = {
+            "numColumns": len(columns),
+            "numRows": num_rows_in_message if num_rows is None else num_rows,
+            "numRowsInMessage": num_rows_in_message,
+            "columns": columns,
+        }
+
+        if data is not None:
+            result_set["data"] = data
+
+        if result_set_handle is not None:
+            result_set["resultSetHandle"] = result_set_handle
+
+        response = {
+            "responseData": {
+                "results": [{"resultType": "resultSet", "resultSet": result_set}],
+                "numResults": 1,
+            }
+        }
+
+        if statement_handle is not None:
+            response["responseData"]["statementHandle"] = statement_handle
+
+        return response
+
+    @staticmethod
+    def fetch(data: list[list]) -> dict:
+        """
+        Response of ``fetch`` with the next chunk of a result set
+        """
+        return {"responseData": {"numRows": len(data[0]), "data": data}}
+
+    @staticmethod
+    def row_count(row_count: int = 0) -> dict:
+        return {
+            "responseData": {
+                "results": [{"resultType": "rowCount", "rowCount": row_count}],
+                "numResults": 1,
+            }
+        }
+
+    @staticmethod
+    def empty() -> dict:
+        """
+        Response of commands without response data, e.g. ``closeResultSet``
+        """
+        return {"responseData": {}}
+
+
+@pytest.fixture(scope="session")
+def exa_response() -> type[ExaResponseFactory]:
+    return ExaResponseFactory
@@ -61,3 +61,28 @@ def test_execute_sql_script_stops_after_first_error(mock_exaconnection_factory):
         (("SELECT 1",),),
         (("SELECT fail",),),
     ]
+
+
+def test_execute_sql_script_executes_statements_while_reading(
+    mock_exaconnection_factory,
+):
+    connection = mock_exaconnection_factory()
+    events = []
+
+    def chunks():
+        for chunk in ["SELECT 1; SEL", "ECT 2;"]:
+            events.append(("read", chunk))
+            yield chunk
+
+    connection.execute = MagicMock(
+        side_effect=lambda statement: events.append(("execute", statement))
+    )
+
+    connection.execute_sql_script(chunks())
+
+    assert events == [
+        ("read", "SELECT 1; SEL"),
+        ("execute", "SELECT 1"),
+        ("read", "ECT 2;"),
+        ("execute", "SELECT 2"),
+    ]
@@ -0,0 +1,164 @@
+import socket
+import sys
+from unittest.mock import (
+    MagicMock,
+    patch,
+)
+
+import pytest
+
+from pyexasol import ExaQueryError
+from pyexasol.script_output import ExaScriptOutputSelectorServer
+
+
+@pytest.fixture
+def connection(mock_exaconnection_factory, tmp_path):
+    connection = mock_exaconnection_factory(
+        udf_output_bind_address=("127.0.0.1", 0),
+        udf_output_connect_address=("127.0.0.1", 0),
+        udf_output_dir=str(tmp_path),
+    )
+    connection.session_id = MagicMock(return_value="1234")
+    # WebSocket is not initialized by the mocked connection
+    connection._ws = MagicMock(connected=False)
+    yield connection
+    connection.close()
+
+
+def run_vms(connection, outputs):
+    def execute(query, query_params=None):
+        if query.startswith("ALTER SESSION"):
+            return MagicMock(name="alter_session")
+
+        for output in outputs:
+            with socket.create_connection(
+                ("127.0.0.1", connection._udf_output_server.port)
+            ) as vm:
+                vm.sendall(output)
+
+        return MagicMock(name="statement")
+
+    return execute
+
+
+def test_execute_udf_output_reuses_server(connection):
+    connection.execute = MagicMock(side_effect=run_vms(connection, [b"a", b"b"]))
+
+    _, first_files = connection.execute_udf_output("SELECT my_udf()")
+    server = connection._udf_output_server
+    _, second_files = connection.execute_udf_output("SELECT my_udf()")
+
+    assert connection._udf_output_server is server
+    assert [path.read_bytes() for path in first_files] == [b"a", b"b"]
+    assert [path.read_bytes() for path in second_files] == [b"a", b"b"]
+    assert first_files[0].parent.name == "1234_1"
+    assert second_files[0].parent.name == "1234_2"
+
+
+def test_close_stops_udf_output_server(connection):
+    connection.execute = MagicMock(side_effect=run_vms(connection, [b"a"]))
+    connection.execute_udf_output("SELECT my_udf()")
+    server = connection._udf_output_server
+
+    connection.close()
+
+    assert connection._udf_output_server is None
+    assert server.is_closed
+    assert not server.thread.is_alive()
+
+
+def test_execute_udf_output_replaces_failed_server(connection):
+    connection.execute = MagicMock(side_effect=run_vms(connection, []))
+
+    # Event loop is woken up by finish_statement() even if no VM connects
+    with (
+        patch.object(
+            ExaScriptOutputSelectorServer, "_drain_wakeup", side_effect=OSError("boom")
+        ),
+        patch.object(connection.logger, "error") as mock_error,
+        pytest.raises(RuntimeError, match="Script output server failed"),
+    ):
+        connection.execute_udf_output("SELECT my_udf()")
+
+    failed_server = connection._udf_output_server
+    failed_server.thread.join()
+
+    assert failed_server.is_closed
+    mock_error.assert_called_once_with("Script output server failed: OSError('boom')")
+
+    connection.execute = MagicMock(side_effect=run_vms(connection, [b"a"]))
+    _, files = connection.execute_udf_output("SELECT my_udf()")
+
+    assert connection._udf_output_server is not failed_server
+    assert [path.read_bytes() for path in files] == [b"a"]
+
+
+def test_execute_udf_output_query_error(connection):
+    error = ExaQueryError(connection, "SELECT my_udf()", 0, "failed")
+    connection.execute = MagicMock(side_effect=[MagicMock(), error])
+
+    with pytest.raises(ExaQueryError):
+        connection.execute_udf_output("SELECT my_udf()")
+
+    assert connection._udf_output_server.connected_clients == 0
+
+
+def test_execute_udf_output_on_output(connection):
+    connection.execute = MagicMock(
+        side_effect=run_vms(connection, [b'{"step": 1}\n{"step": 2}\n', b"done"])
+    )
+    lines = []
+
+    connection.execute_udf_output(
+        "SELECT my_udf()",
+        on_output=lambda vm_id, line: lines.append((vm_id, line)),
+        output_json=True,
+    )
+
+    assert lines == [(1, {"step": 1}), (1, {"step": 2}), (2, "done")]
+
+
+def test_execute_udf_output_on_output_error(connection):
+    connection.execute = MagicMock(side_effect=run_vms(connection, [b"a\n"]))
+
+    def on_output(vm_id, line):
+        raise KeyError(line)
+
+    with pytest.raises(KeyError, match="a"):
+        connection.execute_udf_output("SELECT my_udf()", on_output=on_output)
+
+
+def test_execute_udf_output_indexed(mock_exaconnection_factory, tmp_path):
+    connection = mock_exaconnection_factory(
+        udf_output_bind_address=("127.0.0.1", 0),
+        udf_output_connect_address=("127.0.0.1", 0),
+        udf_output_dir=str(tmp_path),
+        udf_output_compression="gzip",
+        udf_output_max_bytes=2,
+        udf_output_indexed=True,
+    )
+    connection.session_id = MagicMock(return_value="1234")
+    connection._ws = MagicMock(connected=False)
+    connection.execute = MagicMock(side_effect=run_vms(connection, [b"abc", b"d"]))
+
+    try:
+        _, logs = connection.execute_udf_output("SELECT my_udf()")
+    finally:
+        connection.close()
+
+    assert list(tmp_path.iterdir()) == [tmp_path / "1234_1.udflog"]
+    assert [log.read_bytes() for log in logs] == [b"ab", b"d"]
+    assert [log.is_truncated for log in logs] == [True, False]
+
+
+def test_unsupported_udf_output_compression(mock_exaconnection_factory):
+    with pytest.raises(ValueError, match="Unsupported UDF output compression"):
+        mock_exaconnection_factory(udf_output_compression="lz4")
+
+
+def test_unavailable_udf_output_compression(mock_exaconnection_factory, monkeypatch):
+    monkeypatch.setitem(sys.modules, "compression", None)
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+
+    with pytest.raises(ImportError, match="requires Python 3.14"):
+        mock_exaconnection_factory(udf_output_compression="zstd")
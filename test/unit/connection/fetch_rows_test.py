@@ -0,0 +1,103 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from pyexasol import ExaRecord
+from pyexasol.row import (
+    get_namedtuple_class,
+    namedtuple_row_factory,
+)
+
+
+@pytest.fixture
+def connection(mock_exaconnection_factory, exa_response):
+    connection = mock_exaconnection_factory(fetch_rows="record")
+    connection.req = MagicMock(
+        side_effect=[
+            exa_response.result_set([[1, 2], ["A", "B"]]),
+            exa_response.result_set([[3], ["C"]]),
+        ]
+    )
+    return connection
+
+
+def test_fetch_rows_record(connection):
+    rows = connection.execute("SELECT ID, NAME FROM T").fetchall()
+
+    assert rows == [(1, "A"), (2, "B")]
+    assert all(isinstance(row, ExaRecord) for row in rows)
+    assert rows[1]["NAME"] == "B"
+    assert rows[1].ID == 2
+
+
+def test_fetch_rows_record_shares_class(connection):
+    first = connection.execute("SELECT ID, NAME FROM T").fetchone()
+    second = connection.execute("SELECT ID, NAME FROM T").fetchone()
+
+    assert type(first) is type(second)
+
+
+def test_fetch_rows_record_with_lower_ident_and_mapper(connection):
+    connection.options["lower_ident"] = True
+    connection.options["fetch_mapper"] = lambda value, data_type: str(value)
+    row = connection.execute("SELECT ID, NAME FROM T").fetchone()
+
+    assert row == ("1", "A")
+    assert row.keys() == ("id", "name")
+
+
+def test_fetch_dict_takes_precedence(connection):
+    connection.options["fetch_dict"] = True
+    row = connection.execute("SELECT ID, NAME FROM T").fetchone()
+
+    assert row == {"ID": 1, "NAME": "A"}
+
+
+def test_fetch_rows_dict(connection):
+    connection.options["fetch_rows"] = "dict"
+    row = connection.execute("SELECT ID, NAME FROM T").fetchone()
+
+    assert row == {"ID": 1, "NAME": "A"}
+
+
+def test_fetchcol_and_fetchval_return_plain_values(connection):
+    assert connection.execute("SELECT ID, NAME FROM T").fetchcol() == [1, 2]
+    assert connection.execute("SELECT ID, NAME FROM T").fetchval() == 3
+
+
+def test_row_factory_takes_precedence(connection):
+    connection.options["row_factory"] = namedtuple_row_factory
+    row = connection.execute("SELECT ID, NAME FROM T").fetchone()
+
+    assert type(row) is get_namedtuple_class(("ID", "NAME"))
+    assert row.NAME == "A"
+
+
+def test_row_factory_is_called_once_per_result_set(connection):
+    factory = MagicMock(return_value=list)
+    connection.options["row_factory"] = factory
+
+    assert connection.execute("SELECT ID, NAME FROM T").fetchall() == [
+        [1, "A"],
+        [2, "B"],
+    ]
+    factory.assert_called_once_with(("ID", "NAME"))
+
+
+def test_row_factory_set_on_statement(connection):
+    stmt = connection.execute("SELECT ID, NAME FROM T")
+    stmt.row_factory = namedtuple_row_factory
+
+    assert stmt.fetchone().ID == 1
+
+    # Falls back to fetch_rows="record"
+    stmt.row_factory = None
+
+    assert isinstance(stmt.fetchone(), ExaRecord)
+
+
+def test_invalid_fetch_rows(mock_exaconnection_factory):
+    connection = mock_exaconnection_factory(fetch_rows="object")
+
+    with pytest.raises(ValueError, match="Unsupported fetch_rows"):
+        connection.execute("SELECT 1")
@@ -0,0 +1,43 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from pyexasol import ExaRuntimeError
+
+
+@pytest.fixture
+def connection(mock_exaconnection_factory):
+    return mock_exaconnection_factory()
+
+
+@pytest.mark.parametrize("format", ["pickle", "arrow-ipc"])
+def test_fetch_to_spool_fetches_all_chunks(connection, exa_response, format):
+    connection.req = MagicMock(
+        side_effect=[
+            exa_response.result_set(
+                [[0, 1], ["A", "B"]], num_rows=5, result_set_handle=1
+            ),
+            exa_response.fetch([[2, 3], ["C", None]]),
+            exa_response.fetch([[4], ["E"]]),
+            exa_response.empty(),
+        ]
+    )
+    stmt = connection.execute("SELECT ID, NAME FROM T")
+    stmt.fetchone()
+
+    with stmt.fetch_to_spool(format=format) as spool:
+        assert list(spool) == [(1, "B"), (2, "C"), (3, None), (4, "E")]
+        assert spool.row_offsets == [0, 1, 3, 4]
+
+    fetch_requests = [call.args[0] for call in connection.req.call_args_list[1:3]]
+    assert [request["startPosition"] for request in fetch_requests] == [2, 4]
+    assert connection.req.call_args.args[0]["command"] == "closeResultSet"
+    assert stmt.fetchone() is None
+
+
+def test_fetch_to_spool_without_result_set(connection, exa_response):
+    connection.req = MagicMock(return_value=exa_response.row_count(1))
+    stmt = connection.execute("DELETE FROM T")
+
+    with pytest.raises(ExaRuntimeError, match="without result set"):
+        stmt.fetch_to_spool()
@@ -5,7 +5,8 @@ from unittest.mock import (
 
 import pytest
 
-from pyexasol.connection import ExaConnection
+from pyexasol.exceptions import ExaExportError
+from pyexasol.http_transport import ExaHttpTransportStats
 
 
 @pytest.fixture
@@ -33,25 +34,21 @@ def mock_sql_export_thread():
 
 
 @pytest.fixture
-def exa_conn():
+def exa_conn(mock_exaconnection_factory):
     """
-    Create a mock ExaConnection. We use a real instance but mock
-    attributes to avoid actual network/socket initialization.
+    Create a real ExaConnection without network access. Only formatting of queries
+    and aborting of queries are mocked.
     """
 
     def mock_format_logic(query_or_table):
         return query_or_table
 
-    conn = MagicMock(spec=ExaConnection)
-    conn.options = {"compression": True, "encryption": True}
+    conn = mock_exaconnection_factory()
     conn.ws_ipaddr = "127.0.0.1"
     conn.ws_port = 8563
     conn.format = MagicMock()
     conn.format.format.side_effect = mock_format_logic
-
-    # Attach the actual methods to the mock instance
-    conn.export_to_callback = ExaConnection.export_to_callback.__get__(conn)
-    conn.import_from_callback = ExaConnection.import_from_callback.__get__(conn)
+    conn.abort_query = MagicMock()
     return conn
 
 
@@ -113,6 +110,197 @@ class TestExportToCallback:
         _, callback_kwargs = callback_spy.call_args
         assert callback_kwargs == {}
 
+    @staticmethod
+    def test_progress_error_raises_export_error(
+        exa_conn, mock_http_thread, mock_sql_export_thread
+    ):
+        error = ValueError("progress failed")
+        mock_http_thread.return_value.exc = error
+        mock_http_thread.return_value.join_with_exc.side_effect = error
+        mock_sql_export_thread.return_value.exc = None
+        mock_sql_export_thread.return_value.is_alive.return_value = False
+
+        with pytest.raises(ExaExportError) as ex:
+            exa_conn.export_to_callback(
+                lambda pipe, dst: None, dst=None, query_or_table="dummy_table"
+            )
+
+        assert error in ex.value.exceptions
+
+
+class TestExportToIterator:
+    @staticmethod
+    def generator_callback(pipe, dst, **kwargs):
+        yield from range(3)
+
+    def test_yields_all_items_and_joins_threads(
+        self, exa_conn, mock_http_thread, mock_sql_export_thread
+    ):
+        result = exa_conn._export_to_iterator(
+            self.generator_callback, None, "dummy_table"
+        )
+
+        # nothing is started before the first item is requested
+        assert mock_http_thread.call_count == 0
+
+        assert list(result) == [0, 1, 2]
+        mock_http_thread.return_value.join_with_exc.assert_called_once()
+        mock_sql_export_thread.return_value.join_with_exc.assert_called_once()
+        mock_http_thread.return_value.terminate.assert_not_called()
+
+    def test_closing_early_stops_threads(
+        self, exa_conn, mock_http_thread, mock_sql_export_thread
+    ):
+        mock_sql_export_thread.return_value.is_alive.return_value = True
+
+        result = exa_conn._export_to_iterator(
+            self.generator_callback, None, "dummy_table"
+        )
+        assert next(result) == 0
+        result.close()
+
+        mock_http_thread.return_value.terminate.assert_called_once()
+        mock_http_thread.return_value.join_with_exc.assert_not_called()
+        exa_conn.abort_query.assert_called_once()
+
+    def test_exception_in_callback_raises_export_error(
+        self, exa_conn, mock_http_thread, mock_sql_export_thread
+    ):
+        def failing_callback(pipe, dst, **kwargs):
+            yield 0
+            raise ValueError("broken chunk")
+
+        mock_http_thread.return_value.exc = None
+        mock_sql_export_thread.return_value.exc = None
+        mock_sql_export_thread.return_value.is_alive.return_value = False
+
+        result = exa_conn._export_to_iterator(failing_callback, None, "dummy_table")
+        with pytest.raises(ExaExportError, match="1 sub-exception"):
+            list(result)
+
+        mock_http_thread.return_value.terminate.assert_called_once()
+
+    def test_export_params_are_not_modified(
+        self, exa_conn, mock_http_thread, mock_sql_export_thread
+    ):
+        export_params = {"columns": ["a"]}
+
+        with patch(
+            "pyexasol.callback.export_to_pandas_chunks", self.generator_callback
+        ):
+            list(
+                exa_conn.export_to_pandas_chunks(
+                    "dummy_table", export_params=export_params
+                )
+            )
+
+        assert export_params == {"columns": ["a"]}
+        sql_args, _ = mock_sql_export_thread.call_args
+        assert sql_args[3] == {"columns": ["a"], "with_column_names": True}
+
+
+NODES = [{"ipaddr": f"10.0.0.{idx}", "port": 8563, "idx": idx} for idx in range(1, 4)]
+
+
+class TestExportToCallbackParallel:
+    @staticmethod
+    def test_one_tunnel_and_callback_per_node(
+        exa_conn, mock_http_thread, mock_sql_export_thread
+    ):
+        http_threads = [
+            MagicMock(exc=None, stats=ExaHttpTransportStats(wire_bytes=10, chunks=1))
+            for _ in NODES
+        ]
+        mock_http_thread.side_effect = http_threads
+
+        def callback(pipe, dst, worker):
+            return worker
+
+        result = exa_conn._export_to_callback_parallel(
+            callback,
+            None,
+            "dummy_table",
+            None,
+            [{"worker": node["idx"]} for node in NODES],
+            None,
+            NODES,
+        )
+
+        assert result == [1, 2, 3]
+        assert [c.args[0] for c in mock_http_thread.call_args_list] == [
+            "10.0.0.1",
+            "10.0.0.2",
+            "10.0.0.3",
+        ]
+        mock_sql_export_thread.return_value.set_http_threads.assert_called_once_with(
+            http_threads
+        )
+        for http_thread in http_threads:
+            http_thread.join_with_exc.assert_called_once()
+        mock_sql_export_thread.return_value.join_with_exc.assert_called_once()
+        assert exa_conn.last_http_stats.wire_bytes == 30
+        assert exa_conn.last_http_stats.chunks == 3
+
+    @staticmethod
+    def test_exception_in_callback_stops_all_threads(
+        exa_conn, mock_http_thread, mock_sql_export_thread
+    ):
+        http_threads = [
+            MagicMock(exc=None, stats=ExaHttpTransportStats(wire_bytes=10, chunks=1))
+            for _ in NODES
+        ]
+        mock_http_thread.side_effect = http_threads
+        mock_sql_export_thread.return_value.exc = None
+        mock_sql_export_thread.return_value.is_alive.return_value = False
+
+        def callback(pipe, dst, worker):
+            if worker == 2:
+                raise ValueError("broken stream")
+
+        with pytest.raises(ExaExportError, match="1 sub-exception"):
+            exa_conn._export_to_callback_parallel(
+                callback,
+                None,
+                "dummy_table",
+                None,
+                [{"worker": node["idx"]} for node in NODES],
+                None,
+                NODES,
+            )
+
+        for http_thread in http_threads:
+            http_thread.terminate.assert_called_once()
+
+
+class TestExportToParquetParallel:
+    @staticmethod
+    def test_every_worker_has_own_file_names(exa_conn, tmp_path):
+        exa_conn.get_nodes = MagicMock(return_value=NODES)
+        exa_conn._export_to_callback_parallel = MagicMock()
+
+        exa_conn.export_to_parquet_parallel(
+            tmp_path, "dummy_table", callback_params={"partitioning": ["ID"]}
+        )
+
+        args, _ = exa_conn._export_to_callback_parallel.call_args
+        worker_callback_params = args[4]
+        assert [p["basename_template"] for p in worker_callback_params] == [
+            "001-part-{i}.parquet",
+            "002-part-{i}.parquet",
+            "003-part-{i}.parquet",
+        ]
+        assert all(p["partitioning"] == ["ID"] for p in worker_callback_params)
+        assert args[5] == {"with_column_names": True}
+
+    @staticmethod
+    def test_delete_matching_is_not_supported(exa_conn, tmp_path):
+        with pytest.raises(ValueError, match="'delete_matching' is not supported"):
+            exa_conn.export_to_parquet_parallel(
+                tmp_path,
+                "dummy_table",
+                callback_params={"existing_data_behavior": "delete_matching"},
+            )
+
 
 class TestImportFromCallback:
     @staticmethod
@@ -34,7 +34,23 @@ class TestOptions:
         "encryption": True,
         "fetch_dict": False,
         "fetch_mapper": None,
+        "fetch_rows": "tuple",
+        "row_factory": None,
         "fetch_size_bytes": 5242880,
+        "http_compression_level": -1,
+        "http_compression_threads": 1,
+        "http_max_bytes_per_sec": None,
+        "http_pool_size": 0,
+        "result_cache": None,
+        "meta_cache_ttl": None,
+        "meta_cache_max_entries": 1000,
+        "meta_nosql": False,
+        "format_max_list_size": None,
+        "udf_output_compression": None,
+        "udf_output_max_bytes": None,
+        "udf_output_indexed": False,
+        "http_progress": None,
+        "http_progress_interval": 67108864,
         "http_proxy": None,
         "json_lib": "json",
         "lower_ident": False,
@@ -81,3 +97,18 @@ class TestOptions:
             connection_class=CustomExaConnection
         )
         assert mocked_connection.options == self.expected_defaults
+
+
+@pytest.mark.parametrize(
+    "options, match",
+    [
+        pytest.param({"http_compression_level": 10}, "compression level", id="level"),
+        pytest.param({"http_compression_level": "9"}, "compression level", id="str"),
+        pytest.param(
+            {"http_compression_threads": 0}, "compression threads", id="threads"
+        ),
+    ],
+)
+def test_invalid_http_compression_options(mock_exaconnection_factory, options, match):
+    with pytest.raises(ValueError, match=match):
+        mock_exaconnection_factory(**options)
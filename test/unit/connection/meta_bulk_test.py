@@ -0,0 +1,90 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def connection(mock_exaconnection_factory):
+    connection = mock_exaconnection_factory()
+    connection.attr = {"currentSchema": "S"}
+    return connection
+
+
+def _sql(connection, call_idx=0):
+    return " ".join(connection.req.call_args_list[call_idx].args[0]["sqlText"].split())
+
+
+def test_tables_exist(connection, exa_response):
+    connection.req = MagicMock(
+        return_value=exa_response.result_set(
+            [["S", "X"], ["A", "C"]], ["TABLE_SCHEMA", "TABLE_NAME"]
+        )
+    )
+
+    result = connection.meta.tables_exist(["a", ("x", "b"), ("X", "C"), "A"])
+
+    assert result == {"a": True, ("x", "b"): False, ("X", "C"): True, "A": True}
+    assert connection.req.call_count == 1
+    assert _sql(connection) == (
+        "/*snapshot execution*/ SELECT table_schema, table_name "
+        "FROM sys.exa_all_tables "
+        "WHERE (table_schema='S' AND table_name IN ('A')) "
+        "OR (table_schema='X' AND table_name IN ('B', 'C'))"
+    )
+
+
+def test_schemas_exist(connection, exa_response):
+    connection.req = MagicMock(
+        return_value=exa_response.result_set([["S"]], ["SCHEMA_NAME"])
+    )
+
+    assert connection.meta.schemas_exist(["s", "O'X"]) == {"s": True, "O'X": False}
+    assert _sql(connection).endswith("WHERE schema_name IN ('O''X', 'S')")
+
+
+def test_columns_for(connection, exa_response):
+    connection.options["lower_ident"] = True
+    connection.req = MagicMock(
+        return_value=exa_response.result_set(
+            [["S", "S"], ["A", "A"], ["ID", "NAME"]],
+            ["COLUMN_SCHEMA", "COLUMN_TABLE", "COLUMN_NAME"],
+        )
+    )
+
+    result = connection.meta.columns_for(["a", ("S", "MISSING")])
+
+    assert [c["column_name"] for c in result["a"]] == ["ID", "NAME"]
+    assert result[("S", "MISSING")] == []
+    assert connection.req.call_count == 1
+
+
+def test_bulk_lookups_use_cache(mock_exaconnection_factory, exa_response):
+    connection = mock_exaconnection_factory(meta_cache_ttl=60)
+    connection.login_info = {"protocolVersion": 3}
+    connection.attr = {"currentSchema": "S"}
+    connection.req = MagicMock(
+        return_value=exa_response.result_set(
+            [["S"], ["A"]], ["TABLE_SCHEMA", "TABLE_NAME"]
+        )
+    )
+
+    connection.meta.tables_exist(["A", "B"])
+
+    assert connection.meta.table_exists("A")
+    assert not connection.meta.table_exists("B")
+    assert connection.meta.tables_exist(["B", "A"]) == {"A": True, "B": False}
+    assert connection.req.call_count == 1
+
+    connection.meta.tables_exist(["A", "C"])
+
+    assert connection.req.call_count == 2
+    assert _sql(connection, 1).endswith("(table_schema='S' AND table_name IN ('C'))")
+
+
+def test_sql_columns_many_deduplicates_queries(connection):
+    connection.meta.sql_columns = MagicMock(side_effect=lambda query: {query: None})
+
+    result = connection.meta.sql_columns_many(["SELECT 1", "SELECT 2", "SELECT 1"])
+
+    assert list(result) == ["SELECT 1", "SELECT 2"]
+    assert connection.meta.sql_columns.call_count == 2
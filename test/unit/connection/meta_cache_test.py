@@ -0,0 +1,126 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def connection(mock_exaconnection_factory, exa_response):
+    connection = mock_exaconnection_factory(meta_cache_ttl=60, meta_cache_max_entries=3)
+    connection.login_info = {"protocolVersion": 3}
+    connection.attr = {"currentSchema": "S"}
+    connection.req = MagicMock(
+        return_value=exa_response.result_set([["T"]], ["TABLE_NAME"])
+    )
+    return connection
+
+
+def test_cache_is_disabled_by_default(mock_exaconnection_factory, exa_response):
+    connection = mock_exaconnection_factory()
+    connection.login_info = {"protocolVersion": 3}
+    connection.req = MagicMock(
+        return_value=exa_response.result_set([["T"]], ["TABLE_NAME"])
+    )
+
+    connection.meta.table_exists("T")
+    connection.meta.table_exists("T")
+
+    assert connection.meta.cache is None
+    assert connection.req.call_count == 2
+
+
+def test_table_exists_is_cached_by_normalized_name(connection):
+    assert connection.meta.table_exists("t")
+    assert connection.meta.table_exists(("s", "T"))
+
+    assert connection.req.call_count == 1
+    assert connection.meta.cache.hits == 1
+
+
+def test_ddl_invalidates_affected_object(connection, exa_response):
+    connection.meta.table_exists("T")
+    connection.meta.view_exists("OTHER")
+
+    connection.req.return_value = exa_response.row_count()
+    connection.execute('DROP TABLE IF EXISTS s."T"')
+
+    connection.req.return_value = exa_response.result_set([[]], ["TABLE_NAME"])
+    assert not connection.meta.table_exists("T")
+    connection.meta.view_exists("OTHER")
+
+    assert connection.req.call_count == 4
+
+
+def test_ddl_on_schema_invalidates_objects_in_schema(connection, exa_response):
+    connection.meta.table_exists("T")
+
+    connection.req.return_value = exa_response.row_count()
+    connection.execute("DROP SCHEMA S CASCADE")
+    connection.meta.table_exists("T")
+
+    assert connection.req.call_count == 3
+
+
+def test_ddl_invalidates_listings_and_dml_does_not(connection, exa_response):
+    def execute(query):
+        connection.req.return_value = exa_response.row_count()
+        connection.execute(query)
+        connection.req.return_value = exa_response.result_set([["T"]], ["TABLE_NAME"])
+
+    connection.meta.list_tables("S")
+    connection.meta.list_tables(table_schema_pattern="S")
+    assert connection.req.call_count == 1
+
+    execute("DELETE FROM OTHER")
+    connection.meta.list_tables("S")
+    assert connection.req.call_count == 2
+
+    execute("/* comment */ CREATE TABLE OTHER (ID INT)")
+    connection.meta.list_tables("S")
+    assert connection.req.call_count == 4
+
+
+def test_sql_columns_returns_copy(connection, exa_response):
+    connection.req.return_value = exa_response.result_set(
+        columns=["TABLE_NAME"], statement_handle=1
+    )
+
+    columns = connection.meta.sql_columns("SELECT * FROM {t!i}", {"t": "T"})
+    columns["TABLE_NAME"]["size"] = 0
+
+    assert connection.ext.get_columns_sql("SELECT * FROM T") == {
+        "TABLE_NAME": {"type": "VARCHAR", "size": 128}
+    }
+    # createPreparedStatement and closePreparedStatement
+    assert connection.req.call_count == 2
+
+
+def test_invalidate(connection):
+    connection.meta.table_exists("T")
+    connection.meta.schema_exists("S")
+
+    connection.meta.invalidate("T")
+    assert len(connection.meta.cache) == 1
+
+    connection.meta.invalidate()
+    assert len(connection.meta.cache) == 0
+
+
+def test_ttl(connection, monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr("pyexasol.meta.time.monotonic", lambda: now)
+    connection.meta.table_exists("T")
+
+    now += 61
+    connection.meta.table_exists("T")
+
+    assert connection.req.call_count == 2
+
+
+def test_max_entries(connection):
+    for name in ("A", "B", "C", "D"):
+        connection.meta.table_exists(name)
+
+    connection.meta.table_exists("A")
+
+    assert len(connection.meta.cache) == 3
+    assert connection.req.call_count == 5
@@ -0,0 +1,88 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+RESULT_SET_RESPONSE = {
+    "responseData": {
+        "results": [
+            {
+                "resultType": "resultSet",
+                "resultSet": {
+                    "numColumns": 1,
+                    "numRows": 1,
+                    "numRowsInMessage": 1,
+                    "columns": [{"name": "NAME", "dataType": {"type": "VARCHAR"}}],
+                    "data": [["T"]],
+                },
+            }
+        ],
+        "numResults": 1,
+    }
+}
+
+
+@pytest.fixture
+def connection_factory(mock_exaconnection_factory):
+    def factory(protocol_version=3, **kwargs):
+        connection = mock_exaconnection_factory(**kwargs)
+        connection.login_info = {"protocolVersion": protocol_version}
+        connection.req = MagicMock(return_value=RESULT_SET_RESPONSE)
+        return connection
+
+    return factory
+
+
+@pytest.mark.parametrize(
+    "func_name, args, expected",
+    [
+        ("list_schemas", ("S%",), {"command": "getSchemas", "schema": "S%"}),
+        (
+            "list_tables",
+            ("S", "T%"),
+            {
+                "command": "getTables",
+                "schema": "S",
+                "table": "T%",
+                "tableTypes": ["TABLE"],
+            },
+        ),
+        (
+            "list_views",
+            ("S", "V%"),
+            {
+                "command": "getTables",
+                "schema": "S",
+                "table": "V%",
+                "tableTypes": ["VIEW"],
+            },
+        ),
+        (
+            "list_columns",
+            ("S", "T", "%", "C%"),
+            {"command": "getColumns", "schema": "S", "table": "T", "column": "C%"},
+        ),
+    ],
+)
+def test_list_uses_meta_nosql(connection_factory, func_name, args, expected):
+    connection = connection_factory(meta_nosql=True)
+
+    assert getattr(connection.meta, func_name)(*args) == [{"NAME": "T"}]
+    connection.req.assert_called_once_with(expected)
+
+
+@pytest.mark.parametrize(
+    "protocol_version, options, args",
+    [
+        (3, {}, ()),
+        (1, {"meta_nosql": True}, ()),
+        (3, {"meta_nosql": True}, ("%", "%", "TABLE")),
+    ],
+)
+def test_list_columns_falls_back_to_sql(
+    connection_factory, protocol_version, options, args
+):
+    connection = connection_factory(protocol_version, **options)
+
+    connection.meta.list_columns(*args)
+
+    assert "sys.exa_all_columns" in connection.req.call_args.args[0]["sqlText"]
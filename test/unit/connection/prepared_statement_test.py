@@ -1,7 +1,13 @@
-from unittest.mock import MagicMock
+from unittest.mock import (
+    MagicMock,
+    patch,
+)
 
+import pandas as pd
 import pytest
 
+from pyexasol import constant
+
 
 def _create_prepared_statement_response(num_params, result):
     return {
@@ -250,3 +256,164 @@ def test_prepared_statement_close(mock_exaconnection_factory):
         }
     )
     assert prep_stmt.statement_handle is None
+
+
+@pytest.fixture
+def prepared_insert_connection(mock_exaconnection_factory):
+    connection = mock_exaconnection_factory()
+    connection.req = MagicMock(
+        side_effect=[
+            _create_prepared_statement_response(
+                num_params=2,
+                result={"resultType": "rowCount", "rowCount": 0},
+            ),
+            {
+                "responseData": {
+                    "results": [{"resultType": "rowCount", "rowCount": 2}],
+                    "numResults": 1,
+                }
+            },
+            {"responseData": {}},
+        ]
+    )
+    return connection
+
+
+@pytest.mark.pandas
+def test_import_from_pandas_prepared(prepared_insert_connection):
+    src = pd.DataFrame({"ID": [0, 1], "NAME": ["A", None]})
+
+    prepared_insert_connection.import_from_pandas(
+        src, "T", import_params={"columns": ["ID", "NAME"]}, method="prepared"
+    )
+
+    create_request, execute_request, _ = (
+        call.args[0] for call in prepared_insert_connection.req.call_args_list
+    )
+    assert create_request["sqlText"] == "INSERT INTO T(ID,NAME) VALUES (?, ?)"
+    assert execute_request["numRows"] == 2
+    assert execute_request["data"] == [[0, 1], ["A", None]]
+
+
+@pytest.mark.pandas
+def test_import_from_pandas_auto_uses_prepared_for_small_data(
+    prepared_insert_connection,
+):
+    src = pd.DataFrame({"ID": [0, 1], "NAME": ["A", None]})
+
+    with patch.object(
+        prepared_insert_connection, "import_from_callback"
+    ) as mock_import:
+        prepared_insert_connection.import_from_pandas(src, "T", method="auto")
+
+    mock_import.assert_not_called()
+    execute_request = prepared_insert_connection.req.call_args_list[1].args[0]
+    assert execute_request["data"] == [[0, 1], ["A", None]]
+
+
+@pytest.mark.pandas
+def test_import_from_pandas_auto_uses_import_for_large_data(
+    mock_exaconnection_factory, monkeypatch
+):
+    connection = mock_exaconnection_factory()
+    src = pd.DataFrame({"ID": [0, 1]})
+    monkeypatch.setattr(
+        constant,
+        "PANDAS_PREPARED_IMPORT_MAX_BYTES",
+        int(src.memory_usage(deep=True).sum()),
+    )
+    connection.req = MagicMock()
+
+    with patch.object(connection, "import_from_callback") as mock_import:
+        connection.import_from_pandas(src, "T", method="auto")
+
+    mock_import.assert_called_once()
+    connection.req.assert_not_called()
+
+
+@pytest.mark.pandas
+@pytest.mark.parametrize(
+    "callback_params, import_params",
+    [
+        pytest.param({"sep": ";"}, None, id="callback_params"),
+        pytest.param(None, {"columns": ["ID"]}, id="import_params"),
+    ],
+)
+def test_import_from_pandas_auto_falls_back_to_import(
+    mock_exaconnection_factory, callback_params, import_params
+):
+    connection = mock_exaconnection_factory()
+    connection.req = MagicMock()
+
+    with patch.object(connection, "import_from_callback") as mock_import:
+        connection.import_from_pandas(
+            pd.DataFrame({"ID": [0]}),
+            "T",
+            callback_params=callback_params,
+            import_params=import_params,
+            method="auto",
+        )
+
+    mock_import.assert_called_once()
+    connection.req.assert_not_called()
+
+
+@pytest.mark.pandas
+@patch("pyexasol.connection.constant.PANDAS_PREPARED_IMPORT_CHUNK_ROWS", 2)
+def test_import_from_pandas_prepared_in_chunks(mock_exaconnection_factory):
+    connection = mock_exaconnection_factory()
+    connection.req = MagicMock(
+        side_effect=[
+            _create_prepared_statement_response(
+                num_params=1,
+                result={"resultType": "rowCount", "rowCount": 0},
+            ),
+            *[
+                {
+                    "responseData": {
+                        "results": [{"resultType": "rowCount", "rowCount": 1}],
+                        "numResults": 1,
+                    }
+                }
+            ]
+            * 3,
+            {"responseData": {}},
+        ]
+    )
+
+    connection.import_from_pandas(
+        pd.DataFrame({"ID": range(5)}), "T", method="prepared"
+    )
+
+    requests = [call.args[0] for call in connection.req.call_args_list]
+    assert [r["data"] for r in requests[1:4]] == [[[0, 1]], [[2, 3]], [[4]]]
+    assert [r["numRows"] for r in requests[1:4]] == [2, 2, 1]
+    assert requests[4]["command"] == "closePreparedStatement"
+
+
+@pytest.mark.pandas
+@pytest.mark.parametrize(
+    "method, callback_params, import_params, match",
+    [
+        pytest.param("insert", None, None, "Unsupported import method", id="method"),
+        pytest.param(
+            "prepared", {"sep": ";"}, None, "does not support", id="callback_params"
+        ),
+        pytest.param(
+            "prepared", None, {"skip": 1}, "does not support", id="import_params"
+        ),
+    ],
+)
+def test_import_from_pandas_invalid_arguments(
+    mock_exaconnection_factory, method, callback_params, import_params, match
+):
+    connection = mock_exaconnection_factory()
+
+    with pytest.raises(ValueError, match=match):
+        connection.import_from_pandas(
+            pd.DataFrame({"ID": [0]}),
+            "T",
+            callback_params=callback_params,
+            import_params=import_params,
+            method=method,
+        )
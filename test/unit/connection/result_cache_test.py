@@ -0,0 +1,171 @@
+from unittest.mock import (
+    MagicMock,
+    patch,
+)
+
+import pytest
+
+from pyexasol import (
+    ExaCachedStatement,
+    ExaConnection,
+    ExaResultCache,
+)
+
+QUERY = "SELECT ID, NAME FROM T"
+
+
+class CachedExaConnection(ExaConnection):
+    cls_statement = ExaCachedStatement
+
+
+@pytest.fixture
+def result_cache():
+    return ExaResultCache(max_bytes=1024 * 1024, ttl=60)
+
+
+@pytest.fixture
+def connection(mock_exaconnection_factory, result_cache):
+    connection = mock_exaconnection_factory(
+        connection_class=CachedExaConnection, result_cache=result_cache
+    )
+    connection.attr = {"currentSchema": "S"}
+    return connection
+
+
+class TestExaCachedStatement:
+    @staticmethod
+    def test_result_set_is_served_from_cache(connection, result_cache, exa_response):
+        connection.req = MagicMock(
+            side_effect=[
+                exa_response.result_set(
+                    [[0, 1], ["A", "B"]], num_rows=3, result_set_handle=1
+                ),
+                exa_response.fetch([[2], [None]]),
+                exa_response.empty(),
+            ]
+        )
+        expected = [(0, "A"), (1, "B"), (2, None)]
+
+        assert connection.execute(QUERY).fetchall() == expected
+        assert len(result_cache) == 1
+
+        connection.req = MagicMock()
+        stmt = connection.execute(QUERY)
+
+        connection.req.assert_not_called()
+        assert stmt.is_result_cached
+        assert stmt.rowcount() == 3
+        assert stmt.column_names() == ["ID", "NAME"]
+        assert stmt.fetchall() == expected
+        assert (result_cache.hits, result_cache.misses) == (1, 1)
+
+    @staticmethod
+    def test_partially_fetched_result_set_is_not_cached(
+        connection, result_cache, exa_response
+    ):
+        connection.req = MagicMock(
+            return_value=exa_response.result_set(
+                [[0, 1], ["A", "B"]], num_rows=3, result_set_handle=1
+            )
+        )
+
+        connection.execute(QUERY).fetchone()
+
+        assert len(result_cache) == 0
+
+    @staticmethod
+    def test_current_schema_is_part_of_key(connection, result_cache, exa_response):
+        connection.req = MagicMock(return_value=exa_response.result_set([[0], ["A"]]))
+        connection.execute(QUERY)
+
+        connection.attr = {"currentSchema": "OTHER"}
+        connection.execute(QUERY)
+
+        assert connection.req.call_count == 2
+        assert len(result_cache) == 2
+
+    @staticmethod
+    def test_dml_is_not_cached(connection, result_cache, exa_response):
+        connection.req = MagicMock(return_value=exa_response.row_count(1))
+
+        connection.execute("DELETE FROM T")
+        connection.execute("DELETE FROM T")
+
+        assert connection.req.call_count == 2
+        assert len(result_cache) == 0
+
+
+class TestExaResultCache:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "query, expected",
+        [
+            ("SELECT 1", True),
+            ("with t AS (SELECT 1) SELECT * FROM t", True),
+            ("/* comment */ -- line\n SELECT 1", True),
+            ("INSERT INTO T SELECT 1", False),
+            ("SELECTED", False),
+        ],
+    )
+    def test_get_key_of_read_only_query(query, expected):
+        connection = MagicMock(options={"dsn": "localhost", "user": "sys"}, attr={})
+
+        assert (ExaResultCache.get_key(connection, query) is not None) == expected
+
+    @staticmethod
+    def test_evicts_least_recently_used_entry(exa_response):
+        cache = ExaResultCache(max_entries=2)
+        cache.put(("Q1",), exa_response.ID_NAME_COLUMNS, 0, [b"1"])
+        cache.put(("Q2",), exa_response.ID_NAME_COLUMNS, 0, [b"2"])
+        cache.get(("Q1",))
+        cache.put(("Q3",), exa_response.ID_NAME_COLUMNS, 0, [b"3"])
+
+        assert cache.get(("Q1",)) is not None
+        assert cache.get(("Q2",)) is None
+
+    @staticmethod
+    def test_evicts_entries_over_max_bytes(exa_response):
+        cache = ExaResultCache(max_bytes=10)
+        cache.put(("Q1",), exa_response.ID_NAME_COLUMNS, 0, [b"x" * 6])
+        cache.put(("Q2",), exa_response.ID_NAME_COLUMNS, 0, [b"x" * 6])
+        cache.put(("Q3",), exa_response.ID_NAME_COLUMNS, 0, [b"x" * 11])
+
+        assert len(cache) == 1
+        assert cache.size == 6
+        assert cache.get(("Q2",)) is not None
+
+    @staticmethod
+    def test_expired_entry_is_removed(exa_response):
+        cache = ExaResultCache(ttl=10)
+
+        with patch("pyexasol.result_cache.time.monotonic", return_value=100):
+            cache.put(("Q1",), exa_response.ID_NAME_COLUMNS, 0, [b"1"])
+        with patch("pyexasol.result_cache.time.monotonic", return_value=111):
+            assert cache.get(("Q1",)) is None
+
+        assert cache.size == 0
+
+    @staticmethod
+    def test_invalidate_table(exa_response):
+        cache = ExaResultCache()
+        cache.put(("SELECT * FROM S.USERS",), exa_response.ID_NAME_COLUMNS, 0, [b"1"])
+        cache.put(
+            ('SELECT * FROM "USERS_HISTORY"',), exa_response.ID_NAME_COLUMNS, 0, [b"2"]
+        )
+        cache.put(("SELECT * FROM ORDERS",), exa_response.ID_NAME_COLUMNS, 0, [b"3"])
+
+        cache.invalidate("s.users")
+
+        assert cache.get(("SELECT * FROM S.USERS",)) is None
+        assert cache.get(('SELECT * FROM "USERS_HISTORY"',)) is not None
+        assert cache.get(("SELECT * FROM ORDERS",)) is not None
+
+        cache.invalidate()
+
+        assert len(cache) == 0
+        assert cache.size == 0
+
+    @staticmethod
+    def test_invalid_arguments():
+        with pytest.raises(ValueError, match="must be positive numbers"):
+            ExaResultCache(ttl=0)
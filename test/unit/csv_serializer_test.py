@@ -0,0 +1,97 @@
+import csv
+import datetime
+import decimal
+import io
+
+import pytest
+
+from pyexasol._csv_serializer import (
+    format_value,
+    serialize_rows,
+)
+
+
+class IterableRow:
+    """Row implementing __iter__, but not __len__"""
+
+    def __init__(self, *values):
+        self.values = values
+
+    def __iter__(self):
+        return iter(self.values)
+
+
+def csv_writer_output(rows) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n", quoting=csv.QUOTE_NONNUMERIC)
+    for row in rows:
+        writer.writerow(row)
+    return buffer.getvalue()
+
+
+def serialize(rows, block_size=3) -> str:
+    return b"".join(serialize_rows(rows, block_size=block_size)).decode("utf-8")
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        pytest.param(None, '""', id="none"),
+        pytest.param(1, "1", id="int"),
+        pytest.param(True, "True", id="bool"),
+        pytest.param(1.5, "1.5", id="float"),
+        pytest.param(decimal.Decimal("1.10"), "1.10", id="decimal"),
+        pytest.param("a", '"a"', id="str"),
+        pytest.param('a"b', '"a""b"', id="str_with_quote"),
+        pytest.param(datetime.date(2018, 1, 1), '"2018-01-01"', id="date"),
+        pytest.param(
+            datetime.datetime(2018, 1, 1, 10, 0, 0),
+            '"2018-01-01 10:00:00"',
+            id="datetime",
+        ),
+    ],
+)
+def test_format_value(value, expected):
+    assert format_value(value) == expected
+
+
+@pytest.mark.parametrize(
+    "rows",
+    [
+        pytest.param([], id="no_rows"),
+        pytest.param([(1, "Bob", False, "2018-01-01")], id="single_row"),
+        pytest.param(
+            [(i, f"name {i}", i * 0.5, None) for i in range(10)],
+            id="homogeneous_columns",
+        ),
+        pytest.param(
+            [(1, None), (None, "a"), (2.5, decimal.Decimal("3.00")), ("b", 4)],
+            id="mixed_columns",
+        ),
+        pytest.param([("x\x00y", 'q"uote'), ("", "new\nline")], id="special_strings"),
+        pytest.param(
+            [(datetime.date(2020, 1, 2),), (datetime.datetime(2020, 1, 2, 3, 4, 5),)],
+            id="dates",
+        ),
+        pytest.param([(1, 2), (3,), (), ("a", "b", "c")], id="ragged_rows"),
+        pytest.param([[1, "a"], IterableRow(2, "b")], id="row_without_len"),
+        pytest.param([[""], [None]], id="single_empty_field"),
+    ],
+)
+def test_output_matches_csv_writer(rows):
+    assert serialize(rows) == csv_writer_output(rows)
+
+
+def test_yields_one_buffer_per_block():
+    rows = [(i,) for i in range(7)]
+
+    assert list(serialize_rows(rows, block_size=3)) == [
+        b"0\n1\n2\n",
+        b"3\n4\n5\n",
+        b"6\n",
+    ]
+
+
+def test_invalid_block_size_raises_exception():
+    with pytest.raises(ValueError, match="Block size must be a positive integer"):
+        list(serialize_rows([(1,)], block_size=0))
@@ -0,0 +1,134 @@
+import decimal
+from types import SimpleNamespace
+
+import pytest
+
+from pyexasol import ExaFormatter
+from pyexasol.formatter import _compile_template
+
+
+class StdlibExaFormatter(ExaFormatter):
+    """
+    Customized hook disables compiled templates, so string.Formatter is used
+    """
+
+    def convert_field(self, value, conversion):
+        return super().convert_field(value, conversion)
+
+
+def _formatter(cls=ExaFormatter):
+    return cls(
+        SimpleNamespace(options={"quote_ident": False, "format_max_list_size": None})
+    )
+
+
+@pytest.fixture
+def formatter():
+    return _formatter()
+
+
+def test_compiled_templates_are_disabled_by_custom_hooks(formatter):
+    assert formatter.is_compiled
+    assert not _formatter(StdlibExaFormatter).is_compiled
+
+
+@pytest.mark.parametrize(
+    "template, args, kwargs",
+    [
+        (
+            "SELECT * FROM {t!i} WHERE id IN ({ids!d}) AND name={name} {{x}} {raw!r}",
+            (),
+            {"t": "T", "ids": [1, 2, 3], "name": "O'x", "raw": "--"},
+        ),
+        ("{} {} {}", (1, "a", None), {}),
+        ("{0} {1!d} {0}", ("a", 5), {}),
+        ("{a[0]} {b.x!r}", (), {"a": ["q"], "b": SimpleNamespace(x=3)}),
+        ("{x!q} {y!f}", (), {"x": ("s", 't"'), "y": 1.5}),
+        ("no placeholders", (), {}),
+    ],
+)
+def test_same_result_as_string_formatter(formatter, template, args, kwargs):
+    expected = _formatter(StdlibExaFormatter).format(template, *args, **kwargs)
+    assert formatter.format(template, *args, **kwargs) == expected
+
+
+@pytest.mark.parametrize(
+    "template, args, kwargs, exception",
+    [
+        ("{a:10}", (), {"a": 1}, ValueError),
+        ("{a!z}", (), {"a": 1}, ValueError),
+        ("{a}", (), {"a": []}, ValueError),
+        ("{} {0}", (1,), {}, ValueError),
+        ("{0} {}", (1, 2), {}, ValueError),
+        ("{a}", (), {}, KeyError),
+        ("{1}", (1,), {}, IndexError),
+    ],
+)
+@pytest.mark.parametrize("cls", [ExaFormatter, StdlibExaFormatter])
+def test_errors(cls, template, args, kwargs, exception):
+    with pytest.raises(exception):
+        _formatter(cls).format(template, *args, **kwargs)
+
+
+def test_template_is_compiled_once(formatter):
+    template = "SELECT {value} FROM DUAL -- test_template_is_compiled_once"
+    formatter.format(template, value=1)
+    hits = _compile_template.cache_info().hits
+
+    assert (
+        formatter.format(template, value=2)
+        == "SELECT '2' FROM DUAL -- test_template_is_compiled_once"
+    )
+    assert _compile_template.cache_info().hits == hits + 1
+
+
+@pytest.mark.parametrize(
+    "template, values, expected",
+    [
+        ("{v!d}", [1, -2, 30], "1, -2, 30"),
+        ("{v!d}", [1, decimal.Decimal("-2.50")], "1, -2.50"),
+        ("{v!d}", [1, None], "1, NULL"),
+        ("{v!f}", [1.5, 2, -0.25], "1.5, 2, -0.25"),
+        ("{v}", ["a", "b"], "'a', 'b'"),
+        ("{v}", ["O'x", "', '", "b"], "'O''x', ''', ''', 'b'"),
+        ("{v}", ["a", None, 1], "'a', NULL, '1'"),
+    ],
+)
+def test_list(formatter, template, values, expected):
+    assert formatter.format(template, v=values) == expected
+
+
+@pytest.mark.parametrize(
+    "conversion, values",
+    [
+        ("d", [1, True]),
+        ("d", [1, decimal.Decimal("NaN")]),
+        ("d", [1, decimal.Decimal("1E+5")]),
+        ("d", [1, "2, 3"]),
+        ("f", [1.5, float("inf")]),
+        ("f", [1.5, 1e-05]),
+    ],
+)
+def test_list_with_unsafe_value(formatter, conversion, values):
+    with pytest.raises(ValueError, match="is not a safe"):
+        formatter.format(f"{{v!{conversion}}}", v=values)
+
+
+def test_list_with_custom_converter():
+    class UpperExaFormatter(ExaFormatter):
+        @classmethod
+        def quote(cls, val):
+            return super().quote(str(val).upper())
+
+    assert _formatter(UpperExaFormatter).format("{v}", v=["a", "b"]) == "'A', 'B'"
+
+
+def test_max_list_size():
+    formatter = ExaFormatter(
+        SimpleNamespace(options={"quote_ident": False, "format_max_list_size": 2})
+    )
+
+    assert formatter.format("{v!d}", v=[1, 2]) == "1, 2"
+
+    with pytest.raises(ValueError, match="maximum is 2"):
+        formatter.format("{v!d}", v=[1, 2, 3])
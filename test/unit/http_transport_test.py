@@ -1,4 +1,12 @@
+import contextlib
+import gzip
+import io
+import os
+import socket
+import threading
+import time
 from unittest.mock import (
+    ANY,
     Mock,
     patch,
 )
@@ -11,8 +19,14 @@ from pyexasol import (
     ExaFormatter,
 )
 from pyexasol.http_transport import (
+    ExaHttpRequestHandler,
     ExaHttpThread,
+    ExaHttpThreadPool,
+    ExaHttpTransportStats,
     ExaHTTPTransportWrapper,
+    ExaSQLExportThread,
+    ExaTCPServer,
+    ExaTokenBucket,
     ExportQuery,
     ImportQuery,
     SqlQuery,
@@ -436,3 +450,442 @@ class TestExaHTTPTransportWrapper:
             http_transport_wrapper_with_mocks.import_from_callback(
                 callback="string", src=None
             )
+
+
+@pytest.fixture
+def socket_pair():
+    handler_socket, peer_socket = socket.socketpair()
+    yield handler_socket, peer_socket
+    handler_socket.close()
+    peer_socket.close()
+
+
+@pytest.fixture
+def tcp_server_factory():
+    servers = []
+
+    def _tcp_server_factory(**kwargs) -> ExaTCPServer:
+        # Do not connect to Exasol
+        server = ExaTCPServer(
+            ("127.0.0.1", 0), ExaHttpRequestHandler, bind_and_activate=False, **kwargs
+        )
+        servers.append(server)
+        return server
+
+    yield _tcp_server_factory
+
+    for server in servers:
+        server.read_pipe.close()
+        server.write_pipe.close()
+        server.server_close()
+
+
+@pytest.fixture
+def request_handler(socket_pair, tcp_server_factory):
+    handler_socket, _ = socket_pair
+
+    # Only set up streams, do not handle a request
+    handler = ExaHttpRequestHandler.__new__(ExaHttpRequestHandler)
+    handler.request = handler_socket
+    handler.server = tcp_server_factory()
+    handler.setup()
+    yield handler
+    handler.finish()
+
+
+@contextlib.contextmanager
+def discard_pipe_output(server: ExaTCPServer):
+    # Original pipe is closed, so the file descriptor does not leak
+    server.write_pipe.close()
+
+    with open(os.devnull, "wb", 0) as write_pipe:
+        server.write_pipe = write_pipe
+        yield
+
+
+def receive_all(sock: socket.socket, received: list):
+    with sock.makefile("rb") as reader:
+        received.append(reader.read())
+
+
+class TestExaHttpRequestHandler:
+    @staticmethod
+    def test_write_chunk(request_handler, socket_pair):
+        _, peer_socket = socket_pair
+        data = bytes(range(256)) * 4096
+
+        received: list[bytes] = []
+        reader = threading.Thread(target=receive_all, args=(peer_socket, received))
+        reader.start()
+
+        request_handler.write_chunk(memoryview(data)[:1000])
+        request_handler.write_chunk(b"")
+        request_handler.write_chunk(data)
+        request_handler.connection.shutdown(socket.SHUT_WR)
+        reader.join()
+
+        assert received == [
+            b"3E8\r\n" + data[:1000] + b"\r\n" + b"100000\r\n" + data + b"\r\n"
+        ]
+
+    @staticmethod
+    def test_read_chunks(request_handler, socket_pair):
+        _, peer_socket = socket_pair
+        data = bytes(range(256)) * 512
+
+        sender = threading.Thread(
+            target=peer_socket.sendall,
+            args=(b"5\r\nhello\r\n20000\r\n" + data + b"\r\n0\r\n\r\n",),
+        )
+        sender.start()
+
+        assert request_handler.read_chunk() == b"hello"
+        assert request_handler.read_chunk() == data
+        assert request_handler.read_chunk() is None
+        sender.join()
+
+    @staticmethod
+    def test_read_chunk_with_invalid_delimiter(request_handler, socket_pair):
+        _, peer_socket = socket_pair
+        peer_socket.sendall(b"5\r\nhello!!")
+
+        with pytest.raises(RuntimeError, match="Invalid chunk delimiter"):
+            request_handler.read_chunk()
+
+    @staticmethod
+    def test_read_chunk_from_truncated_stream(request_handler, socket_pair):
+        _, peer_socket = socket_pair
+        peer_socket.sendall(b"5\r\nhel")
+        peer_socket.shutdown(socket.SHUT_WR)
+
+        with pytest.raises(RuntimeError, match="Invalid chunk delimiter"):
+            request_handler.read_chunk()
+
+
+def decode_chunked_body(response: bytes) -> bytes:
+    headers, body = response.split(b"\r\n\r\n", 1)
+    assert b"Transfer-Encoding: chunked" in headers
+
+    data = io.BytesIO()
+    while True:
+        hex_length, body = body.split(b"\r\n", 1)
+        chunk_len = int(hex_length, 16)
+        if chunk_len == 0:
+            return data.getvalue()
+        data.write(body[:chunk_len])
+        body = body[chunk_len + 2 :]
+
+
+class TestExaHttpRequestHandlerCompression:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "compression_threads",
+        [pytest.param(1, id="inline"), pytest.param(3, id="parallel")],
+    )
+    @pytest.mark.parametrize(
+        "data",
+        [
+            pytest.param(b"", id="empty"),
+            pytest.param(os.urandom(1000) * 2000, id="multiple_blocks"),
+        ],
+    )
+    def test_get_compressed(
+        request_handler,
+        socket_pair,
+        tcp_server_factory,
+        compression_threads,
+        data,
+    ):
+        _, peer_socket = socket_pair
+
+        request_handler.compression_block_size = 300_000
+        request_handler.server = tcp_server_factory(
+            compression=True,
+            compression_level=1,
+            compression_threads=compression_threads,
+        )
+        request_handler.server.read_pipe.close()
+        request_handler.server.read_pipe = io.BytesIO(data)
+        request_handler.server.can_finish_get.set()
+
+        received: list[bytes] = []
+        reader = threading.Thread(target=receive_all, args=(peer_socket, received))
+        reader.start()
+
+        request_handler.method_get_compressed()
+        request_handler.connection.shutdown(socket.SHUT_WR)
+        reader.join()
+
+        assert gzip.decompress(decode_chunked_body(received[0])) == data
+
+
+class TestExaHttpTransportStats:
+    @staticmethod
+    def test_compression_ratio():
+        assert ExaHttpTransportStats().compression_ratio is None
+        assert (
+            ExaHttpTransportStats(wire_bytes=10, data_bytes=40).compression_ratio == 4
+        )
+
+    @staticmethod
+    def test_merge():
+        stats = ExaHttpTransportStats.merge(
+            [
+                ExaHttpTransportStats(
+                    wire_bytes=1, data_bytes=2, chunks=1, time_to_first_byte=0.5
+                ),
+                ExaHttpTransportStats(
+                    wire_bytes=3, data_bytes=4, chunks=2, total_time=2.0
+                ),
+            ]
+        )
+
+        assert (stats.wire_bytes, stats.data_bytes, stats.chunks) == (4, 6, 3)
+        assert stats.time_to_first_byte == 0.5
+        assert stats.total_time == 2.0
+
+    @staticmethod
+    def test_handler_counts_chunks_and_bytes(request_handler, socket_pair):
+        _, peer_socket = socket_pair
+        peer_socket.sendall(b"5\r\nhello\r\n3\r\nabc\r\n0\r\n\r\n")
+
+        with discard_pipe_output(request_handler.server):
+            while (data := request_handler.read_chunk()) is not None:
+                request_handler.write_to_pipe(data)
+
+        stats = request_handler.server.stats
+        assert (stats.wire_bytes, stats.data_bytes, stats.chunks) == (8, 8, 2)
+        assert stats.time_to_first_byte is not None
+        assert stats.socket_wait_time > 0
+
+
+class TestExaTokenBucket:
+    @staticmethod
+    @pytest.mark.parametrize("rate", [0, -1])
+    def test_invalid_rate_raises_exception(rate):
+        with pytest.raises(ValueError, match="Rate must be a positive number"):
+            ExaTokenBucket(rate)
+
+    @staticmethod
+    @patch("pyexasol.http_transport.time.sleep")
+    def test_consume_within_burst_does_not_sleep(mock_sleep):
+        bucket = ExaTokenBucket(1000)
+        bucket.consume(600)
+        bucket.consume(400)
+
+        mock_sleep.assert_not_called()
+
+    @staticmethod
+    @patch("pyexasol.http_transport.time.monotonic", return_value=100.0)
+    @patch("pyexasol.http_transport.time.sleep")
+    def test_consume_over_rate_sleeps(mock_sleep, mock_monotonic):
+        bucket = ExaTokenBucket(1000)
+        bucket.consume(1500)
+
+        mock_sleep.assert_called_once_with(0.5)
+
+
+class TestProgress:
+    @staticmethod
+    def test_progress_is_reported_every_interval(request_handler, tcp_server_factory):
+        progress = Mock()
+        request_handler.server = tcp_server_factory(
+            progress=progress, progress_interval=10
+        )
+
+        with discard_pipe_output(request_handler.server):
+            request_handler.write_to_pipe(b"a,1\nb,2\n")
+            request_handler.write_to_pipe(b"c,3\nd,4\n")
+            request_handler.write_to_pipe(b"e,5\n")
+
+        assert progress.call_count == 1
+        data_bytes, rows, elapsed = progress.call_args.args
+        assert (data_bytes, rows) == (16, 4)
+        assert elapsed >= 0
+
+    @staticmethod
+    def test_progress_error_fails_http_thread(socket_pair, tcp_server_factory):
+        handler_socket, peer_socket = socket_pair
+        error = ValueError("progress failed")
+        server = tcp_server_factory(
+            progress=Mock(side_effect=error), progress_interval=1
+        )
+
+        # Accept the request from socket pair instead of Exasol tunnel
+        server.get_request = Mock(return_value=(handler_socket, ("127.0.0.1", 0)))
+        server.handle_request = server._handle_request_noblock
+
+        http_thread = ExaHttpThread.__new__(ExaHttpThread)
+        http_thread.server = server
+        http_thread.exc = None
+
+        peer_socket.sendall(b"PUT /000.csv HTTP/1.1\r\n\r\n4\r\na,1\n\r\n0\r\n\r\n")
+
+        with discard_pipe_output(server):
+            http_thread.run()
+
+        assert http_thread.exc is error
+        assert peer_socket.recv(1024).startswith(b"HTTP/1.1 500")
+
+    @staticmethod
+    def test_progress_is_not_tracked_by_default(request_handler):
+        with discard_pipe_output(request_handler.server):
+            request_handler.write_to_pipe(b"a,1\n")
+
+        assert request_handler.server.progress_rows == 0
+
+    @staticmethod
+    def test_progress_counts_lines_in_buffer_without_header(
+        request_handler, tcp_server_factory
+    ):
+        progress = Mock()
+        request_handler.server = tcp_server_factory(progress=progress)
+        request_handler.server.progress_header_lines = 1
+        request_handler.server.read_pipe.close()
+
+        r_fd, w_fd = os.pipe()
+        os.write(w_fd, b"ID,NAME\n1,a\n2,b\n3,c\n")
+        os.close(w_fd)
+
+        with open(r_fd, "rb", 0) as read_pipe:
+            request_handler.server.read_pipe = read_pipe
+            block = request_handler.read_block(1024)
+
+        request_handler.server.report_progress()
+
+        assert block == b"ID,NAME\n1,a\n2,b\n3,c\n"
+        assert progress.call_args.args[:2] == (len(block), 3)
+
+    @staticmethod
+    def test_export_with_column_names_sets_header_lines():
+        http_thread = Mock()
+        http_thread.server.progress_header_lines = 0
+
+        sql_thread = ExaSQLExportThread(
+            Mock(), False, "dummy_table", {"with_column_names": True}
+        )
+        sql_thread.set_http_thread(http_thread)
+
+        assert http_thread.server.progress_header_lines == 1
+
+
+@pytest.fixture
+def mock_pool_http_thread():
+    with patch("pyexasol.http_transport.ExaHttpThread") as mock_cls:
+        mock_cls.side_effect = lambda *args, **kwargs: Mock(
+            **{"is_stale.return_value": False}
+        )
+        yield mock_cls
+
+
+def wait_for_fill(pool: ExaHttpThreadPool):
+    # Executor has exactly one worker, tasks are processed in order
+    pool.executor.submit(lambda: None).result()
+
+
+class TestExaHttpThreadPool:
+    @staticmethod
+    @pytest.mark.parametrize("size", [0, -1])
+    def test_invalid_size_raises_exception(size):
+        with pytest.raises(ValueError, match="Pool size must be a positive integer"):
+            ExaHttpThreadPool("127.0.0.1", 8563, size, encryption=True)
+
+    @staticmethod
+    def test_acquire_returns_warm_thread(mock_pool_http_thread):
+        pool = ExaHttpThreadPool(
+            "127.0.0.1", 8563, 2, encryption=True, compression_level=1
+        )
+        wait_for_fill(pool)
+        assert pool.ready.qsize() == 2
+
+        http_thread = pool.acquire(compression=True)
+        wait_for_fill(pool)
+
+        assert http_thread.server.compression is True
+        assert http_thread.server.stats == ExaHttpTransportStats(
+            start_time=http_thread.server.stats.start_time
+        )
+        assert pool.ready.qsize() == 2
+        assert mock_pool_http_thread.call_count == 3
+        mock_pool_http_thread.assert_called_with(
+            "127.0.0.1", 8563, False, True, ssl_context=ANY, compression_level=1
+        )
+        pool.close()
+
+    @staticmethod
+    def test_stale_thread_is_replaced(mock_pool_http_thread):
+        pool = ExaHttpThreadPool("127.0.0.1", 8563, 1, encryption=True)
+        wait_for_fill(pool)
+        stale_thread, _ = pool.ready.get_nowait()
+        stale_thread.is_stale.return_value = True
+        pool.ready.put((stale_thread, time.monotonic()))
+
+        http_thread = pool.acquire(compression=False)
+
+        assert http_thread is not stale_thread
+        stale_thread.close.assert_called_once()
+        pool.close()
+
+    @staticmethod
+    def test_acquire_raises_error_of_thread_creation(mock_pool_http_thread):
+        mock_pool_http_thread.side_effect = ConnectionRefusedError()
+        pool = ExaHttpThreadPool("127.0.0.1", 8563, 1, encryption=True)
+        wait_for_fill(pool)
+
+        with pytest.raises(ConnectionRefusedError):
+            pool.acquire(compression=False)
+        pool.close()
+
+    @staticmethod
+    def test_fill_error_is_logged(mock_pool_http_thread):
+        mock_pool_http_thread.side_effect = ConnectionRefusedError("refused")
+        logger = Mock()
+        pool = ExaHttpThreadPool("127.0.0.1", 8563, 1, encryption=False, logger=logger)
+        wait_for_fill(pool)
+        pool.close()
+
+        logger.warning.assert_called_once()
+        assert "refused" in logger.warning.call_args.args[0]
+
+    @staticmethod
+    def test_close_releases_ready_threads(mock_pool_http_thread):
+        pool = ExaHttpThreadPool("127.0.0.1", 8563, 2, encryption=True)
+        wait_for_fill(pool)
+        ready = [pool.ready.get_nowait() for _ in range(2)]
+        for item in ready:
+            pool.ready.put(item)
+        ready_threads = [http_thread for http_thread, _ in ready]
+
+        pool.close()
+
+        for http_thread in ready_threads:
+            http_thread.close.assert_called_once()
+        with pytest.raises(RuntimeError, match="pool is closed"):
+            pool.acquire(compression=False)
+
+
+class TestAdhocSslContext:
+    @staticmethod
+    @patch.object(ExaTCPServer, "generate_adhoc_ssl_context")
+    def test_context_is_generated_once_per_pool(mock_generate, mock_pool_http_thread):
+        mock_generate.side_effect = lambda: (Mock(), "public_key")
+        for _ in range(2):
+            pool = ExaHttpThreadPool("127.0.0.1", 8563, 2, encryption=True)
+            wait_for_fill(pool)
+            pool.close()
+
+        contexts = [
+            call.kwargs["ssl_context"] for call in mock_pool_http_thread.call_args_list
+        ]
+        assert len(contexts) == 4
+        assert contexts[0] is contexts[1]
+        assert contexts[2] is contexts[3]
+        assert contexts[0] is not contexts[2]
+
+    @staticmethod
+    def test_unencrypted_pool_has_no_context(mock_pool_http_thread):
+        pool = ExaHttpThreadPool("127.0.0.1", 8563, 1, encryption=False)
+        wait_for_fill(pool)
+        pool.close()
+
+        assert mock_pool_http_thread.call_args.kwargs["ssl_context"] is None
@@ -0,0 +1,65 @@
+import datetime
+import decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyexasol._pandas_serializer import (
+    serialize_column,
+    serialize_dataframe,
+)
+
+
+@pytest.mark.pandas
+@pytest.mark.parametrize(
+    "series, expected",
+    [
+        pytest.param(pd.Series([1, 2]), [1, 2], id="int"),
+        pytest.param(pd.Series([1.5, np.nan]), [1.5, None], id="float_with_nan"),
+        pytest.param(pd.Series([True, False]), [True, False], id="bool"),
+        pytest.param(pd.Series([1, None], dtype="Int64"), [1, None], id="nullable_int"),
+        pytest.param(
+            pd.Series([True, None], dtype="boolean"), [True, None], id="nullable_bool"
+        ),
+        pytest.param(pd.Series(["a", None], dtype="string"), ["a", None], id="string"),
+        pytest.param(pd.Series(["a", None]), ["a", None], id="object_str"),
+        pytest.param(
+            pd.Series(pd.Categorical(["a", None])), ["a", None], id="categorical"
+        ),
+        pytest.param(
+            pd.Series([datetime.date(2018, 1, 1), decimal.Decimal("1.10"), np.nan]),
+            ["2018-01-01", "1.10", None],
+            id="object_mixed",
+        ),
+        pytest.param(
+            pd.Series([np.int64(1), np.float64(1.5)], dtype=object),
+            [1, 1.5],
+            id="object_numpy_scalars",
+        ),
+        pytest.param(
+            pd.Series(pd.to_datetime(["2018-01-01 10:00:00.123", None])),
+            ["2018-01-01 10:00:00.123000", None],
+            id="datetime",
+        ),
+    ],
+)
+def test_serialize_column(series, expected):
+    result = serialize_column(series)
+
+    assert result == expected
+    assert [type(value) for value in result] == [type(value) for value in expected]
+
+
+@pytest.mark.pandas
+def test_serialize_dataframe():
+    src = pd.DataFrame({"ID": [1, 2], "NAME": ["a", "b"]})
+
+    assert serialize_dataframe(src) == [[1, 2], ["a", "b"]]
+
+
+@pytest.mark.pandas
+def test_serialize_column_datetime_with_timezone():
+    series = pd.Series(pd.to_datetime(["2018-01-01 10:00:00", None]).tz_localize("CET"))
+
+    assert serialize_column(series) == ["2018-01-01 10:00:00.000000", None]
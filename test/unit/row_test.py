@@ -0,0 +1,105 @@
+import dataclasses
+import pickle
+
+import pytest
+
+from pyexasol.row import (
+    ExaRecord,
+    class_row_factory,
+    get_namedtuple_class,
+    get_record_class,
+    namedtuple_row_factory,
+    record_row_factory,
+)
+
+COL_NAMES = ("USER_ID", "NAME", "COUNT", "_HIDDEN", "COUNT(*)")
+
+
+@pytest.fixture
+def record():
+    return get_record_class(COL_NAMES)((1, "A", 10, True, 5))
+
+
+def test_class_is_cached_by_column_names():
+    assert get_record_class(COL_NAMES) is get_record_class(tuple(COL_NAMES))
+    assert get_record_class(COL_NAMES) is not get_record_class(("USER_ID",))
+
+
+def test_access_by_index_and_name(record):
+    assert record[0] == 1
+    assert record[-1] == 5
+    assert record[1:3] == ("A", 10)
+    assert record["NAME"] == "A"
+    assert record["COUNT(*)"] == 5
+    assert record.get("MISSING", "default") == "default"
+
+    with pytest.raises(KeyError, match="MISSING"):
+        record["MISSING"]
+
+
+def test_access_by_attribute(record):
+    assert record.USER_ID == 1
+    assert record.NAME == "A"
+    # Names clashing with tuple methods or private names are available by key only
+    assert record.count(10) == 1
+    assert not hasattr(record, "_HIDDEN")
+
+
+def test_behaves_like_tuple(record):
+    assert isinstance(record, tuple)
+    assert record == (1, "A", 10, True, 5)
+    assert hash(record) == hash((1, "A", 10, True, 5))
+    assert len(record) == 5
+    assert "A" in record
+
+
+def test_mapping_methods(record):
+    assert record.keys() == COL_NAMES
+    assert record.values() == (1, "A", 10, True, 5)
+    assert dict(record.items()) == record._asdict()
+    assert record._asdict()["NAME"] == "A"
+
+
+def test_no_instance_dict(record):
+    assert not hasattr(record, "__dict__")
+    assert type(record).__basicsize__ == tuple.__basicsize__
+
+
+def test_pickle(record):
+    restored = pickle.loads(pickle.dumps(record))
+
+    assert type(restored) is type(record)
+    assert restored == record
+
+
+def test_repr(record):
+    assert repr(get_record_class(("A", "B"))((1, "x"))) == "ExaRecord(A=1, B='x')"
+    assert isinstance(record, ExaRecord)
+
+
+def test_record_row_factory():
+    assert record_row_factory(COL_NAMES) is get_record_class(COL_NAMES)
+
+
+def test_namedtuple_row_factory():
+    row = namedtuple_row_factory(COL_NAMES)((1, "A", 10, True, 5))
+
+    assert type(row) is get_namedtuple_class(COL_NAMES)
+    assert row == (1, "A", 10, True, 5)
+    assert row.USER_ID == 1
+    assert row._fields == ("USER_ID", "NAME", "COUNT", "_3", "_4")
+
+
+def test_namedtuple_class_is_cached_by_column_names():
+    assert get_namedtuple_class(("A", "B")) is get_namedtuple_class(("A", "B"))
+
+
+def test_class_row_factory():
+    @dataclasses.dataclass
+    class User:
+        user_id: int
+        name: str
+
+    make_row = class_row_factory(User)(("name", "user_id"))
+
+    assert make_row(("A", 1)) == User(user_id=1, name="A")
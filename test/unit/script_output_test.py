@@ -0,0 +1,317 @@
+import gzip
+import json
+import socket
+import sys
+import threading
+
+import pytest
+
+from pyexasol import constant
+from pyexasol.script_output import (
+    ExaScriptOutputDirStorage,
+    ExaScriptOutputDispatcher,
+    ExaScriptOutputIndexedFile,
+    ExaScriptOutputIndexedStorage,
+    ExaScriptOutputSelectorServer,
+)
+
+
+@pytest.fixture
+def server():
+    server = ExaScriptOutputSelectorServer("127.0.0.1")
+    yield server
+    server.close()
+
+
+def connect(server: ExaScriptOutputSelectorServer) -> socket.socket:
+    return socket.create_connection(("127.0.0.1", server.port))
+
+
+def test_script_output_server_writes_file_per_vm(server, tmp_path):
+    server.start_statement(ExaScriptOutputDirStorage(tmp_path))
+
+    vms = [connect(server) for _ in range(3)]
+
+    for idx, vm in enumerate(vms):
+        vm.sendall(f"output of vm {idx}\n".encode())
+
+    for vm in vms:
+        vm.close()
+
+    server.finish_statement()
+
+    assert sorted(path.name for path in tmp_path.glob("*.log")) == [
+        "00001.log",
+        "00002.log",
+        "00003.log",
+    ]
+    assert sorted(path.read_text() for path in tmp_path.glob("*.log")) == [
+        f"output of vm {idx}\n" for idx in range(3)
+    ]
+
+
+def test_script_output_server_is_reused_by_statements(server, tmp_path):
+    for stmt_idx in range(3):
+        output_dir = tmp_path / str(stmt_idx)
+        output_dir.mkdir()
+
+        server.start_statement(ExaScriptOutputDirStorage(output_dir))
+
+        with connect(server) as vm:
+            vm.sendall(f"statement {stmt_idx}".encode())
+
+        server.finish_statement()
+
+        assert (output_dir / "00001.log").read_text() == f"statement {stmt_idx}"
+
+
+def test_script_output_server_without_vms(server, tmp_path):
+    server.start_statement(ExaScriptOutputDirStorage(tmp_path))
+    server.finish_statement()
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_script_output_server_many_vms_single_thread(server, tmp_path):
+    num_threads = threading.active_count()
+    server.start_statement(ExaScriptOutputDirStorage(tmp_path))
+
+    vms = [connect(server) for _ in range(200)]
+
+    for vm in vms:
+        vm.sendall(b"x" * 100)
+
+    assert threading.active_count() == num_threads
+
+    for vm in vms:
+        vm.close()
+
+    server.finish_statement()
+
+    assert len(list(tmp_path.glob("*.log"))) == 200
+    assert all(path.read_bytes() == b"x" * 100 for path in tmp_path.glob("*.log"))
+
+
+def test_script_output_server_abort_closes_connections(server, tmp_path):
+    server.start_statement(ExaScriptOutputDirStorage(tmp_path))
+
+    with connect(server) as vm:
+        vm.sendall(b"partial output")
+        server.abort_statement()
+
+        assert server.connected_clients == 0
+        assert (tmp_path / "00001.log").exists()
+
+
+def test_script_output_server_discards_output_between_statements(server, tmp_path):
+    with connect(server) as vm:
+        vm.sendall(b"unexpected output")
+
+    # Waits for the connection to be accepted and closed
+    server.finish_statement()
+
+    server.start_statement(ExaScriptOutputDirStorage(tmp_path))
+    server.finish_statement()
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_script_output_server_closed(tmp_path):
+    server = ExaScriptOutputSelectorServer("127.0.0.1")
+    server.close()
+
+    assert not server.thread.is_alive()
+
+    with pytest.raises(RuntimeError, match="closed"):
+        server.start_statement(ExaScriptOutputDirStorage(tmp_path))
+
+
+def run_vms(server, storage, payloads):
+    server.start_statement(storage)
+
+    for payload in payloads:
+        with connect(server) as vm:
+            vm.sendall(payload)
+
+    server.finish_statement()
+
+    return storage.close()
+
+
+def test_script_output_server_gzip(server, tmp_path):
+    files = run_vms(
+        server, ExaScriptOutputDirStorage(tmp_path, "gzip"), [b"first\n", b"second\n"]
+    )
+
+    assert [path.name for path in files] == ["00001.log.gz", "00002.log.gz"]
+    assert [gzip.decompress(path.read_bytes()) for path in files] == [
+        b"first\n",
+        b"second\n",
+    ]
+
+
+@pytest.fixture
+def zstd_decompress():
+    try:
+        from compression import zstd
+
+        return zstd.decompress
+    except ImportError:
+        return pytest.importorskip("zstandard").ZstdDecompressor().decompress
+
+
+def test_script_output_server_zstd(server, tmp_path, zstd_decompress):
+    files = run_vms(
+        server, ExaScriptOutputDirStorage(tmp_path, "zstd"), [b"first\n", b"second\n"]
+    )
+
+    assert [path.name for path in files] == ["00001.log.zst", "00002.log.zst"]
+    assert [zstd_decompress(path.read_bytes()) for path in files] == [
+        b"first\n",
+        b"second\n",
+    ]
+
+
+def test_script_output_zstd_unavailable(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "compression", None)
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+
+    with pytest.raises(ImportError, match="requires Python 3.14"):
+        ExaScriptOutputIndexedStorage(tmp_path / "output.udflog", "zstd")
+
+
+def test_script_output_server_max_bytes(server, tmp_path):
+    files = run_vms(
+        server,
+        ExaScriptOutputDirStorage(tmp_path, max_bytes=5),
+        [b"abc", b"abcdefgh"],
+    )
+
+    assert [path.read_bytes() for path in files] == [b"abc", b"abcde"]
+
+
+def test_script_output_unsupported_compression(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported UDF output compression"):
+        ExaScriptOutputDirStorage(tmp_path, "lz4")
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_script_output_server_indexed(server, tmp_path, monkeypatch, compression):
+    monkeypatch.setattr(constant, "UDF_OUTPUT_WRITE_BUFFER_SIZE", 64)
+    payloads = [b"vm %d\n" % idx * 100 for idx in range(3)]
+    path = tmp_path / "output.udflog"
+
+    logs = run_vms(
+        server,
+        ExaScriptOutputIndexedStorage(path, compression, max_bytes=400),
+        payloads,
+    )
+
+    assert list(tmp_path.iterdir()) == [path]
+    assert [log.vm_id for log in logs] == [1, 2, 3]
+    assert [log.read_bytes() for log in logs] == [p[:400] for p in payloads]
+    assert all(log.is_truncated for log in logs)
+
+    indexed_file = ExaScriptOutputIndexedFile(path)
+
+    assert indexed_file.compression == compression
+    assert indexed_file.logs[1].read_text() == payloads[1][:400].decode()
+
+
+def test_script_output_indexed_file_invalid(tmp_path):
+    path = tmp_path / "00001.log"
+    path.write_bytes(b"x" * 100)
+
+    with pytest.raises(ValueError, match="Not an indexed UDF output file"):
+        ExaScriptOutputIndexedFile(path)
+
+
+def collect_output(server, tmp_path, payloads, **dispatcher_options):
+    lines = []
+    dispatcher = ExaScriptOutputDispatcher(
+        lambda vm_id, line: lines.append((vm_id, line)), **dispatcher_options
+    )
+    server.start_statement(ExaScriptOutputDirStorage(tmp_path), dispatcher)
+
+    with connect(server) as vm:
+        for payload in payloads:
+            vm.sendall(payload)
+
+    server.finish_statement()
+    dispatcher.close()
+
+    return lines, dispatcher
+
+
+def test_script_output_dispatcher_lines(server, tmp_path):
+    lines, _ = collect_output(
+        server, tmp_path, [b"first\r\nsec", b"ond\n", b"\nlast without break"]
+    )
+
+    assert lines == [(1, "first"), (1, "second"), (1, ""), (1, "last without break")]
+    assert (tmp_path / "00001.log").read_bytes() == (
+        b"first\r\nsecond\n\nlast without break"
+    )
+
+
+def test_script_output_dispatcher_json(server, tmp_path):
+    lines, _ = collect_output(
+        server,
+        tmp_path,
+        [b'{"progress": 0.5}\nTraceback\n[1, 2]\n'],
+        json_decode=json.loads,
+    )
+
+    assert lines == [(1, {"progress": 0.5}), (1, "Traceback"), (1, [1, 2])]
+
+
+def test_script_output_dispatcher_long_line(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(constant, "UDF_OUTPUT_MAX_LINE_SIZE", 4)
+
+    lines, _ = collect_output(server, tmp_path, [b"abcdef\n"])
+
+    assert "".join(line for _, line in lines) == "abcdef"
+
+
+def test_script_output_dispatcher_bounded_queue(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(constant, "UDF_OUTPUT_QUEUE_SIZE", 1)
+    payload = b"".join(b"line %d\n" % idx for idx in range(1000))
+
+    lines, dispatcher = collect_output(server, tmp_path, [payload])
+
+    assert lines == [(1, f"line {idx}") for idx in range(1000)]
+
+
+def test_script_output_dispatcher_callback_error(tmp_path):
+    def on_output(vm_id, line):
+        raise ValueError(line)
+
+    dispatcher = ExaScriptOutputDispatcher(on_output)
+    dispatcher.put(1, b"first\n")
+    dispatcher.put(1, b"second\n")
+    dispatcher.close()
+
+    assert isinstance(dispatcher.exc, ValueError)
+    assert str(dispatcher.exc) == "first\n"
+
+
+def test_script_output_dispatcher_cancel(monkeypatch):
+    monkeypatch.setattr(constant, "UDF_OUTPUT_QUEUE_SIZE", 1)
+    release = threading.Event()
+    dispatcher = ExaScriptOutputDispatcher(lambda vm_id, line: release.wait())
+
+    # First line is taken by the blocked callback, second line fills the queue
+    dispatcher.put(1, b"first")
+    dispatcher.put(1, b"second")
+
+    put_thread = threading.Thread(target=dispatcher.put, args=(1, b"third"))
+    put_thread.start()
+    dispatcher.cancel()
+    put_thread.join(timeout=5)
+
+    assert not put_thread.is_alive()
+
+    release.set()
+    dispatcher.close()
+
+    assert list(dispatcher.queue) == []
@@ -0,0 +1,114 @@
+import decimal
+
+import pytest
+
+from pyexasol import (
+    ExaResultSpool,
+    exasol_mapper,
+)
+from pyexasol.row import get_record_class
+
+COL_NAMES = ["ID", "NAME", "PRICE", "RATE"]
+COL_TYPES = [
+    {"type": "DECIMAL", "precision": 18, "scale": 0},
+    {"type": "VARCHAR", "size": 100, "characterSet": "UTF8"},
+    {"type": "DOUBLE"},
+    {"type": "DECIMAL", "precision": 9, "scale": 2},
+]
+BLOCKS = [
+    [(1, "a", 1.5, "0.7"), (2, None, 2.5, "0.53")],
+    [(3, "c", None, None)],
+    [(4, "d", 4.5, "1.1"), (5, "e", 5.5, "0.03")],
+]
+ROWS = [row for block in BLOCKS for row in block]
+
+FORMATS = ["pickle", "arrow-ipc"]
+
+
+@pytest.fixture(params=FORMATS)
+def spool(request):
+    with ExaResultSpool(
+        iter(BLOCKS), COL_NAMES, COL_TYPES, format=request.param
+    ) as spool:
+        yield spool
+
+
+class TestExaResultSpool:
+    @staticmethod
+    def test_iterate_multiple_times(spool):
+        assert list(spool) == ROWS
+        assert list(spool) == ROWS
+        assert len(spool) == len(ROWS)
+
+    @staticmethod
+    @pytest.mark.parametrize("idx", [0, 2, 4, -1, -5])
+    def test_random_access(spool, idx):
+        assert spool[idx] == ROWS[idx]
+
+    @staticmethod
+    def test_slice(spool):
+        assert spool[1:4] == ROWS[1:4]
+        assert spool[::-2] == ROWS[::-2]
+
+    @staticmethod
+    @pytest.mark.parametrize("idx", [5, -6])
+    def test_index_out_of_range(spool, idx):
+        with pytest.raises(IndexError):
+            spool[idx]
+
+    @staticmethod
+    def test_temporary_file_is_deleted_on_close(spool):
+        assert spool.path.exists()
+
+        spool.close()
+
+        assert not spool.path.exists()
+        with pytest.raises(ValueError, match="Spool is closed"):
+            spool[0]
+
+    @staticmethod
+    @pytest.mark.parametrize("format", FORMATS)
+    def test_custom_path_is_kept(tmp_path, format):
+        path = tmp_path / "result.spool"
+
+        with ExaResultSpool(iter(BLOCKS), COL_NAMES, COL_TYPES, path, format):
+            pass
+
+        assert path.exists()
+
+    @staticmethod
+    def test_empty_result(tmp_path):
+        with ExaResultSpool(iter([]), COL_NAMES, COL_TYPES) as spool:
+            assert len(spool) == 0
+            assert list(spool) == []
+
+    @staticmethod
+    def test_fetch_mapper_and_fetch_dict():
+        with ExaResultSpool(
+            iter(BLOCKS),
+            COL_NAMES,
+            COL_TYPES,
+            fetch_mapper=exasol_mapper,
+            fetch_dict=True,
+        ) as spool:
+            assert spool[0] == {
+                "ID": 1,
+                "NAME": "a",
+                "PRICE": 1.5,
+                "RATE": decimal.Decimal("0.7"),
+            }
+
+    @staticmethod
+    def test_row_maker():
+        row_maker = get_record_class(tuple(COL_NAMES))
+
+        with ExaResultSpool(
+            iter(BLOCKS), COL_NAMES, COL_TYPES, row_maker=row_maker
+        ) as spool:
+            assert isinstance(spool[0], row_maker)
+            assert spool[0]["NAME"] == "a"
+
+    @staticmethod
+    def test_invalid_format():
+        with pytest.raises(ValueError, match="Unsupported spool format"):
+            ExaResultSpool(iter(BLOCKS), COL_NAMES, COL_TYPES, format="csv")
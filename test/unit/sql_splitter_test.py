@@ -3,6 +3,7 @@ from inspect import cleandoc
 import pytest
 
 from pyexasol._sql_splitter import (
+    iter_sql_script,
     split_sql_script,
     strip_comments,
 )
@@ -183,3 +184,53 @@ def test_split_sql_script_with_exasol_script_bodies(sql, expected):
 )
 def test_strip_comments(sql, expected):
     assert strip_comments(sql) == expected
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        pytest.param("SELECT 'a; b' AS value; SELECT 2", id="single_quote"),
+        pytest.param('SELECT "a"";b" FROM table; SELECT 2', id="double_quote"),
+        pytest.param("SELECT 1 -- a; b\n; SELECT 2", id="line_comment"),
+        pytest.param("SELECT /* a; b */ 1; SELECT 2", id="block_comment"),
+        pytest.param("CREATE TABLE script AS SELECT 1; SELECT 2", id="create_table"),
+        pytest.param(
+            "CREATE OR REPLACE LUA SCRIPT s AS\nx = 1;\n  /  \r\nSELECT 2;",
+            id="script_body",
+        ),
+        pytest.param("CREATE PYTHON3 SCALAR SCRIPT s() AS\n/\n", id="empty_script"),
+    ],
+)
+def test_iter_sql_script_chunks(sql):
+    expected = split_sql_script(sql)
+
+    # Every possible chunk boundary, including inside tokens and terminators
+    for position in range(len(sql) + 1):
+        assert list(iter_sql_script([sql[:position], sql[position:]])) == expected
+
+    assert list(iter_sql_script(iter(sql))) == expected
+
+
+def test_iter_sql_script_file(tmp_path):
+    path = tmp_path / "script.sql"
+    path.write_text("SELECT 1;\nSELECT ';';\n")
+
+    with open(path) as f:
+        assert list(iter_sql_script(f)) == ["SELECT 1", "SELECT ';'"]
+
+
+def test_iter_sql_script_is_lazy():
+    def chunks():
+        yield "SELECT 1; SEL"
+        yield "ECT 2;"
+        raise AssertionError("Last chunk must not be read")
+
+    statements = iter_sql_script(chunks())
+
+    assert next(statements) == "SELECT 1"
+    assert next(statements) == "SELECT 2"
+
+
+def test_iter_sql_script_bytes():
+    with pytest.raises(TypeError, match="str chunks"):
+        list(iter_sql_script([b"SELECT 1"]))